@@ -2,6 +2,8 @@
 import typing
 import sys
 import verification.nn_verification as nn_verif
+import verification.tracing as tracing
+import verification.harvesting as harvesting
 
 # time
 import time
@@ -41,6 +43,11 @@ class SearchAlgorithm:
         self.max_it     = max_it
         self.verbose    = verbose
         self.prop_name  = ""        # The property needed to be verified
+        self.num_workers = 1        # number of worker processes, for the
+                                    # algorithms supporting a parallel mode
+        self.tracer     = None      # oracle-call tracing, off by default
+        self.harvester  = None      # witness harvesting, for the algorithms
+                                    # refining by counterexamples, off by default
         
         ## Statistics
         self.soundness          = False
@@ -67,6 +74,53 @@ class SearchAlgorithm:
         self.refinement_success = True
         self.total_time         = 0
 
+    def set_num_workers(self, num_workers: int) -> None:
+        assert num_workers > 0
+
+        self.num_workers = num_workers
+
+    def set_tracer(self, tracer: tracing.Tracer) -> None:
+        self.tracer = tracer
+
+    def set_harvester(self, harvester: harvesting.WitnessHarvester) -> None:
+        self.harvester = harvester
+
+    ## Oracle
+    def call_oracle(
+            self,
+            bounds,
+            phase:      str = "",
+            coordinate: typing.Union[typing.Tuple[int, int], None] = None
+        ) -> typing.Tuple:
+        """
+            #### Description:
+            Calls the oracle, `self.isSAT(bounds)`. If a tracer is set, the
+            call is recorded together with the `phase` of the algorithm and
+            the `coordinate` under refinement (see `verification.tracing`).
+        """
+        if self.tracer is None: return self.isSAT(bounds)
+
+        self.isSAT.last_source      = nn_verif.source_solver
+        self.isSAT.last_solver_time = 0
+
+        tic                 = time.time()
+        verdict, witness    = self.isSAT(bounds)
+        toc                 = time.time()
+
+        self.tracer.event(
+            self.msg_prefix,
+            phase,
+            coordinate,
+            bounds,
+            verdict,
+            self.isSAT.last_source,
+            self.isSAT.last_solver_time,
+            tic,
+            toc
+        )
+
+        return verdict, witness
+
     ## Accessors
     def get_statistics(self) -> typing.List[typing.Union[bool, int, float]]:
         return [
@@ -79,11 +133,16 @@ class SearchAlgorithm:
     ## Time
     def timer_start(self) -> None:
         self.tic = time.time()
+
+        # the oracle calls are cut at the end of the time budget
+        self.isSAT.set_deadline(self.tic + 60 * self.timeout)
     
     def timer_stop(self) -> None:
         self.toc        = time.time()
         self.total_time = self.toc - self.tic
 
+        self.isSAT.set_deadline(None)
+
     def check_timeout(self) -> bool:
         toc             = time.time()
         elapsed_time    = (toc - self.tic) / 60
@@ -37,6 +37,25 @@ class AlgoComposition(SearchAlgorithm):
         self.algo2.msg_prefix = self.algo2.msg_prefix
     
 
+    def set_num_workers(self, num_workers: int) -> None:
+        super().set_num_workers(num_workers)
+
+        self.algo1.set_num_workers(num_workers)
+        self.algo2.set_num_workers(num_workers)
+
+    def set_tracer(self, tracer) -> None:
+        super().set_tracer(tracer)
+
+        self.algo1.set_tracer(tracer)
+        self.algo2.set_tracer(tracer)
+
+    def set_harvester(self, harvester) -> None:
+        super().set_harvester(harvester)
+
+        self.algo1.set_harvester(harvester)
+        self.algo2.set_harvester(harvester)
+
+
     def algo1_prep(self,
             guarantee: typing.Union[
                 cyclic.CyclicGuarantee,
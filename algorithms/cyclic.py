@@ -9,11 +9,15 @@ from verification.nn_verification import NNVerification
 # custom libraries
 from algorithms.algorithms import SearchAlgorithm
 import guarantees.cyclic as cyclic
+import verification.futures as futures
 
 # python libraries
 import time
 from copy import copy
 
+# 3rd party libraries
+import numpy as np
+
 
 
 class CyclicSearch(SearchAlgorithm):
@@ -41,6 +45,99 @@ class CyclicSearch(SearchAlgorithm):
         raise NotImplementedError
 
 
+    ## Parallel Mode
+    def probe_radii(
+            self,
+            guarantee:  cyclic.CyclicGuarantee,
+            num_probes: int,
+            probes:     typing.Iterable[float] = ()
+        ) -> np.ndarray:
+        """
+            #### Description:
+            Up to `num_probes` equidistant radii strictly inside the widest
+            gap of `[pivot.lb, pivot.ub]`, split by the radii already
+            `probes`d, i.e. the gap is split in `num_probes + 1` parts.
+            Radii closer than `delta` are not probed.
+
+            #### Notes:
+            Without `probes`, this is the k-ary split of the whole bracket.
+
+            #### Output:
+            The radii, in increasing order (empty if no gap can be split).
+        """
+        pivot_lb    = guarantee.pivot.lb[0][0]
+        pivot_ub    = guarantee.pivot.ub[0][0]
+        points      = sorted([pivot_lb, pivot_ub] + [r for r in probes if pivot_lb < r < pivot_ub])
+
+        gaps = np.diff(points)
+        ind  = int(np.argmax(gaps))
+        if num_probes < 1 or gaps[ind] < guarantee.delta: return np.array([])
+
+        num_probes = max(1, min(num_probes, int(gaps[ind] / guarantee.delta) - 1))
+        return np.linspace(points[ind], points[ind + 1], num_probes + 2)[1:-1]
+
+    def speculative_search(
+            self,
+            guarantee:      cyclic.CyclicGuarantee,
+            lower_answer:   bool
+        ) -> None:
+        """
+            #### Description:
+            The k-ary radius search, with `num_workers` radii of
+            `[pivot.lb, pivot.ub]` in flight (see `verification.futures`).
+            It starts with the k-ary split of the bracket (see
+            `probe_radii()`). As soon as a radius is answered, the bracket
+            is updated, the probes left outside of it are cancelled, and
+            the freed workers split the widest gap left.
+            
+            An oracle answer equal to `lower_answer` raises `pivot.lb` to the
+            probed radius, the opposite one lowers `pivot.ub`.
+        """
+        with futures.OraclePool(self.isSAT, self.num_workers) as oracle_pool:
+            in_flight = {}  # OracleFuture -> radius
+
+            while self.num_it < self.max_it:
+                ## Keep the workers busy
+                while len(in_flight) < self.num_workers:
+                    radii = self.probe_radii(guarantee, self.num_workers - len(in_flight), in_flight.values())
+                    if len(radii) == 0: break
+
+                    for radius in radii:
+                        guarantee.set_radius(radius)
+                        in_flight[oracle_pool.submit(guarantee.get_interval())] = radius
+
+                if len(in_flight) == 0: break
+
+                ## First answers
+                for oracle_future in futures.wait_first(in_flight.keys()):
+                    radius      = in_flight.pop(oracle_future)
+                    answer, _   = oracle_future.result()
+
+                    self.num_it += 1
+                    self.progress_message()
+
+                    # the bracket may have moved past the radius
+                    if not (guarantee.pivot.lb[0][0] < radius < guarantee.pivot.ub[0][0]): continue
+
+                    guarantee.set_radius(radius)
+                    if answer == lower_answer:  guarantee.up_pivot()
+                    else:                       guarantee.down_pivot()
+
+                ## Cancel the losers
+                for oracle_future, radius in list(in_flight.items()):
+                    if not (guarantee.pivot.lb[0][0] < radius < guarantee.pivot.ub[0][0]):
+                        oracle_future.cancel()
+                        del in_flight[oracle_future]
+
+                ## if dichotomic search converged, break
+                if not guarantee.dichotomic_invariant(): break
+
+                ## time
+                if self.check_timeout(): break
+
+            oracle_pool.cancel_all(in_flight.keys())
+
+
 
 ###################
 # Top-Down Search #
@@ -88,11 +185,12 @@ class TopDownSearch(CyclicSearch):
         # num_it counts the number of oracle calls
         for self.num_it in range(self.max_it):
             ## Check convergance
-            self.soundness, counterexample = self.isSAT(guarantee.get_interval())
+            self.soundness, counterexample = self.call_oracle(guarantee.get_interval(), "constrain")
             if self.soundness: break
 
             ## Refine the explanation
-            self.refinement_success = guarantee.constrain(counterexample)
+            # an unknown answer (e.g. a solver timeout) has no counterexample
+            self.refinement_success = counterexample is not None and guarantee.constrain(counterexample)
             if not self.refinement_success: break
 
 
@@ -162,7 +260,7 @@ class BottomUpLinearSearch(CyclicSearch):
             if not self.refinement_success: break
 
             ## Check convergance
-            self.soundness, _ = self.isSAT(guarantee.get_interval())
+            self.soundness, _ = self.call_oracle(guarantee.get_interval(), "expand")
             if not self.soundness:
                 # Since we start with the trivial guarantee and expand
                 # the guarantee will always be sound, until a counter
@@ -197,6 +295,20 @@ class BottomUpDichotomicSearch(CyclicSearch):
         * The guarantee passed to the search() method needs to
         have defined an `expand_dichotomic()` method.
         * Primarly used for cyclic guarantees
+
+        #### Parallel Mode:
+        If `num_workers > 1`, the bracket `[pivot.lb, pivot.ub]` is split by
+        `num_workers` radii at once, shrinking it by a factor of
+        `num_workers + 1` (see `probe_radii()`). The radii are in flight
+        together, and each answer updates the bracket as soon as it arrives
+        (see `speculative_search()`). Soundness is monotone in the radius,
+        so:
+            * a sound radius raises `pivot.lb`, and the probes below it
+            are cancelled.
+            * an unsound radius lowers `pivot.ub`, and the probes above it
+            are cancelled.
+        Hence, the `up_pivot()`/`down_pivot()` invariants are kept, as in
+        the sequential mode.
     """
     def __init__(
                     self,
@@ -213,6 +325,18 @@ class BottomUpDichotomicSearch(CyclicSearch):
         self.prop_name  = "Soundness"
     
 
+    def parallel_search(
+            self,
+            guarantee:      cyclic.BottomCyclicGuarantee
+        ) -> None:
+
+        # sound radii raise pivot.lb
+        self.speculative_search(guarantee, True)
+
+        guarantee.make_sound()
+        self.soundness = True and not self.is_timeout
+
+
     def search(
             self,
             guarantee: cyclic.BottomCyclicGuarantee
@@ -220,6 +344,16 @@ class BottomUpDichotomicSearch(CyclicSearch):
         # time
         self.timer_start()
 
+        ## parallel mode
+        if self.num_workers > 1:
+            self.parallel_search(guarantee)
+
+            # time
+            self.timer_stop()
+            self.end_report()
+
+            return guarantee
+
         # main loop
         for it in range(self.max_it):
             ## if dichotomic search converged, break
@@ -235,7 +369,7 @@ class BottomUpDichotomicSearch(CyclicSearch):
             self.progress_message()
 
             ## Check convergance
-            self.soundness, _ = self.isSAT(guarantee.get_interval())
+            self.soundness, _ = self.call_oracle(guarantee.get_interval(), "radius")
             if self.soundness:
                 succ_pivot_refinement = guarantee.up_pivot()
                 if not succ_pivot_refinement: break
@@ -292,6 +426,24 @@ class CompleteBottomUpDichotomicSearch(CyclicSearch):
         self.prop_name  = "Complete"
     
 
+    def parallel_search(
+            self,
+            guarantee:      cyclic.BottomCyclicGuarantee
+        ) -> None:
+        """
+            #### Description:
+            As `BottomUpDichotomicSearch.parallel_search()`. Completeness is
+            monotone *upwards* in the radius, hence complete radii lower
+            `pivot.ub`.
+        """
+
+        # non-complete radii raise pivot.lb
+        self.speculative_search(guarantee, False)
+
+        guarantee.make_complete()
+        self.soundness = True and not self.is_timeout
+
+
     def search(
             self,
             guarantee: cyclic.BottomCyclicGuarantee
@@ -299,6 +451,16 @@ class CompleteBottomUpDichotomicSearch(CyclicSearch):
         # time
         self.timer_start()
 
+        ## parallel mode
+        if self.num_workers > 1:
+            self.parallel_search(guarantee)
+
+            # time
+            self.timer_stop()
+            self.end_report()
+
+            return guarantee
+
         # main loop
         for it in range(self.max_it):
             ## if dichotomic search converged, break
@@ -314,7 +476,7 @@ class CompleteBottomUpDichotomicSearch(CyclicSearch):
             self.progress_message()
 
             ## Check convergance
-            self.completeness, _ = self.isSAT(guarantee.get_interval())
+            self.completeness, _ = self.call_oracle(guarantee.get_interval(), "radius")
             if self.completeness:
                 succ_pivot_refinement = guarantee.down_pivot()
                 if not succ_pivot_refinement: break
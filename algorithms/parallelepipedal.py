@@ -3,6 +3,7 @@
 #############
 # custom libraries
 from algorithms.algorithms import SearchAlgorithm
+import verification.pool as pool
 
 # libraries for typing
 import typing
@@ -13,6 +14,9 @@ import guarantees.parallelepipedal as parallel
 import time
 from copy import copy
 
+# 3rd party libraries
+import numpy as np
+
 
 class ParallelepipedalSearch(SearchAlgorithm):
     """
@@ -52,6 +56,12 @@ class TopDownSearch(ParallelepipedalSearch):
         have defined a constrain() method that takes as input a
         counterexample and returns a refined guarantee that
         excludes the given counterexample.
+
+        #### Witness Harvesting:
+        If a harvester is set (see `verification.harvesting`), each
+        witness is reduced to the coordinates responsible for it, and
+        all of them are cut at once (see `constrain_cuts()`). The plain
+        `constrain()` is the fallback, e.g. for spurious witnesses.
     """
 
     def __init__(
@@ -69,6 +79,22 @@ class TopDownSearch(ParallelepipedalSearch):
         self.prop_name  = "Soundness"
     
 
+    def refine(
+            self,
+            guarantee:      parallel.ParallelepipedalGuarantee,
+            counterexample: np.ndarray
+        ) -> bool:
+        # an unknown answer (e.g. a solver timeout) has no
+        # counterexample to refine by
+        if counterexample is None: return False
+
+        if self.harvester is not None:
+            cuts = self.harvester.harvest(counterexample, guarantee.x_star, guarantee.delta)
+            if guarantee.constrain_cuts(cuts): return True
+
+        return guarantee.constrain(counterexample)
+
+
     def search(
             self,
             guarantee: typing.Union[
@@ -83,11 +109,11 @@ class TopDownSearch(ParallelepipedalSearch):
         # num_it counts the number of oracle calls
         for self.num_it in range(self.max_it):
             ## Check convergance
-            self.soundness, counterexample = self.isSAT(guarantee.get_interval())
+            self.soundness, counterexample = self.call_oracle(guarantee.get_interval(), "constrain")
             if self.soundness: break
 
             ## Refine the explanation
-            self.refinement_success = guarantee.constrain(counterexample)
+            self.refinement_success = self.refine(guarantee, counterexample)
             if not self.refinement_success: break
 
             ## Reporting
@@ -152,11 +178,11 @@ class CompleteBottomUpSearch(ParallelepipedalSearch):
         # num_it counts the number of oracle calls
         for self.num_it in range(self.max_it):
             ## Check convergance
-            self.completeness, witness = self.isSAT(guarantee.get_interval())
+            self.completeness, witness = self.call_oracle(guarantee.get_interval(), "generalize")
             if self.completeness: break
 
             ## Refine the explanation
-            self.refinement_success = guarantee.generalize(witness)
+            self.refinement_success = witness is not None and guarantee.generalize(witness)
             if not self.refinement_success: break
 
             ## Reporting
@@ -240,7 +266,7 @@ class BottomUpLinearDFS(ParallelepipedalSearch):
                     self.progress_message()
 
                     ## Check convergance
-                    self.soundness, _ = self.isSAT(guarantee.get_interval())
+                    self.soundness, _ = self.call_oracle(guarantee.get_interval(), "ub", (i, j))
                     if not self.soundness:
                         # Since we start with the trivial explanation and expand
                         # the explanation will always be sound, until a counter
@@ -273,7 +299,7 @@ class BottomUpLinearDFS(ParallelepipedalSearch):
                         self.progress_message()
 
                         ## Check convergance
-                        self.soundness, _ = self.isSAT(guarantee.get_interval())
+                        self.soundness, _ = self.call_oracle(guarantee.get_interval(), "lb", (i, j))
                         if not self.soundness:
                             # Since we start with the trivial explanation and expand
                             # the explanation will always be sound, until a counter
@@ -300,6 +326,206 @@ class BottomUpLinearDFS(ParallelepipedalSearch):
     
 
 
+class BottomUpGroupDFS(ParallelepipedalSearch):
+    """
+        #### Description:
+        * A search algorithm implementing a bottom up search in
+        the space of guarantees, as *adaptive group testing*.
+        * Expanding blocks of features at the time: each round expands
+        all the active features by `delta` with a single oracle call. If
+        the expansion is unsound, it is reverted and the block is split in
+        two halves, which are tested recursively. A single feature whose
+        expansion is unsound is deactivated, as in `BottomUpLinearDFS`.
+        * The guarantee passed to the search() method needs to
+        have defined the following methods:
+            * `expand_ub(i, j)`
+            * `expand_lb(i, j)`
+            * `revert_expand_ub(i, j)`
+            * `revert_expand_lb(i, j)`
+
+        #### Notes:
+        * For `n` features, of which `k` cannot be expanded, a round costs
+        `O(k log(n))` oracle calls, instead of the `n` calls of the linear
+        search.
+        * `max_it` bounds the number of rounds, i.e. each feature is
+        expanded by at most `max_it * delta`.
+        * By monotonicity, a feature that is deactivated stays unsound
+        for every larger guarantee. Hence, the final guarantee is maximal
+        w.r.t. `delta`, as the one of `BottomUpLinearDFS`.
+    """
+
+    def __init__(
+                    self,
+                    isSAT,
+                    max_it = 100,   # max number of rounds
+                    timeout = 60,
+                    verbose = False
+                ):
+        
+        super().__init__(isSAT, max_it, timeout, verbose)
+
+        ## Reporting
+        self.msg_prefix = "Bottom-Up Group DFS"
+        self.prop_name  = "Soundness"
+
+
+    def group_expand(
+            self,
+            guarantee:  parallel.ParallelepipedalGuarantee,
+            block:      typing.List[typing.Tuple[int, int]],
+            expand:     typing.Callable[[int, int], bool],
+            revert:     typing.Callable[[int, int], None],
+            phase:      str
+        ) -> typing.List[typing.Tuple[int, int]]:
+        """
+            #### Description:
+            Expands the features of `block` together, splitting the block
+            recursively on unsound expansions.
+
+            #### Output:
+            The features that were expanded, i.e. the ones that remain
+            active. The guarantee remains sound.
+        """
+        expanded = [(i, j) for (i, j) in block if expand(i, j)]
+        if expanded == [] or self.is_timeout: 
+            for (i, j) in expanded: revert(i, j)
+            return []
+
+        ## Reporting
+        self.num_it += 1
+        self.progress_message()
+
+        ## Check convergance
+        self.soundness, _ = self.call_oracle(guarantee.get_interval(), phase)
+        self.check_timeout()
+        if self.soundness: return expanded
+
+        # the guarantee was sound before the expansion
+        self.soundness = True
+        for (i, j) in expanded: revert(i, j)
+        if len(expanded) == 1: return []
+
+        ## Split the block
+        half = len(expanded) // 2
+
+        return  self.group_expand(guarantee, expanded[:half], expand, revert, phase) +\
+                self.group_expand(guarantee, expanded[half:], expand, revert, phase)
+
+
+    def search(
+            self,
+            guarantee: typing.Union[
+                parallel.BottomParallelGurantee,
+                parallel.BottomDistParallelGurantee
+            ]
+        ) -> parallel.ParallelepipedalGuarantee:
+        # time
+        self.timer_start()
+
+        # expand *upper bound*, then *lower bound*
+        for phase, expand, revert in [
+                ("ub", guarantee.expand_ub, guarantee.revert_expand_ub),
+                ("lb", guarantee.expand_lb, guarantee.revert_expand_lb)
+            ]:
+            active = [
+                    (i, j)  for i in range(guarantee.row_dim)
+                            for j in range(guarantee.column_dim)
+                ]
+
+            for it in range(self.max_it):
+                if active == [] or self.is_timeout: break
+
+                active = self.group_expand(guarantee, active, expand, revert, phase)
+
+        # time
+        self.timer_stop()
+
+        ## Warning
+        self.end_report()
+
+        # return value
+        return guarantee
+
+
+
+###############################################
+# Workers of the Parallel Bottom-Up Dich. DFS #
+###############################################
+# Each worker runs the dichotomic search for a chunk of the
+# coordinates, *independently*. Namely, every coordinate is
+# searched against the same frozen snapshot, i.e. after a
+# coordinate is searched, it is reset to its snapshot value.
+# The workers return the final pivots of each coordinate.
+
+def _dichotomic_ub_task(
+        isSAT:          NNVerification,
+        snapshot:       parallel.ParallelepipedalGuarantee,
+        coordinates:    typing.List[typing.Tuple[int, int]],
+        max_it:         int,
+        deadline:       float
+    ) -> typing.Tuple[typing.List[typing.Tuple[typing.Tuple[int, int], float, float]], int]:
+
+    guarantee   = copy(snapshot)
+    pivots      = []
+    num_it      = 0
+    for (i, j) in coordinates:
+        if time.time() > deadline: break
+
+        for it in range(max_it):
+            if not guarantee.high_dichotomic_invariant(i, j): break
+            if not guarantee.expand_dichotomic_ub(i, j): break
+
+            num_it += 1
+            soundness, _ = isSAT(guarantee.get_interval())
+            if soundness:   succ_pivot_refinement = guarantee.up_high_pivot(i, j)
+            else:           succ_pivot_refinement = guarantee.down_high_pivot(i, j)
+            if not succ_pivot_refinement: break
+
+            if time.time() > deadline: break
+        
+        pivots.append(((i, j), guarantee.high_pivot.lb[i][j], guarantee.high_pivot.ub[i][j]))
+
+        ## reset the coordinate to the frozen snapshot
+        guarantee.ub[i][j] = snapshot.ub[i][j]
+    
+    return pivots, num_it
+
+
+def _dichotomic_lb_task(
+        isSAT:          NNVerification,
+        snapshot:       parallel.ParallelepipedalGuarantee,
+        coordinates:    typing.List[typing.Tuple[int, int]],
+        max_it:         int,
+        deadline:       float
+    ) -> typing.Tuple[typing.List[typing.Tuple[typing.Tuple[int, int], float, float]], int]:
+
+    guarantee   = copy(snapshot)
+    pivots      = []
+    num_it      = 0
+    for (i, j) in coordinates:
+        if time.time() > deadline: break
+
+        for it in range(max_it):
+            if not guarantee.low_dichotomic_invariant(i, j): break
+            if not guarantee.expand_dichotomic_lb(i, j): break
+
+            num_it += 1
+            soundness, _ = isSAT(guarantee.get_interval())
+            if soundness:   succ_pivot_refinement = guarantee.down_low_pivot(i, j)
+            else:           succ_pivot_refinement = guarantee.up_low_pivot(i, j)
+            if not succ_pivot_refinement: break
+
+            if time.time() > deadline: break
+        
+        pivots.append(((i, j), guarantee.low_pivot.lb[i][j], guarantee.low_pivot.ub[i][j]))
+
+        ## reset the coordinate to the frozen snapshot
+        guarantee.lb[i][j] = snapshot.lb[i][j]
+    
+    return pivots, num_it
+
+
+
 class BottomUpDichotomicDFS(ParallelepipedalSearch):
     """
         * A search algorithm implementing a bottom up dichotomic search in
@@ -313,6 +539,21 @@ class BottomUpDichotomicDFS(ParallelepipedalSearch):
             * `down_high_pivot(i, j)`
             * `up_low_pivot(i, j)`
             * `down_low_pivot(i, j)`
+        
+        #### Parallel Mode:
+        If `num_workers > 1`, each pass (first `ub`, then `lb`) begins
+        by splitting the coordinates across a pool of worker processes.
+        Every worker searches its coordinates against a frozen *sound*
+        snapshot of the guarantee. The main process merges the results
+        and re-checks the merged guarantee:
+            * If it is sound, the pass is complete.
+            * Otherwise, we repair the merge (see `repair_merge()`), i.e. we
+            add the workers' chunks back one at a time, bisecting the
+            unsound ones, and run the sequential pass for the coordinates
+            left. Still, the workers' *unsound* pivots remain valid upper
+            limits for each coordinate, so the sequential pass starts from
+            narrower brackets.
+        Hence, the final `[lb, ub]` is sound, as in the sequential mode.
     """
 
     def __init__(
@@ -329,6 +570,160 @@ class BottomUpDichotomicDFS(ParallelepipedalSearch):
         self.msg_prefix = "Bottom-Up Dich. DFS"
         self.prop_name  = "Soundness"
 
+
+    ## Parallel Mode
+    def split_coordinates(
+            self,
+            guarantee: parallel.ParallelepipedalGuarantee
+        ) -> typing.List[typing.List[typing.Tuple[int, int]]]:
+        
+        coordinates = [
+                (i, j)  for i in range(guarantee.row_dim)
+                        for j in range(guarantee.column_dim)
+            ]
+        
+        return [coordinates[k::self.num_workers] for k in range(self.num_workers)]
+
+
+    def repair_merge(
+            self,
+            guarantee:  parallel.ParallelepipedalGuarantee,
+            snapshot:   parallel.ParallelepipedalGuarantee,
+            chunks:     typing.List[typing.List[typing.Tuple[int, int]]],
+            is_ub:      bool
+        ) -> None:
+        """
+            #### Description:
+            Greedy repair of an unsound merge of the `ub` (if `is_ub`) or
+            the `lb` pass. Starting from the sound `snapshot`, the expanded
+            coordinates are added back one chunk at a time, and a chunk is
+            kept iff the guarantee remains sound. An unsound chunk is
+            bisected, down to single coordinates, which keep their snapshot
+            value, but narrow their bracket to the merged value.
+
+            #### Notes:
+            * Each accepted chunk costs one oracle call, and each coordinate
+            in conflict `O(log(chunk size))`, instead of the whole round.
+            * On timeout, the coordinates left keep their snapshot value,
+            i.e. `[lb, ub]` is always sound.
+        """
+        phase = "ub-repair" if is_ub else "lb-repair"
+
+        if is_ub:
+            merged          = guarantee.ub.copy()
+            guarantee.ub    = snapshot.ub
+        else:
+            merged          = guarantee.lb.copy()
+            guarantee.lb    = snapshot.lb
+        snapshot_bound = snapshot.ub.copy() if is_ub else snapshot.lb.copy()
+
+        ## the expanded coordinates of each chunk, as a stack
+        groups = [[ind for ind in chunk if merged[ind] != snapshot_bound[ind]] for chunk in chunks]
+        groups = [group for group in reversed(groups) if len(group) > 0]
+
+        while len(groups) > 0:
+            if self.check_timeout(): break
+
+            group   = groups.pop()
+            ind     = tuple(np.array(group).T)
+
+            if is_ub:   guarantee.ub[ind] = merged[ind]
+            else:       guarantee.lb[ind] = merged[ind]
+
+            self.num_it += 1
+            soundness, _ = self.call_oracle(guarantee.get_interval(), phase)
+
+            ## keep the chunk
+            if soundness:
+                if is_ub:   guarantee.high_pivot.lb[ind]  = merged[ind]
+                else:       guarantee.low_pivot.ub[ind]   = merged[ind]
+                continue
+
+            ## revert the chunk, and bisect it
+            if is_ub:   guarantee.ub[ind] = snapshot_bound[ind]
+            else:       guarantee.lb[ind] = snapshot_bound[ind]
+
+            if len(group) > 1:
+                groups.append(group[len(group) // 2:])
+                groups.append(group[:len(group) // 2])
+
+            # unsound on top of a sound guarantee, which only grows
+            elif is_ub: guarantee.high_pivot.ub[ind]  = merged[ind]
+            else:       guarantee.low_pivot.lb[ind]   = merged[ind]
+
+
+    def parallel_expand_ub(
+            self,
+            guarantee:      parallel.ParallelepipedalGuarantee,
+            verifier_pool:  pool.VerifierPool
+        ) -> None:
+
+        ## Frozen sound snapshot
+        guarantee.make_sound()
+        snapshot = copy(guarantee)
+        deadline = self.tic + 60 * self.timeout
+
+        chunks  = self.split_coordinates(guarantee)
+        results = verifier_pool.map(
+            _dichotomic_ub_task,
+            [(snapshot, chunk, self.max_it, deadline) for chunk in chunks]
+        )
+
+        ## Merge
+        for pivots, num_it in results:
+            self.num_it += num_it
+            for (i, j), pivot_lb, pivot_ub in pivots:
+                guarantee.high_pivot.ub[i][j]   = pivot_ub
+                guarantee.ub[i][j]              = pivot_lb
+        
+        ## Re-check the merged guarantee
+        self.num_it += 1
+        self.soundness, _ = self.call_oracle(guarantee.get_interval(), "ub-merge")
+        if self.soundness:
+            self.print("Parallel ub expansion merged successfully.")
+            guarantee.high_pivot.lb = guarantee.ub.copy()
+        else:
+            self.print("Parallel ub expansion unsound, repairing the merge.")
+            self.repair_merge(guarantee, snapshot, chunks, True)
+            self.soundness = True
+    
+
+    def parallel_expand_lb(
+            self,
+            guarantee:      parallel.ParallelepipedalGuarantee,
+            verifier_pool:  pool.VerifierPool
+        ) -> None:
+
+        ## Frozen sound snapshot
+        guarantee.make_sound()
+        snapshot = copy(guarantee)
+        deadline = self.tic + 60 * self.timeout
+
+        chunks  = self.split_coordinates(guarantee)
+        results = verifier_pool.map(
+            _dichotomic_lb_task,
+            [(snapshot, chunk, self.max_it, deadline) for chunk in chunks]
+        )
+
+        ## Merge
+        for pivots, num_it in results:
+            self.num_it += num_it
+            for (i, j), pivot_lb, pivot_ub in pivots:
+                guarantee.low_pivot.lb[i][j]    = pivot_lb
+                guarantee.lb[i][j]              = pivot_ub
+        
+        ## Re-check the merged guarantee
+        self.num_it += 1
+        self.soundness, _ = self.call_oracle(guarantee.get_interval(), "lb-merge")
+        if self.soundness:
+            self.print("Parallel lb expansion merged successfully.")
+            guarantee.low_pivot.ub = guarantee.lb.copy()
+        else:
+            self.print("Parallel lb expansion unsound, repairing the merge.")
+            self.repair_merge(guarantee, snapshot, chunks, False)
+            self.soundness = True
+
+
     def search(
             self,
             guarantee: typing.Union[
@@ -339,9 +734,19 @@ class BottomUpDichotomicDFS(ParallelepipedalSearch):
         # time
         self.timer_start()
 
+        ## parallel mode
+        verifier_pool = None
+        if self.num_workers > 1:
+            verifier_pool = pool.VerifierPool(self.isSAT, self.num_workers)
+            self.parallel_expand_ub(guarantee, verifier_pool)
+            self.check_timeout()
+
         # main loop
         # expand *upper bound* with dichotomic search
+        # (in parallel mode, only the coordinates the merge did not
+        # settle are still searched)
         for i in range(guarantee.row_dim):
+            if self.is_timeout: break
             for j in range(guarantee.column_dim):
                 for it in range(self.max_it):
                     ## if dichotomic search converged, break
@@ -361,7 +766,7 @@ class BottomUpDichotomicDFS(ParallelepipedalSearch):
                     self.progress_message()
 
                     ## Check convergance
-                    self.soundness, _ = self.isSAT(guarantee.get_interval())
+                    self.soundness, _ = self.call_oracle(guarantee.get_interval(), "ub", (i, j))
                     if self.soundness:
                         self.print_debug(" successful expansion!")
                         succ_pivot_refinement = guarantee.up_high_pivot(i, j)
@@ -379,6 +784,13 @@ class BottomUpDichotomicDFS(ParallelepipedalSearch):
                 
 
 
+        ## parallel mode
+        if verifier_pool is not None and not self.is_timeout:
+            self.parallel_expand_lb(guarantee, verifier_pool)
+            self.check_timeout()
+        
+        if verifier_pool is not None: verifier_pool.shutdown()
+
         # expand *lower bound* with dichotomic search
         if not self.is_timeout:
             for i in range(guarantee.row_dim):
@@ -401,7 +813,7 @@ class BottomUpDichotomicDFS(ParallelepipedalSearch):
                         self.progress_message()
 
                         ## Check convergance
-                        self.soundness, _ = self.isSAT(guarantee.get_interval())
+                        self.soundness, _ = self.call_oracle(guarantee.get_interval(), "lb", (i, j))
                         if self.soundness:
                             self.print_debug(" successful expansion!")
                             succ_pivot_refinement = guarantee.down_low_pivot(i, j)
@@ -490,7 +902,7 @@ class BottomUpBFS(ParallelepipedalSearch):
             self.progress_message()
 
             ## Check convergance
-            self.soundness, _ = self.isSAT(guarantee.get_interval())
+            self.soundness, _ = self.call_oracle(guarantee.get_interval(), "ub", (i, j))
             if not self.soundness:
                 # Since we start with the trivial explanation and expand
                 # the explanation will always be sound, until a counter
@@ -526,7 +938,7 @@ class BottomUpBFS(ParallelepipedalSearch):
                 self.progress_message()
 
                 ## Check convergance
-                self.soundness, _ = self.isSAT(guarantee.get_interval())
+                self.soundness, _ = self.call_oracle(guarantee.get_interval(), "lb", (i, j))
                 if not self.soundness:
                     # Since we start with the trivial explanation and expand
                     # the explanation will always be sound, until a counter
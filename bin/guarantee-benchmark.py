@@ -0,0 +1,121 @@
+###########################################################
+# guarantee-benchmark.py
+# --------------------------------------------------------
+# Micro-benchmark of the per-iteration bookkeeping of the
+# search algorithms, i.e. the guarantee operations without
+# the oracle calls, in checked and in fast mode (see
+# geometry.checks).
+#
+# Run from the bin/ directory:
+#   python guarantee-benchmark.py [-n <iterations>] [-d <rows> <cols>]
+###########################################################
+
+# python libraries
+import argparse
+import time
+
+# 3rd party libraries
+import numpy as np
+
+# custom libraries
+import sys
+sys.path.append("..")
+import geometry.checks as checks
+import geometry.interval as interval
+import guarantees.parallelepipedal as guarantees
+
+
+def make_guarantee(shape, top):
+    x_star = 0.5 * np.ones(shape)
+    domain = interval.Interval(np.zeros(shape), np.ones(shape))
+
+    if top: return guarantees.TopDistParallelGurantee(x_star, 0, 0.5, 0.001, domain)
+    return guarantees.BottomDistParallelGurantee(x_star, 0, 0.5, 0.001, domain)
+
+
+def bench_expand(shape, num_it):
+    # bottom-up step: expand a coordinate, then revert it
+    guarantee   = make_guarantee(shape, top=False)
+    coordinates = [(i, j) for i in range(shape[0]) for j in range(shape[1])]
+
+    tic = time.perf_counter()
+    for it in range(num_it):
+        i, j = coordinates[it % len(coordinates)]
+        guarantee.expand_ub(i, j)
+        guarantee.revert_expand_ub(i, j)
+
+    return (time.perf_counter() - tic) / num_it
+
+
+def bench_dichotomic(shape, num_it):
+    # bottom-up dichotomic step: expand a coordinate, then move a pivot
+    guarantee   = make_guarantee(shape, top=False)
+    coordinates = [(i, j) for i in range(shape[0]) for j in range(shape[1])]
+
+    tic = time.perf_counter()
+    for it in range(num_it):
+        i, j = coordinates[it % len(coordinates)]
+        if not guarantee.high_dichotomic_invariant(i, j): guarantee.update_pivots()
+        guarantee.expand_dichotomic_ub(i, j)
+        guarantee.down_high_pivot(i, j)
+
+    return (time.perf_counter() - tic) / num_it
+
+
+def bench_constrain(shape, num_it):
+    # top-down step: constrain the guarantee w.r.t. a counterexample
+    rng = np.random.default_rng(0)
+
+    coordinates = [(i, j) for i in range(shape[0]) for j in range(shape[1])]
+    guarantee   = make_guarantee(shape, top=True)
+    total       = 0
+    for it in range(num_it):
+        # each coordinate is constrained once per guarantee
+        if it % len(coordinates) == 0:
+            guarantee = make_guarantee(shape, top=True)
+            rng.shuffle(coordinates)
+
+        # halving the upper bound of the coordinate
+        i, j            = coordinates[it % len(coordinates)]
+        witness         = guarantee.x_star.copy()
+        witness[i][j]   = (guarantee.x_star[i][j] + guarantee.ub[i][j]) / 2
+
+        tic = time.perf_counter()
+        guarantee.constrain(witness)
+        total += time.perf_counter() - tic
+
+    return total / num_it
+
+
+benchmarks = [
+    ("expand_ub",       bench_expand),
+    ("dichotomic",      bench_dichotomic),
+    ("constrain",       bench_constrain),
+]
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=10000, help="number of iterations per operation")
+    parser.add_argument("-d", type=int, nargs=2, default=[28, 28], help="the input's dimensions")
+
+    args = parser.parse_args()
+    assert args.n > 0
+
+    shape = tuple(args.d)
+    print(f"{'Operation':<16}{'Checked (us)':>14}{'Fast (us)':>12}{'Speed-up':>10}")
+    print("=" * 52)
+    for description, bench in benchmarks:
+        checks.enable()
+        checked = bench(shape, args.n)
+
+        checks.disable()
+        fast    = bench(shape, args.n)
+
+        print(
+            f"{description:<16}"
+            f"{1e6 * checked:>14.2f}"
+            f"{1e6 * fast:>12.2f}"
+            f"{checked / fast:>9.1f}x"
+        )
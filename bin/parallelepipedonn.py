@@ -5,10 +5,10 @@ import warnings
 warnings.filterwarnings('ignore')
 import os
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
-import tensorflow as tf
-tf.compat.v1.logging.set_verbosity(tf.compat.v1.logging.ERROR)
 
 # custom libraries
+# NOTE: the heavy libraries (Marabou, matplotlib) are loaded
+# lazily, see cli.lazy. TensorFlow is not needed at all.
 import cli.runner as runner
 
 
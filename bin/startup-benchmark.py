@@ -0,0 +1,86 @@
+###########################################################
+# startup-benchmark.py
+# --------------------------------------------------------
+# Measures the start-up time of the command line tools,
+# e.g. the help screens of parallelepipedonn.py, and
+# reports which heavy libraries (TensorFlow, matplotlib,
+# Marabou) each one loads. None of the benchmarked
+# commands should load any of them.
+#
+# Run from the bin/ directory:
+#   python startup-benchmark.py [-n <repetitions>]
+###########################################################
+
+# python libraries
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+
+## Constants
+heavy_modules = ["tensorflow", "matplotlib", "maraboupy"]
+
+# (description, command)
+commands = [
+    ("help",            ["parallelepipedonn.py", "-h"]),
+    ("help algos",      ["parallelepipedonn.py", "-h", "al"]),
+    ("help verifs",     ["parallelepipedonn.py", "-h", "v"]),
+    ("arg. check",      ["parallelepipedonn.py", "-x", "missing.csv", "-c", "0", "-nn", "missing.onnx"]),
+    ("vec-eq",          ["vec-eq.py", "-h"]),
+    ("interval-eq",     ["interval-eq.py", "-h"]),
+]
+
+# reports the heavy modules loaded by the command, on exit
+probe = (
+    "import sys, atexit, runpy\n"
+    "atexit.register(lambda: print('#loaded:' + ','.join(m for m in {modules} if m in sys.modules), file=sys.stderr))\n"
+    "sys.argv = {argv}\n"
+    "runpy.run_path(sys.argv[0], run_name='__main__')\n"
+)
+
+
+def time_command(command, repetitions):
+    times = []
+    for _ in range(repetitions):
+        tic = time.perf_counter()
+        subprocess.run([sys.executable] + command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - tic)
+
+    return times
+
+
+def loaded_modules(command):
+    call = subprocess.run(
+        [sys.executable, "-c", probe.format(modules=heavy_modules, argv=command)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    for line in call.stderr.split("\n"):
+        if line.startswith("#loaded:"): return line[len("#loaded:"):]
+
+    return "?"
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=5, help="number of repetitions per command")
+
+    args = parser.parse_args()
+    assert args.n > 0
+
+    print(f"{'Command':<16}{'Min (s)':>10}{'Avg (s)':>10}{'Max (s)':>10}   Heavy Modules Loaded")
+    print("=" * 70)
+    for description, command in commands:
+        times   = time_command(command, args.n)
+        loaded  = loaded_modules(command)
+        print(
+            f"{description:<16}"
+            f"{min(times):>10.3f}"
+            f"{statistics.mean(times):>10.3f}"
+            f"{max(times):>10.3f}"
+            f"   {loaded if loaded != '' else '-'}"
+        )
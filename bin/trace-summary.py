@@ -0,0 +1,165 @@
+###########################################################
+# trace-summary.py
+# --------------------------------------------------------
+# Summarizes an oracle-call trace, i.e. the JSON-lines file
+# written by `parallelepipedonn.py -tr <trace_path>.jsonl`
+# (see verification/tracing.py):
+#   * the time per answer source (solver, caches, ...),
+#   * the hotspots per algorithm phase, per interval width
+#   and per coordinate,
+#   * the slowest calls.
+# Optionally, it writes folded stacks, i.e. the input of
+# flamegraph.pl, and renders a timeline of the calls.
+#
+# Run from the bin/ directory:
+#   python trace-summary.py -i <trace_path>.jsonl [-n <top>]
+#       [--folded <stacks>.txt] [--timeline <timeline>.png]
+###########################################################
+
+# python libraries
+import argparse
+import collections
+import json
+
+# 3rd party libraries
+import numpy as np
+
+
+def load_events(path):
+    events = []
+    with open(path) as f:
+        for line in f:
+            if line.strip() != "": events.append(json.loads(line))
+
+    return events
+
+
+def print_table(title, key_name, rows, top):
+    # rows: {key: [call times]}
+    print("\n# " + title)
+    print(f"{key_name:<28}{'Calls':>8}{'Total (s)':>12}{'Avg (s)':>10}{'Max (s)':>10}")
+    print("=" * 68)
+
+    ordered = sorted(rows.items(), key=lambda item: -sum(item[1]))
+    for key, times in ordered[:top]:
+        print(
+            f"{str(key):<28}"
+            f"{len(times):>8}"
+            f"{sum(times):>12.3f}"
+            f"{np.mean(times):>10.3f}"
+            f"{max(times):>10.3f}"
+        )
+
+
+def call_time(event):
+    return event["solver"] + event["overhead"]
+
+
+def summarize(events, top):
+    total_solver    = sum(event["solver"] for event in events)
+    total_overhead  = sum(event["overhead"] for event in events)
+    num_sat         = sum(not event["verdict"] for event in events)
+
+    print("# Overview")
+    print("=" * 68)
+    print(f"{'Events:':<22}"            + str(len(events)))
+    print(f"{'Verdicts (T/F):':<22}"     + f"{len(events) - num_sat}/{num_sat}")
+    print(f"{'Solver Time:':<22}"       + f"{total_solver:.3f} (secs)")
+    print(f"{'Python Overhead:':<22}"   + f"{total_overhead:.3f} (secs)")
+    print(f"{'Trace Span:':<22}"        + f"{max(event['t'] + call_time(event) for event in events):.3f} (secs)")
+
+    by_source = collections.defaultdict(list)
+    by_phase  = collections.defaultdict(list)
+    by_coord  = collections.defaultdict(list)
+    by_width  = collections.defaultdict(list)
+    for event in events:
+        by_source[event["source"]].append(call_time(event))
+        by_phase[event["algo"] + ":" + event["phase"]].append(call_time(event))
+        if event["coord"] is not None:
+            by_coord[tuple(event["coord"])].append(call_time(event))
+
+        # widths, in log2 buckets
+        width = event["width"]
+        if width <= 0:  bucket = "0"
+        else:           bucket = f"[2^{int(np.floor(np.log2(width)))}, 2^{int(np.floor(np.log2(width))) + 1})"
+        by_width[bucket].append(call_time(event))
+
+    print_table("Answer Sources",           "Source",       by_source,  top)
+    print_table("Hotspots per Phase",       "Algo:Phase",   by_phase,   top)
+    print_table("Hotspots per Width",       "Width",        by_width,   top)
+    if by_coord != {}:
+        print_table("Hotspots per Coordinate", "Coordinate", by_coord, top)
+
+    print("\n# Slowest Calls")
+    print(f"{'t (s)':>10}  {'Algo:Phase':<28}{'Coord':<12}{'Width':>8}{'Verdict':>9}{'Solver (s)':>12}")
+    print("=" * 80)
+    for event in sorted(events, key=lambda event: -call_time(event))[:top]:
+        coord = "-" if event["coord"] is None else str(tuple(event["coord"]))
+        print(
+            f"{event['t']:>10.3f}  "
+            f"{event['algo'] + ':' + event['phase']:<28}"
+            f"{coord:<12}"
+            f"{event['width']:>8.4f}"
+            f"{str(event['verdict']):>9}"
+            f"{event['solver']:>12.3f}"
+        )
+
+
+def write_folded(events, path):
+    # flamegraph.pl input: "frame;frame;frame <weight>",
+    # with the weight in microseconds
+    stacks = collections.Counter()
+    for event in events:
+        frames = [event["algo"].replace(" ", "_"), event["phase"] or "-", event["source"]]
+        stacks[";".join(frames + ["solver"])]   += int(1e6 * event["solver"])
+        stacks[";".join(frames + ["overhead"])] += int(1e6 * event["overhead"])
+
+    with open(path, "w") as f:
+        for stack, weight in sorted(stacks.items()):
+            if weight > 0: f.write(f"{stack} {weight}\n")
+
+
+def render_timeline(events, path):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    phases  = sorted({event["algo"] + ":" + event["phase"] for event in events})
+    rows    = {phase: ind for ind, phase in enumerate(phases)}
+
+    fig, ax = plt.subplots(figsize=(12, 1 + 0.5 * len(phases)))
+    for verdict, color in [(True, "tab:green"), (False, "tab:red")]:
+        selected = [event for event in events if event["verdict"] == verdict]
+        for event in selected:
+            ax.broken_barh(
+                [(event["t"], max(call_time(event), 1e-6))],
+                (rows[event["algo"] + ":" + event["phase"]] - 0.4, 0.8),
+                facecolors=color
+            )
+
+    ax.set_yticks(range(len(phases)))
+    ax.set_yticklabels(phases)
+    ax.set_xlabel("time (secs), green: True, red: False")
+    fig.tight_layout()
+    fig.savefig(path)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", type=str, required=True, help="the trace, a JSON-lines file")
+    parser.add_argument("-n", type=int, default=10, help="number of rows per table")
+    parser.add_argument("--folded", type=str, default=None, help="write folded stacks (flamegraph.pl input)")
+    parser.add_argument("--timeline", type=str, default=None, help="render the timeline of the calls (.png)")
+
+    args = parser.parse_args()
+    assert args.n > 0
+
+    events = load_events(args.i)
+    if events == []:
+        print("Empty trace.")
+        exit(0)
+
+    summarize(events, args.n)
+    if args.folded   is not None: write_folded(events, args.folded)
+    if args.timeline is not None: render_timeline(events, args.timeline)
@@ -12,7 +12,6 @@ import sys
 
 ## 3rd Party Libraries
 import numpy as np
-import matplotlib.image as plt_im
 
 ## Custom
 import cli.methods as methods
@@ -21,11 +20,20 @@ import cli.error_handling as errors
 import cli.args as args
 #import config
 
-import verification.marabou as marabou_verif
+import verification.nn_verification as nn_verif
+import verification.tracing as tracing
+import verification.harvesting as harvesting
 import guarantees.parallelepipedal as psg
 import guarantees.cyclic as csg
 import geometry.interval as geom
 
+## Heavy libraries, loaded lazily
+# matplotlib is loaded only when images are saved, and
+# Marabou only when a verifier is built
+import cli.lazy as lazy
+plt_im          = lazy.LazyModule("matplotlib.image")
+marabou_verif   = lazy.LazyModule("verification.marabou")
+
 
 
 # overwrite given TF's c_star by Marabou's estimation
@@ -34,6 +42,10 @@ import geometry.interval as geom
 # of the TF network
 overwrite_given_prediction = False
 
+# the file of the persistent oracle store, under
+# <path_header>/<dataset_dir>/outputs/
+oracle_store_filename = "oracle-store.sqlite"
+
 
 
 ####################
@@ -87,7 +99,26 @@ class Application:
 
             ## Bounds from files
             lb_path:        str = "",
-            ub_path:        str = ""
+            ub_path:        str = "",
+
+            ## Parallel mode
+            num_workers:    int = 1,
+
+            ## Persistent oracle store
+            oracle_store:   bool = False,
+
+            ## Oracle-call tracing
+            # the JSON-lines trace file, "" for no tracing
+            trace_path:     str = "",
+
+            ## Witness harvesting
+            # top-down refinement by the harvested witnesses
+            harvest:        bool = False,
+
+            ## Re-used oracle
+            # an already initialized verifier, for the same verifier id,
+            # c_star, onnx and domain, e.g. kept by a batch worker.
+            isSAT:          nn_verif.NNVerification = None
         ):
 
         ####################
@@ -101,6 +132,7 @@ class Application:
         assert max_it   > 0
         assert delta    > 0
         assert rad      > delta
+        assert num_workers > 0
 
 
         #########################
@@ -139,11 +171,24 @@ class Application:
         #########################
         # Initialize the Oracle #
         #########################
-        self.isSAT = verifiers.init_method[verifier](
-            self.c_star,
-            self.onnx_path,
-            self.domain
-        )
+        if isSAT is None:
+            self.isSAT = verifiers.init_method[verifier](
+                self.c_star,
+                self.onnx_path,
+                self.domain
+            )
+        else:
+            assert isSAT.c_star == self.c_star
+            self.isSAT = isSAT
+            self.isSAT.reset_statistics()
+
+        self.oracle_store_path = ""
+        if oracle_store:
+            self.oracle_store_path = os.path.join(
+                os.path.dirname(os.path.dirname(self.output_path)),
+                oracle_store_filename
+            )
+            self.isSAT.open_result_store(self.oracle_store_path)
 
         if not self.check_class_oracle_consistency() and overwrite_given_prediction:
             oracle_prediction = self.isSAT.predict_argmax(self.x_star)[0]
@@ -175,6 +220,23 @@ class Application:
             )
         else: errors.print_error_message(errors.error_unknown_method)
 
+        ## Parallel mode
+        self.num_workers = num_workers
+        self.algo.set_num_workers(self.num_workers)
+
+        ## Tracing
+        self.trace_path = trace_path
+        self.tracer     = None
+        if self.trace_path != "":
+            self.tracer = tracing.Tracer(self.trace_path)
+            self.algo.set_tracer(self.tracer)
+
+        ## Witness harvesting
+        self.harvester = None
+        if harvest and harvesting.is_harvestable(self.isSAT):
+            self.harvester = harvesting.WitnessHarvester(self.isSAT)
+            self.algo.set_harvester(self.harvester)
+
         
         ##########################################
         # Initialize Bounds from File (if given) #
@@ -266,6 +328,12 @@ class Application:
         assert self.done == False
         self.guarantee = self.algo.search(self.guarantee)
         self.done = True
+
+        if self.tracer is not None: self.tracer.close()
+
+        # e.g. the split pool of the verifier, kept warm by the
+        # batch and server modes
+        self.isSAT.close()
     
 
     ###########
@@ -279,6 +347,8 @@ class Application:
         print(f"{'Output Path Pfx:':<23}"       + self.output_path)
         print(f"{'Low. Bound from File:':<23}"  + self.lb_path)
         print(f"{'Up. Bound from File:':<23}"   + self.ub_path)
+        print(f"{'Oracle Store:':<23}"          + self.oracle_store_path)
+        print(f"{'Oracle Trace:':<23}"          + self.trace_path)
         print("\n")
 
     def print_setup(self):
@@ -287,6 +357,8 @@ class Application:
         print(f"{'Method:':<22}"                + self.algo.msg_prefix)
         print(f"{'Max. It.:':<22}"              + str(self.algo.max_it))
         print(f"{'Set Timeout:':<22}"           + str(self.algo.timeout) + " (mins)")
+        print(f"{'Num. Workers:':<22}"          + str(self.num_workers))
+        print(f"{'Witness Harvest:':<22}"       + str(self.harvester is not None))
         if isinstance(self.guarantee, csg.CyclicGuarantee):
             print(f"{'Radius Dist. Restr.:':<22}"   + str(self.guarantee.distance_restriction))
         else:
@@ -316,9 +388,18 @@ class Application:
         print(f"{'Verif. Num. Calls:':<22}"     + str(self.isSAT.get_num_calls()))
         print(f"{'Verif. Avg Time:':<22}"       + str(round(self.isSAT.get_avg_time(), 2)) + " (secs)")
         print(f"{'Verif. Time Perc.:':<22}"     + str(round(self.isSAT.get_total_time() / self.algo.total_time, 4) * 100) + "%")
+        for label, value in self.isSAT.get_extra_statistics().items():
+            print(f"{'Verif. ' + label + ':':<22}"  + str(value))
+        if self.harvester is not None:
+            print(f"{'Harvested Witnesses:':<22}"   + str(self.harvester.num_harvested))
+            print(f"{'Harvested Cuts:':<22}"        + str(self.harvester.num_cuts))
     
 
-    def print_simple_results(self):
+    def get_simple_results(self) -> list:
+        """
+            #### Description:
+            The results printed by `print_simple_results()`, as a list.
+        """
         min_edge_len = None
         if isinstance(self.guarantee, csg.CyclicGuarantee):
             interval = self.guarantee.get_interval()
@@ -327,13 +408,18 @@ class Application:
         else:
             min_edge_len = self.guarantee.min_edge_length()
 
-        simple_res =    str(self.algo.num_it)                       + " "   # Num. of Iterations
-        simple_res +=   str(round(self.algo.total_time, 2))         + " "   # CPU time
-        simple_res +=   str(self.guarantee.calc_complexity())       + " "   # Complexity
-        simple_res +=   str(round(min_edge_len, 4))                 + " "   # Min. Edge Length
-        simple_res +=   str(round(self.isSAT.get_total_time(), 2))  + " "   # Verif. Total Time
-        simple_res +=   str(self.isSAT.get_num_calls())             + " "   # Verif. Num. of Calls
-        simple_res +=   str(int(self.algo.is_timeout))                      # Timeout
+        return [
+            self.algo.num_it,                       # Num. of Iterations
+            round(self.algo.total_time, 2),         # CPU time
+            self.guarantee.calc_complexity(),       # Complexity
+            round(min_edge_len, 4),                 # Min. Edge Length
+            round(self.isSAT.get_total_time(), 2),  # Verif. Total Time
+            self.isSAT.get_num_calls(),             # Verif. Num. of Calls
+            int(self.algo.is_timeout)               # Timeout
+        ]
+
+    def print_simple_results(self):
+        simple_res = " ".join([str(res) for res in self.get_simple_results()])
         
         print(simple_res)
 
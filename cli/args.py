@@ -40,7 +40,11 @@ algo_args = {
 
     ## Methods for Complete Approximations
     methods.complete_bu:                    "complete-bu",
-    methods.complete_c_d_bu:                "complete-c-d-bu"
+    methods.complete_c_d_bu:                "complete-c-d-bu",
+
+    ## Group Testing Methods
+    methods.bottom_up_group_dfs:            "bu-g-dfs",
+    methods.td_n_bu_g_dfs:                  "td+bu-g-dfs"
 }
 
 args_algo = {
@@ -75,19 +79,33 @@ args_algo = {
 
     ## Methods for Complete Approximations
     algo_args[methods.complete_bu]:                 methods.complete_bu,
-    algo_args[methods.complete_c_d_bu]:             methods.complete_c_d_bu
+    algo_args[methods.complete_c_d_bu]:             methods.complete_c_d_bu,
+
+    ## Group Testing Methods
+    algo_args[methods.bottom_up_group_dfs]:         methods.bottom_up_group_dfs,
+    algo_args[methods.td_n_bu_g_dfs]:               methods.td_n_bu_g_dfs
 }
 
 
 
 verif_args = {
-    verifiers.marabou_sound:    "mara-sound",
-    verifiers.marabou_complete: "mara-complete"
+    verifiers.marabou_sound:          "mara-sound",
+    verifiers.marabou_complete:       "mara-complete",
+    verifiers.marabou_ibp:            "mara-ibp",
+    verifiers.marabou_hybrid:         "mara-hybrid",
+    verifiers.marabou_split:          "mara-split",
+    verifiers.marabou_complete_split: "mara-complete-split",
+    verifiers.marabou_portfolio:      "mara-portfolio"
 }
 
 args_verif = {
-    verif_args[verifiers.marabou_sound]:    verifiers.marabou_sound,
-    verif_args[verifiers.marabou_complete]: verifiers.marabou_complete
+    verif_args[verifiers.marabou_sound]:          verifiers.marabou_sound,
+    verif_args[verifiers.marabou_complete]:       verifiers.marabou_complete,
+    verif_args[verifiers.marabou_ibp]:            verifiers.marabou_ibp,
+    verif_args[verifiers.marabou_hybrid]:         verifiers.marabou_hybrid,
+    verif_args[verifiers.marabou_split]:          verifiers.marabou_split,
+    verif_args[verifiers.marabou_complete_split]: verifiers.marabou_complete_split,
+    verif_args[verifiers.marabou_portfolio]:      verifiers.marabou_portfolio
 }
 
 
@@ -122,6 +140,12 @@ quiet          = 16
 help           = 17
 verif          = 18
 timeout        = 19
+workers        = 20
+store          = 21
+server         = 22
+trace          = 23
+configs        = 24
+harvest        = 25
 
 
 cli_args = {
@@ -152,14 +176,20 @@ cli_args = {
         dom_ub:         "-du",
         dom_lb:         "-dl",
         timeout:        "-t",
+        workers:        "-w",
+        configs:        "-cfg",
 
         # Verifier
         verif:          "-v",
+        store:          "-st",
+        harvest:        "-hv",
+        trace:          "-tr",
         
         # Interface
         no_out:         "-no",
         simple_res:     "-sr",
         quiet:          "-q",
+        server:         "-sv",
         help:           "-h",
     }
 }
@@ -215,6 +245,9 @@ defaults = {
 
         # Verifiers
         verif:          verifiers.marabou_sound,
+        store:          False,
+        harvest:        False,
+        trace:          "",
 
         # Algorithm
         method:         methods.top_down,
@@ -224,11 +257,14 @@ defaults = {
         dom_lb:         0,
         dom_ub:         1,
         timeout:        60,
+        workers:        1,
+        configs:        None,
 
         # Interface
         no_out:         False,
         simple_res:     False,
         quiet:          False,
+        server:         None,
         help:           help_no
     }
 }
\ No newline at end of file
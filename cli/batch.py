@@ -0,0 +1,144 @@
+###########################################################
+# cli.batch
+# --------------------------------------------------------
+# Running many instances *in-process*. Each worker process
+# keeps its verifiers alive between the instances, so the
+# network is parsed (and the verifier is built) once per
+# (verifier, c_star, onnx, domain) key, and not once per
+# instance.
+###########################################################
+
+## Typing
+import typing
+
+## Errors
+import sys
+import traceback
+
+## Custom
+import cli.args as args
+import cli.loader as loader
+import cli.verifiers as verifiers
+import cli.error_handling as errors
+import cli.application as app
+
+import geometry.interval as geom
+import verification.nn_verification as nn_verif
+
+import numpy as np
+
+
+####################
+# Worker Verifiers #
+####################
+# the verifiers of the *current* process
+_verifiers: typing.Dict[typing.Tuple, nn_verif.NNVerification] = {}
+
+def get_verifier(
+        verifier:   int,
+        c_star:     int,
+        onnx_path:  str,
+        dom_lb:     float,
+        dom_ub:     float,
+        shape:      typing.Tuple[int, int]
+    ) -> nn_verif.NNVerification:
+    """
+        #### Description:
+        Returns the verifier of the current process for the given key,
+        building it on the first request.
+    """
+    key = (verifier, c_star, onnx_path, dom_lb, dom_ub, shape)
+    if key not in _verifiers:
+        domain = geom.Interval(dom_lb * np.ones(shape), dom_ub * np.ones(shape))
+        _verifiers[key] = verifiers.init_method[verifier](c_star, onnx_path, domain)
+
+    return _verifiers[key]
+
+
+
+#############
+# Instances #
+#############
+def run_instance(argv: typing.List[str]) -> typing.Tuple[int, typing.Union[list, None]]:
+    """
+        #### Description:
+        Runs a single instance, given by the same `argv` as the
+        `parallelepipedonn.py` command line, but *in-process* and quietly.
+
+        #### Output:
+        `(exit_code, simple_results)`, where `simple_results` is the list
+        of `Application.get_simple_results()`, or `None` on error.
+    """
+    exit_code, simple_results, _ = certify(argv)
+
+    return exit_code, simple_results
+
+
+def certify(argv: typing.List[str]) -> typing.Tuple[int, typing.Union[list, None], typing.Union[geom.Interval, None]]:
+    """
+        #### Description:
+        As `run_instance()`, but also returns the computed guarantee's
+        interval `[lb, ub]` (or `None` on error).
+    """
+    try:
+        loaded = loader.Loader(argv)
+
+        x_star = np.genfromtxt(loaded[args.x_star_path], delimiter=" ")
+        isSAT  = get_verifier(
+                    loaded[args.verif],
+                    loaded[args.c_star],
+                    loaded[args.onnx_path],
+                    loaded[args.dom_lb],
+                    loaded[args.dom_ub],
+                    x_star.shape
+                )
+
+        application_run = app.Application(
+            # required args
+            loaded[args.x_star_path],
+            loaded[args.c_star],
+            loaded[args.onnx_path],
+            loaded[args.out_dir],
+
+            # optional args
+            loaded[args.verif],
+            loaded[args.method],
+            loaded[args.max_it],
+            loaded[args.rad],
+            loaded[args.delta],
+            loaded[args.dom_lb],
+            loaded[args.dom_ub],
+            loaded[args.timeout],
+            False,
+            " ",
+            loaded[args.lb_path],
+            loaded[args.ub_path],
+            loaded[args.workers],
+            loaded[args.store],
+            loaded[args.trace],
+            loaded[args.harvest],
+            isSAT
+        )
+
+        application_run.apply()
+
+        ## save output
+        if not loaded[args.no_out]:
+            application_run.save_bounds(loaded[args.over_out])
+
+        ## save images
+        if not loaded[args.no_out] and loaded[args.save_images]:
+            application_run.image_save_bounds(loaded[args.over_out])
+
+        return                                          \
+            errors.error_all_ok,                        \
+            application_run.get_simple_results(),       \
+            application_run.guarantee.get_interval()
+
+    # the cli reports errors with exit()
+    except SystemExit as exit_error:
+        return exit_error.code, None, None
+
+    except Exception:
+        traceback.print_exc(file=sys.stderr)
+        return errors.error_unkown_error, None, None
@@ -10,6 +10,7 @@ import cli.args as args
 import cli.error_handling as errors
 ## Utils
 import cli.utils as utils
+import cli.multi as multi
 
 ###################
 # Check Arguments #
@@ -22,7 +23,8 @@ def check_no_errors(argv: typing.List[str]) -> typing.Tuple[bool, int]:
 
 ## Required Arguments
 def check_x_star_path(argv: typing.List[str]) -> typing.Tuple[bool, int]:
-    # overwrite checks if help arg is provided
+    # overwrite checks if help or server arg is provided
+    if args.cli_args[args.optional][args.server] in argv:                                            return False, errors.error_all_ok
     if args.cli_args[args.optional][args.help] in argv:                                              return False, errors.error_all_ok
 
     if not args.cli_args[args.required][args.x_star_path] in argv:                                   return True, errors.error_x_star_missing
@@ -32,7 +34,8 @@ def check_x_star_path(argv: typing.List[str]) -> typing.Tuple[bool, int]:
 
 
 def check_c_star(argv: typing.List[str]) -> typing.Tuple[bool, int]:
-    # overwrite checks if help arg is provided
+    # overwrite checks if help or server arg is provided
+    if args.cli_args[args.optional][args.server] in argv:                                            return False, errors.error_all_ok
     if args.cli_args[args.optional][args.help] in argv:                                             return False, errors.error_all_ok
 
     if not args.cli_args[args.required][args.c_star] in argv:                                       return True, errors.error_c_star_missing
@@ -42,7 +45,8 @@ def check_c_star(argv: typing.List[str]) -> typing.Tuple[bool, int]:
 
 
 def check_onnx_path(argv: typing.List[str]) -> typing.Tuple[bool, int]:
-    # overwrite checks if help arg is provided
+    # overwrite checks if help or server arg is provided
+    if args.cli_args[args.optional][args.server] in argv:                                            return False, errors.error_all_ok
     if args.cli_args[args.optional][args.help] in argv:                                            return False, errors.error_all_ok
 
     if not args.cli_args[args.required][args.onnx_path] in argv:                                   return True, errors.error_onnx_path_missing
@@ -96,6 +100,18 @@ def check_verifier(argv: typing.List[str]) -> typing.Tuple[bool, int]:
     return False, errors.error_all_ok
 
 
+def check_trace(argv: typing.List[str]) -> typing.Tuple[bool, int]:
+    # overwrite checks if help arg is provided
+    if args.cli_args[args.optional][args.help] in argv:                                     return False, errors.error_all_ok
+
+    if not args.cli_args[args.optional][args.trace] in argv:                                return False, errors.error_all_ok
+    ind = argv.index(args.cli_args[args.optional][args.trace]) + 1
+    if ind >= len(argv):                                                                    return True,  errors.error_trace_dir_missing
+    if not os.path.isdir(os.path.dirname(os.path.abspath(argv[ind]))):                      return True,  errors.error_trace_dir_missing
+
+    return False, errors.error_all_ok
+
+
 # Algorithm
 def check_method(argv: typing.List[str]) -> typing.Tuple[bool, int]:
     # overwrite checks if help arg is provided
@@ -174,6 +190,40 @@ def check_timeout(argv: typing.List[str]) -> typing.Tuple[bool, int]:
     return False, errors.error_all_ok
 
 
+def check_workers(argv: typing.List[str]) -> typing.Tuple[bool, int]:
+    # overwrite checks if help arg is provided
+    if args.cli_args[args.optional][args.help] in argv:                                     return False, errors.error_all_ok
+
+    if not args.cli_args[args.optional][args.workers] in argv:                              return False, errors.error_all_ok
+    if not argv[argv.index(args.cli_args[args.optional][args.workers]) + 1].isnumeric():    return True,  errors.error_workers_not_pos_int
+    if int(argv[argv.index(args.cli_args[args.optional][args.workers]) + 1]) < 1:          return True,  errors.error_workers_not_pos_int
+
+    return False, errors.error_all_ok
+
+
+def check_server(argv: typing.List[str]) -> typing.Tuple[bool, int]:
+    # overwrite checks if help arg is provided
+    if args.cli_args[args.optional][args.help] in argv:                                     return False, errors.error_all_ok
+
+    if not args.cli_args[args.optional][args.server] in argv:                               return False, errors.error_all_ok
+    ind = argv.index(args.cli_args[args.optional][args.server]) + 1
+    if ind >= len(argv) or not argv[ind].isnumeric():                                       return True,  errors.error_server_not_pos_int
+    if int(argv[ind]) < 1:                                                                  return True,  errors.error_server_not_pos_int
+
+    return False, errors.error_all_ok
+
+
+def check_configs(argv: typing.List[str]) -> typing.Tuple[bool, int]:
+    # overwrite checks if help arg is provided
+    if args.cli_args[args.optional][args.help] in argv:                                     return False, errors.error_all_ok
+
+    if not args.cli_args[args.optional][args.configs] in argv:                              return False, errors.error_all_ok
+    ind = argv.index(args.cli_args[args.optional][args.configs]) + 1
+    if ind >= len(argv) or multi.parse_configurations(argv[ind]) is None:                   return True,  errors.error_configs_malformed
+
+    return False, errors.error_all_ok
+
+
 
 def check_help(argv: typing.List[str]) -> typing.Tuple[bool, int]:
     if not args.cli_args[args.optional][args.help] in argv:    return False, errors.error_all_ok   # no -h argument was given
@@ -208,6 +258,9 @@ check_argument = {
 
         # Verifiers
         args.verif:          check_verifier,
+        args.store:          check_no_errors,
+        args.harvest:        check_no_errors,
+        args.trace:          check_trace,
 
         # Algorithm
         args.method:         check_method,
@@ -217,11 +270,14 @@ check_argument = {
         args.dom_ub:         check_dom_lb,
         args.dom_lb:         check_dom_ub,
         args.timeout:        check_timeout,
+        args.workers:        check_workers,
         
         # Interface
         args.no_out:         check_no_errors,
         args.simple_res:     check_no_errors,
         args.quiet:          check_no_errors,
+        args.server:         check_server,
+        args.configs:        check_configs,
         args.help:           check_help,
     }
 }
\ No newline at end of file
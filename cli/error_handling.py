@@ -46,6 +46,18 @@ error_unknown_verif                 = 20
 # timer
 error_timer_not_pos_int             = 21
 
+# workers
+error_workers_not_pos_int           = 22
+
+# server
+error_server_not_pos_int            = 23
+
+# tracing
+error_trace_dir_missing             = 24
+
+# multi-configuration
+error_configs_malformed             = 25
+
 
 
 error_messages = {
@@ -83,6 +95,10 @@ error_messages = {
     error_dom_lb_no_float:                  "The domain lower bound parameter in not a float!",
     error_dom_ub_no_float:                  "The domain upper bound parameter in not a float!",
     error_timer_not_pos_int:                "Timeout is not a positive integer!",
+    error_workers_not_pos_int:              "Number of workers is not a positive integer!",
+    error_server_not_pos_int:               "Number of server workers is not a positive integer!",
+    error_trace_dir_missing:                "The directory of the trace file does not exist!",
+    error_configs_malformed:                "Malformed configurations, expected <verif>:<method>:<rad>:<delta>,...!",
 
     # interface
     error_unknown_help_arg:                 "Unknown help argument!",
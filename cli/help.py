@@ -25,6 +25,9 @@ help_msg = {
 
         # verifiers
         args.verif:         "the verifier to be used",
+        args.store:         "persistent oracle store, under /outputs/oracle-store.sqlite",
+        args.harvest:       "witness harvesting, cut several coordinates per witness (top-down methods)",
+        args.trace:         "trace the oracle calls to a JSON-lines file (see bin/trace-summary.py)",
 
         # Algorithm
         args.method:        "the algorithm to be used",
@@ -37,12 +40,17 @@ help_msg = {
         args.dom_ub:        "the scalar of the domain's upper bound",
 
         # Timeout
-        args.timeout:       "timeout for the algorithm",
+        args.timeout:       "timeout for the algorithm, also bounding each solver call",
+
+        # Workers
+        args.workers:       "number of worker processes (bu-d-dfs, c-bu-d, complete-c-d-bu)",
         
         # Interface
         args.no_out:        "no output, suppress exporting computed lb, ub as csvs",
         args.simple_res:    "simple results, outputing results as numbers in stdout",
         args.quiet:         "quiet, supress output",
+        args.server:        "server mode, serve JSON-lines requests from stdin",
+        args.configs:       "certify x_star with several configurations concurrently",
         
         # Help
         args.help:          "help, print help"
@@ -71,6 +79,9 @@ example_msg = {
 
         # Verifiers
         args.verif:         "<verif>",
+        args.store:         None,
+        args.harvest:       None,
+        args.trace:         "<trace_path>.jsonl",
 
         # Algorithm
         args.method:        "<algo>",
@@ -78,6 +89,7 @@ example_msg = {
         args.rad:           "<rad>",
         args.delta:         "<delta>",
         args.timeout:       "<timeout (mins)>",
+        args.workers:       "<num_workers>",
         
         # Domain
         args.dom_lb:        "<dom_lb>",
@@ -87,6 +99,8 @@ example_msg = {
         args.no_out:        None,
         args.simple_res:    None,
         args.quiet:         None,
+        args.server:        "<num_workers>",
+        args.configs:       "mara-sound:td:0.1:0.01,mara-ibp:td:0.1:0.01",
         
         # Help
         args.help:          None
@@ -117,6 +131,9 @@ domain_msg = {
         # Verifiers
         args.verif:         "(use " + args.cli_args[args.optional][args.help] + " " +\
                             args.help_args[args.help_verifs] + " to see the availabe options)",
+        args.store:         None,
+        args.harvest:       None,
+        args.trace:         "path, in an existing directory",
 
         # Algorithm
         args.method:        "(use " + args.cli_args[args.optional][args.help] + " " +\
@@ -129,11 +146,14 @@ domain_msg = {
         args.dom_lb:        "float",
         args.dom_ub:        "float",
         args.timeout:       "integer",
+        args.workers:       "positive integer",
         
         # Interface
         args.no_out:        None,
         args.simple_res:    None,
         args.quiet:         None,
+        args.server:        "positive integer (see cli/server.py for the request format)",
+        args.configs:       "comma separated <verif>:<method>:<rad>:<delta>",
         
         # Help
         args.help:          args.help_args[args.help_algos]     + ": algorithms " +\
@@ -165,6 +185,9 @@ default_msg = {
 
         # Verifiers
         args.verif:         "mara-sound",
+        args.store:         None,
+        args.harvest:       None,
+        args.trace:         "",
 
         # Algorithm
         args.method:        "td",
@@ -172,6 +195,7 @@ default_msg = {
         args.rad:           "1.0",
         args.delta:         "0.1",
         args.timeout:       "60",
+        args.workers:       "1",
 
         # Domain
         args.dom_lb:        "0.0",
@@ -181,6 +205,8 @@ default_msg = {
         args.no_out:        None,
         args.simple_res:    None,
         args.quiet:         None,
+        args.server:        None,
+        args.configs:       None,
         
         # Help
         args.help:          None
@@ -265,7 +291,11 @@ help_algo_msg = {
 
     ## Methods for Complete Approximations
     methods.complete_bu:                    "Complete Bottom-Up",
-    methods.complete_c_d_bu:                "Complete Cyclic Dich. Bottom Up"
+    methods.complete_c_d_bu:                "Complete Cyclic Dich. Bottom Up",
+
+    ## Group Testing Methods
+    methods.bottom_up_group_dfs:            "Bottom-Up Group Testing DFS",
+    methods.td_n_bu_g_dfs:                  "Top-Down + Bottom-Up Group Testing DFS"
 }
 
 
@@ -366,7 +396,12 @@ def print_io_convensions():
 help_verif_msg = {
     # Parallelepipedal Args 
     verifiers.marabou_sound:           "Marabou Sound Verifier",
-    verifiers.marabou_complete:        "Marabou Complete Verifier"
+    verifiers.marabou_complete:        "Marabou Complete Verifier",
+    verifiers.marabou_ibp:             "Marabou Sound Verifier, with an IBP prefilter",
+    verifiers.marabou_hybrid:          "Marabou Sound Verifier, with a PGD attack first",
+    verifiers.marabou_split:           "Marabou Sound Verifier, one parallel query per rival class",
+    verifiers.marabou_complete_split:  "Marabou Complete Verifier, one parallel query per face",
+    verifiers.marabou_portfolio:       "Marabou Sound Verifier, racing several solver configurations"
 }
 
 
@@ -0,0 +1,42 @@
+###########################################################
+# cli.lazy
+# --------------------------------------------------------
+# Lazy imports for the heavy libraries (Marabou,
+# matplotlib, TensorFlow), so that the help screens and
+# the argument checks start fast.
+###########################################################
+
+## Python Libraries
+import importlib
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+        #### Description:
+        A stand-in for the module `name`, which is imported on the first
+        access of one of its attributes. E.g.
+        ```
+            marabou_verif = LazyModule("verification.marabou")
+            ...
+            marabou_verif.SoundMarabouVerifier(...)     # imports here
+        ```
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._module = None
+
+    def _load(self) -> types.ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+
+        return self._module
+
+    def __getattr__(self, attribute: str):
+        # called only for the attributes *not* found,
+        # i.e. the attributes of the actual module
+        return getattr(self._load(), attribute)
+
+    def is_loaded(self) -> bool:
+        return self._module is not None
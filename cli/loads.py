@@ -15,12 +15,14 @@ import cli.methods as methods
 
 ## Generic Required Arguments
 def load_required_str(argv: typing.List[str], arg: str) -> str:
-    if args.cli_args[args.optional][args.help] in argv: return None
+    if args.cli_args[args.optional][args.help] in argv:     return None
+    if args.cli_args[args.optional][args.server] in argv:   return None
 
     return argv[argv.index(arg) + 1]
 
 def load_required_int(argv: typing.List[str], arg: str) -> int:
-    if args.cli_args[args.optional][args.help] in argv: return None
+    if args.cli_args[args.optional][args.help] in argv:     return None
+    if args.cli_args[args.optional][args.server] in argv:   return None
 
     return int(argv[argv.index(arg) + 1])
 
@@ -134,7 +136,8 @@ def load_out_dir(argv: typing.List[str]) -> typing.Union[str, None]:
         will be:
             `<path_header>/<dataset_dir>/outputs/<outputs_subdir>/<basename>_<lb | ub>.png`
     """
-    if args.cli_args[args.optional][args.help] in argv: return None
+    if args.cli_args[args.optional][args.help] in argv:     return None
+    if args.cli_args[args.optional][args.server] in argv:   return None
 
     # get the input path
     path           = argv[argv.index(args.cli_args[args.required][args.x_star_path]) + 1]
@@ -197,6 +200,9 @@ load = {
 
         # Algorithm
         args.verif:       load_verif,
+        args.store:       lambda argv: load_optional_bool(argv, args.cli_args[args.optional][args.store]),
+        args.harvest:     lambda argv: load_optional_bool(argv, args.cli_args[args.optional][args.harvest]),
+        args.trace:       lambda argv: load_optional_str(argv, args.cli_args[args.optional][args.trace]),
         args.method:      load_method,
         args.max_it:      load_max_it,
         args.rad:         load_radius,
@@ -204,11 +210,14 @@ load = {
         args.dom_lb:      lambda argv: load_optional_float(argv, args.cli_args[args.optional][args.dom_lb]),
         args.dom_ub:      lambda argv: load_optional_float(argv, args.cli_args[args.optional][args.dom_ub]),
         args.timeout:     lambda argv: load_optional_int(argv, args.cli_args[args.optional][args.timeout]),
+        args.workers:     lambda argv: load_optional_int(argv, args.cli_args[args.optional][args.workers]),
         
         # Interface
         args.no_out:      lambda argv: load_optional_bool(argv, args.cli_args[args.optional][args.no_out]),
         args.simple_res:  lambda argv: load_optional_bool(argv, args.cli_args[args.optional][args.simple_res]),
         args.quiet:       lambda argv: load_optional_bool(argv, args.cli_args[args.optional][args.quiet]),
+        args.server:      lambda argv: load_optional_int(argv, args.cli_args[args.optional][args.server]),
+        args.configs:     lambda argv: load_optional_str(argv, args.cli_args[args.optional][args.configs]),
         args.help:        load_help,
     }
 }
\ No newline at end of file
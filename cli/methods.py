@@ -56,6 +56,22 @@ def init_bottom_up_dichotomic_dfs(
             palgos.BottomUpDichotomicDFS(isSAT, max_it, timeout, verbose)
 
 
+def init_bottom_up_group_dfs(
+        x_star:     np.ndarray,
+        c_star:     int,
+        rad:        float,
+        delta:      float,
+        domain:     geom.Interval,
+        isSAT:      nn_verif.NNVerification,
+        max_it:     int,
+        timeout:    int,
+        verbose:    bool
+    ) -> typing.Tuple[psg.ParallelepipedalGuarantee, algos.SearchAlgorithm]:
+
+    return  psg.BottomDistParallelGurantee(x_star, c_star, rad, delta, domain),\
+            palgos.BottomUpGroupDFS(isSAT, max_it, timeout, verbose)
+
+
 def init_bottom_up_bfs(
         x_star:     np.ndarray,
         c_star:     int,
@@ -101,6 +117,7 @@ def init_top_down(
 #   1. Top-Down + Bottom-Up Linear DFS
 #   2. Top-Down + Bottom-Up Dichotomic DFS
 #   2. Top-Down + Bottom-Up BFS
+#   4. Top-Down + Bottom-Up Group Testing DFS
 #
 #   Recommended: Top-Down + Bottom-Up Dichotomic DFS
 #
@@ -186,6 +203,26 @@ def init_td_n_bu_bfs(
     return  guarantee, algo
 
 
+def init_td_n_bu_g_dfs(
+        x_star:     np.ndarray,
+        c_star:     int,
+        rad:        float,
+        delta:      float,
+        domain:     geom.Interval,
+        isSAT:      nn_verif.NNVerification,
+        max_it:     int,
+        timeout:    int,
+        verbose:    bool
+    ) -> typing.Tuple[psg.ParallelepipedalGuarantee, algos.SearchAlgorithm]:
+
+    guarantee  = psg.TopDistParallelGurantee(x_star, c_star, rad, delta, domain)
+    algo1      = palgos.TopDownSearch(isSAT, max_it, timeout, verbose)
+    algo2      = palgos.BottomUpGroupDFS(isSAT, int(rad/delta), timeout, verbose)
+    algo       = comp.ParallelAlgoComposition(algo1, algo2, isSAT, max_it, verbose)
+
+    return  guarantee, algo
+
+
 
 ##################
 # Cyclic Methods #
@@ -535,6 +572,10 @@ ctd_n_bu_bfs                = 18
 complete_bu                 = 19
 complete_c_d_bu             = 20
 
+## Group Testing Methods
+bottom_up_group_dfs         = 21
+td_n_bu_g_dfs               = 22
+
 ## Types, types, types.. types everywhere
 GuaranteeUnion_t    = typing.Union[
                                 csg.CyclicGuarantee,
@@ -590,5 +631,9 @@ init_method: typing.Dict[int, InitMethod_t] = {
 
     ## Algorithms for Complete Approximations
     complete_bu:                    init_complete_bu,
-    complete_c_d_bu:                init_complete_c_d_bu
+    complete_c_d_bu:                init_complete_c_d_bu,
+
+    ## Group Testing Methods
+    bottom_up_group_dfs:            init_bottom_up_group_dfs,
+    td_n_bu_g_dfs:                  init_td_n_bu_g_dfs
 }
\ No newline at end of file
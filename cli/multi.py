@@ -0,0 +1,169 @@
+###########################################################
+# cli.multi
+# --------------------------------------------------------
+# Multi-configuration certification of a single input.
+# Given the configurations
+#   <verif>:<method>:<rad>:<delta>,<verif>:<method>:...
+# (argument -cfg), every configuration is run on the same
+# x_star, c_star and network, concurrently, on a process
+# pool. The workers keep their verifiers warm between the
+# configurations (see cli.batch), and the results are
+# reported in a single table.
+#
+# The outputs of each configuration are stored under
+#   <path_header>/outputs/<outputs_subdir>/<tag>/
+# where <outputs_subdir> is the -od argument (if given) and
+# <tag> is <method>_<verif>_r<rad>_d<delta>.
+###########################################################
+
+## Typing
+import typing
+
+## Python Libraries
+import os
+import sys
+import concurrent.futures
+
+## Custom
+import cli.args as args
+import cli.batch as batch
+import cli.utils as utils
+import cli.error_handling as errors
+
+
+# (verifier arg, method arg, rad, delta)
+Configuration_t = typing.Tuple[str, str, float, float]
+
+
+####################
+# Helper Functions #
+####################
+def _init_worker():
+    # the report is printed by the main process
+    sys.stdout = sys.stderr
+
+
+def parse_configurations(configurations: str) -> typing.Union[typing.List[Configuration_t], None]:
+    """
+        #### Description:
+        Parses `<verif>:<method>:<rad>:<delta>,...`. Returns `None` if
+        the configurations are malformed.
+    """
+    parsed = []
+    for configuration in configurations.split(","):
+        fields = configuration.split(":")
+        if len(fields) != 4:                                    return None
+
+        verif, method, rad, delta = fields
+        if verif  not in args.args_verif.keys():                return None
+        if method not in args.args_algo.keys():                 return None
+        if not utils.isfloat(rad) or not utils.isfloat(delta):  return None
+        if float(delta) <= 0 or float(rad) <= float(delta):     return None
+
+        parsed.append((verif, method, float(rad), float(delta)))
+
+    return parsed
+
+
+def get_tag(configuration: Configuration_t) -> str:
+    verif, method, rad, delta = configuration
+    return f"{method}_{verif}_r{rad}_d{delta}"
+
+
+def configuration_argv(argv: typing.List[str], configuration: Configuration_t) -> typing.List[str]:
+    """
+        #### Description:
+        The command line of a single configuration, i.e. `argv` without
+        the -cfg argument, and with the verifier, method, radius, delta and
+        output arguments of the configuration.
+    """
+    verif, method, rad, delta = configuration
+    optional = args.cli_args[args.optional]
+
+    # drop the arguments set by the configuration
+    replaced = [optional[arg] for arg in [args.configs, args.verif, args.method, args.rad, args.delta, args.out_dir, args.trace]]
+    config_argv = []
+    ind = 0
+    while ind < len(argv):
+        if argv[ind] in replaced:   ind += 2
+        else:                       config_argv.append(argv[ind]); ind += 1
+
+    ## outputs of the configuration
+    tag     = get_tag(configuration)
+    out_dir = tag
+    if optional[args.out_dir] in argv:
+        out_dir = os.path.join(argv[argv.index(optional[args.out_dir]) + 1], tag)
+
+    config_argv += [
+        optional[args.verif],   verif,
+        optional[args.method],  method,
+        optional[args.rad],     str(rad),
+        optional[args.delta],   str(delta),
+        optional[args.out_dir], out_dir
+    ]
+
+    # one trace per configuration
+    if optional[args.trace] in argv:
+        root, ext = os.path.splitext(argv[argv.index(optional[args.trace]) + 1])
+        config_argv += [optional[args.trace], root + "_" + tag + ext]
+
+    return config_argv
+
+
+
+##################
+# Certification #
+##################
+def certify_configurations(
+        argv:           typing.List[str],
+        configurations: typing.List[Configuration_t],
+        max_workers:    int = None
+    ) -> typing.List[typing.Tuple[Configuration_t, int, typing.Union[list, None]]]:
+    """
+        #### Description:
+        Runs the `configurations` of the command line `argv` concurrently,
+        on at most `max_workers` processes (default: one per configuration,
+        up to the number of CPUs).
+
+        #### Output:
+        `(configuration, exit_code, simple_results)` for each configuration,
+        in the given order (see `cli.batch.run_instance()`).
+    """
+    if max_workers is None: max_workers = min(len(configurations), os.cpu_count() or 1)
+    assert max_workers > 0
+
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers = max_workers,
+            initializer = _init_worker
+        ) as executor:
+        futures = [
+            executor.submit(batch.run_instance, configuration_argv(argv, configuration))
+            for configuration in configurations
+        ]
+
+        results = []
+        for configuration, future in zip(configurations, futures):
+            try:                exit_code, simple_results = future.result()
+            except Exception:   exit_code, simple_results = errors.error_unkown_error, None
+
+            results.append((configuration, exit_code, simple_results))
+
+    return results
+
+
+def print_report(results: typing.List[typing.Tuple[Configuration_t, int, typing.Union[list, None]]]) -> None:
+    # the columns of Application.get_simple_results()
+    columns = ["Num. It.", "Time", "Comp.", "Min. Edge", "Verif. Time", "Verif. Calls", "Timeout"]
+
+    print("\n# Multi-Configuration Results")
+    print("=" * 150)
+    print(
+        f"{'Verif.':<16}{'Method':<20}{'Rad.':>8}{'Delta':>8}{'Exit':>6}"
+        + "".join(f"{column:>13}" for column in columns)
+    )
+    print("-" * 150)
+    for (verif, method, rad, delta), exit_code, simple_results in results:
+        row = f"{verif:<16}{method:<20}{rad:>8}{delta:>8}{exit_code:>6}"
+        if simple_results is None:  row += f"{'-':>13}" * len(columns)
+        else:                       row += "".join(f"{str(value):>13}" for value in simple_results)
+        print(row)
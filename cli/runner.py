@@ -5,6 +5,8 @@ import cli.error_handling as errors
 import cli.info as info
 
 import cli.application as app
+import cli.server as server
+import cli.multi as multi
 
 class Runner(loader.Loader):
     
@@ -21,6 +23,22 @@ class Runner(loader.Loader):
         info.print_header()
         help.help_screens[self[args.help]]()
 
+    ## Server Mode
+    def is_server(self):
+        return self[args.server] is not None
+    
+    def run_server(self):
+        server.Server(self[args.server]).serve()
+
+    ## Multi-Configuration Mode
+    def is_multi(self):
+        return self[args.configs] is not None
+
+    def run_multi(self):
+        configurations  = multi.parse_configurations(self[args.configs])
+        results         = multi.certify_configurations(self.argv, configurations)
+        multi.print_report(results)
+
     ## Algorithm Screens
     def is_run_algo(self):
         return not self[args.help] in self.argv
@@ -46,6 +64,10 @@ class Runner(loader.Loader):
             " ",
             self[args.lb_path],
             self[args.ub_path],
+            self[args.workers],
+            self[args.store],
+            self[args.trace],
+            self[args.harvest],
         )
 
         ## Header
@@ -78,6 +100,14 @@ class Runner(loader.Loader):
             self.print_help_screen()
             exit(errors.error_all_ok)
         
+        if self.is_server():
+            self.run_server()
+            exit(errors.error_all_ok)
+
+        if self.is_multi():
+            self.run_multi()
+            exit(errors.error_all_ok)
+
         if self.is_run_algo():
             self.run_algo()
             exit(errors.error_all_ok)
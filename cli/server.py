@@ -0,0 +1,172 @@
+###########################################################
+# cli.server
+# --------------------------------------------------------
+# The server (daemon) mode of parallelepipedonn.py.
+# Reads certification requests as JSON-lines from stdin,
+# runs them on a bounded pool of worker processes, and
+# streams back the results as JSON-lines to stdout.
+#
+# Each worker keeps its verifiers warm, i.e. a verifier is
+# built once per (verifier, c_star, onnx, domain) key of
+# the worker (see cli.batch).
+#
+# Request:
+#   {"id": <any>, "argv": ["-x", <x_star>.csv, "-c", <c_star>, "-nn", <onnx>, ...]}
+#   where "argv" are the usual command line arguments.
+#
+# Response:
+#   {"id": <any>, "exit_code": <int>, "results": [...], "lb": [[...]], "ub": [[...]]}
+#   where "results" are the values of the -sr (simple results)
+#   output. On error "results", "lb" and "ub" are null.
+###########################################################
+
+## Typing
+import typing
+
+## Python Libraries
+import sys
+import json
+import threading
+import concurrent.futures
+import concurrent.futures.process
+
+## Custom
+import cli.batch as batch
+import cli.error_handling as errors
+
+
+####################
+# Helper Functions #
+####################
+def _init_worker():
+    # stdout carries the responses, the workers'
+    # messages are redirected to stderr
+    sys.stdout = sys.stderr
+
+
+def to_json(value):
+    # numpy scalars and arrays
+    if hasattr(value, "tolist"): return value.tolist()
+    raise TypeError("Not JSON serializable: " + str(type(value)))
+
+
+
+##########
+# Server #
+##########
+class Server:
+    """
+        #### Description:
+        Serves the requests of `stream_in` on a pool of `num_workers` worker
+        processes. At most `max_pending` requests are in flight; reading
+        more requests waits until some of them are answered. The responses
+        are written to `stream_out` as they complete, hence not necessarily
+        in the requests' order (use the `id` field).
+
+        #### Notes:
+        A dead worker breaks the pool: the requests in flight on it are
+        answered with `error_unkown_error`, and the pool is recreated.
+    """
+
+    def __init__(self, num_workers: int, max_pending: int = None):
+        assert num_workers > 0
+        if max_pending is None: max_pending = 2 * num_workers
+        assert max_pending >= num_workers
+
+        self.num_workers    = num_workers
+        self.pending        = threading.BoundedSemaphore(max_pending)
+        self.output_lock    = threading.Lock()
+
+        ## Statistics
+        self.num_requests   = 0
+        self.num_errors     = 0
+        self.num_respawns   = 0
+
+        ## the worker pool, see serve()
+        self.executor       = None
+
+    ## I/O
+    def respond(self, stream_out: typing.TextIO, response: dict) -> None:
+        with self.output_lock:
+            stream_out.write(json.dumps(response, default=to_json) + "\n")
+            stream_out.flush()
+
+    def parse_request(self, line: str) -> typing.Union[dict, None]:
+        try:                        request = json.loads(line)
+        except json.JSONDecodeError: return None
+
+        if not isinstance(request, dict):       return None
+        if not isinstance(request.get("argv"), list): return None
+
+        return request
+
+    ## Operations
+    def new_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        return concurrent.futures.ProcessPoolExecutor(
+                max_workers = self.num_workers,
+                initializer = _init_worker
+            )
+
+    def submit(self, argv: typing.List[str]) -> concurrent.futures.Future:
+        # a dead worker (e.g. a segfault of Marabou, or the OOM killer)
+        # breaks the whole pool, the requests in flight are answered by
+        # done(), and the next ones go to a new pool
+        try:
+            return self.executor.submit(batch.certify, argv)
+        except concurrent.futures.process.BrokenProcessPool:
+            self.executor.shutdown(wait=False)
+            self.executor = self.new_executor()
+            self.num_respawns += 1
+
+            return self.executor.submit(batch.certify, argv)
+
+    def serve(self, stream_in: typing.TextIO = sys.stdin, stream_out: typing.TextIO = sys.stdout) -> None:
+        self.executor = self.new_executor()
+        try:
+            for line in stream_in:
+                if line.strip() == "": continue
+
+                self.num_requests += 1
+                request = self.parse_request(line)
+                if request is None:
+                    with self.output_lock: self.num_errors += 1
+                    self.respond(stream_out, {"id": None, "exit_code": errors.error_unkown_error, "error": "Malformed request"})
+                    continue
+
+                ## bounded number of requests in flight
+                self.pending.acquire()
+
+                # the worker's argv, as the command line's
+                argv        = ["parallelepipedonn.py"] + [str(arg) for arg in request["argv"]]
+                request_id  = request.get("id")
+                try:
+                    future = self.submit(argv)
+                except Exception as exception:
+                    # answer the request, even if the new pool fails too
+                    future = concurrent.futures.Future()
+                    future.set_exception(exception)
+
+                future.add_done_callback(
+                    lambda future, request_id=request_id: self.done(stream_out, request_id, future)
+                )
+        finally:
+            self.executor.shutdown(wait=True)
+
+    def done(self, stream_out: typing.TextIO, request_id, future: concurrent.futures.Future) -> None:
+        try:
+            exit_code, simple_results, interval = future.result()
+        except Exception:
+            exit_code, simple_results, interval = errors.error_unkown_error, None, None
+
+        if exit_code != errors.error_all_ok:
+            with self.output_lock: self.num_errors += 1
+
+        self.respond(stream_out, {
+            "id":           request_id,
+            "exit_code":    exit_code,
+            "results":      simple_results,
+            "lb":           None if interval is None else interval.lb,
+            "ub":           None if interval is None else interval.ub
+        })
+
+        self.pending.release()
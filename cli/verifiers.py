@@ -4,7 +4,12 @@ import sys
 sys.path.append('..')
 import geometry.interval as interval
 import verification.nn_verification as nn_verif
-import verification.marabou as marabou_verif
+
+# Marabou is loaded only when a verifier is built
+import cli.lazy as lazy
+marabou_verif   = lazy.LazyModule("verification.marabou")
+ibp_verif       = lazy.LazyModule("verification.ibp")
+attack_verif    = lazy.LazyModule("verification.attack")
 
 
 
@@ -30,13 +35,81 @@ def init_marabou_complete(
 
 
 
+def init_marabou_ibp(
+        c_star:             int,
+        model_path_onnx:    str,
+        domain:             interval.Interval,
+        epsilon:            int =1
+) -> nn_verif.NNVerification:
+    
+    return ibp_verif.IBPSoundVerifier(
+        marabou_verif.SoundMarabouVerifier(c_star, model_path_onnx, domain, epsilon)
+    )
+
+
+
+
+def init_marabou_hybrid(
+        c_star:             int,
+        model_path_onnx:    str,
+        domain:             interval.Interval,
+        epsilon:            int =1
+) -> nn_verif.NNVerification:
+    
+    return attack_verif.HybridSoundVerifier(
+        marabou_verif.SoundMarabouVerifier(c_star, model_path_onnx, domain, epsilon)
+    )
+
+
+
+
+def init_marabou_split(
+        c_star:             int,
+        model_path_onnx:    str,
+        domain:             interval.Interval,
+        epsilon:            int =1
+) -> nn_verif.NNVerification:
+    
+    return marabou_verif.SplitSoundMarabouVerifier(c_star, model_path_onnx, domain, epsilon)
+
+
+
+
+def init_marabou_complete_split(
+        c_star:             int,
+        model_path_onnx:    str,
+        domain:             interval.Interval,
+        epsilon:            int =1
+) -> nn_verif.NNVerification:
+    
+    return marabou_verif.SplitCompleteMarabouVerifier(c_star, model_path_onnx, domain, epsilon)
+
+
+
+
+def init_marabou_portfolio(
+        c_star:             int,
+        model_path_onnx:    str,
+        domain:             interval.Interval,
+        epsilon:            int =1
+) -> nn_verif.NNVerification:
+    
+    return marabou_verif.PortfolioSoundMarabouVerifier(c_star, model_path_onnx, domain, epsilon)
+
+
+
 #################
 # Verifiers Ids #
 #################
 
 # Marabou Verifiers
-marabou_sound       = 0
-marabou_complete    = 1
+marabou_sound          = 0
+marabou_complete       = 1
+marabou_ibp            = 2
+marabou_hybrid         = 3
+marabou_split          = 4
+marabou_complete_split = 5
+marabou_portfolio      = 6
 
 ## Types, types, types.. types everywhere
 InitMethod_t = typing.Callable[
@@ -50,6 +123,11 @@ InitMethod_t = typing.Callable[
             ]
 
 init_method: typing.Dict[int, InitMethod_t] = {
-    marabou_sound:      init_marabou_sound,
-    marabou_complete:   init_marabou_complete
+    marabou_sound:          init_marabou_sound,
+    marabou_complete:       init_marabou_complete,
+    marabou_ibp:            init_marabou_ibp,
+    marabou_hybrid:         init_marabou_hybrid,
+    marabou_split:          init_marabou_split,
+    marabou_complete_split: init_marabou_complete_split,
+    marabou_portfolio:      init_marabou_portfolio
 }
\ No newline at end of file
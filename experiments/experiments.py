@@ -4,6 +4,7 @@ import math
 import threading
 import os
 import subprocess
+import concurrent.futures
 from datetime import datetime
 
 # custom libraries
@@ -13,6 +14,7 @@ import cli.application as app
 import cli.methods as methods
 import cli.args as args
 import cli.verifiers as verifs
+import cli.batch as batch
 
 
 ## constants
@@ -142,6 +144,17 @@ class ResultsVector:
         lines   = res_vec_str.split("\n")
         tokens  = lines[0].split(" ")
         
+        self.set_values(tokens)
+
+    # the values of cli.application.Application.get_simple_results()
+    @classmethod
+    def from_values(cls, values):
+        res_vec = cls.__new__(cls)
+        res_vec.set_values(values)
+
+        return res_vec
+
+    def set_values(self, tokens):
         self.num_it             = int(tokens[0])
         self.time               = float(tokens[1])
         self.comp               = int(tokens[2])
@@ -175,7 +188,8 @@ class Experiments:
         dom_lb      = 0.0,              # instance domain
         dom_ub      = 1.0,
         res_log     = True,
-        err_log     = True
+        err_log     = True,
+        in_process  = False             # in-process workers, see cli.batch
     ):
 
         ## Preconditions
@@ -200,6 +214,7 @@ class Experiments:
         
         # Experimental parameters
         self.num_threads        = num_threads
+        self.in_process         = in_process
 
         # context
         self.method_pfx         = method_pfx
@@ -353,11 +368,15 @@ class Experiments:
         ## Precondition
         assert self.experiments_performed == False
 
-        ## Start Workers
-        for worker in self.workers: worker.start()
+        if self.in_process:
+            self._do_experiments_in_process()
+        
+        else:
+            ## Start Workers
+            for worker in self.workers: worker.start()
 
-        ## Wait for them to finish
-        for worker in self.workers: worker.join()
+            ## Wait for them to finish
+            for worker in self.workers: worker.join()
 
         ## Postcondition
         self.experiments_performed = True
@@ -432,6 +451,34 @@ class Experiments:
             self.results_lock.release()
     
 
+    # perform the experiments in a pool of worker processes,
+    # each one re-using its verifiers (see cli.batch)
+    def _do_experiments_in_process(self):
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.num_threads) as executor:
+            futures = {
+                executor.submit(batch.run_instance, arg_vec.get_argv_list()): arg_vec
+                for arg_vec in self.experiments
+            }
+            self.experiments = []
+
+            for future in concurrent.futures.as_completed(futures):
+                arg_vec = futures[future]
+                exit_code, values = future.result()
+
+                # some I/O
+                print("Done:", arg_vec.x_star_path, "exit code:", exit_code)
+
+                if exit_code != 0:
+                    self.exit_codes.append((arg_vec.x_star_path, exit_code))
+                    continue
+
+                res_vec = ResultsVector.from_values(values)
+                if self.res_log:
+                    self.writeln_res_log(arg_vec.x_star_path + " " + " ".join([str(val) for val in values]) + "\n")
+                
+                self.results.append(res_vec)
+
+
     ## Statistics
     def calculate_statistics(self):
         #assert self.check_exit_codes()
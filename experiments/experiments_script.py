@@ -7,7 +7,9 @@
 # and the guarantees Min. Edge Length. For all these
 # metrics we report the max, min, avg and variance values.
 #
-# Calls the experiments.Experiments class.
+# Calls the experiments.Experiments class, with in-process
+# workers (see cli.batch), i.e. each worker process builds
+# its verifiers once, and re-uses them for all its inputs.
 #
 # Input:
 #   1. A path to the input data directory
@@ -90,7 +92,8 @@ if __name__=="__main__":
         method,
         max_it,
         timeout,
-        bounds_dir
+        bounds_dir,
+        in_process = True
     )
 
     exps.do_experiments()
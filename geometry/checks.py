@@ -0,0 +1,32 @@
+###########################################################
+# geometry.checks
+# --------------------------------------------------------
+# The invariant checks of the geometry (and guarantee)
+# operations, e.g. `lb <= ub` after every update. These
+# are O(d) per operation, so they are *off* by default
+# (fast mode) and meant for debugging (checked mode).
+#
+# Switch at runtime with `enable()`/`disable()`, or start
+# in checked mode with the environment variable:
+#   PARALLELEPIPEDONN_CHECKS=1
+###########################################################
+
+## Python Libraries
+import os
+
+
+enabled = os.environ.get("PARALLELEPIPEDONN_CHECKS", "0") == "1"
+
+
+def enable() -> None:
+    global enabled
+    enabled = True
+
+
+def disable() -> None:
+    global enabled
+    enabled = False
+
+
+def is_enabled() -> bool:
+    return enabled
@@ -14,6 +14,7 @@ import numpy as np
 # custom libraries
 from geometry.norms import inf_norm
 from geometry.constants import epsilon
+import geometry.checks as checks
 
 
 ###########################################################
@@ -25,11 +26,12 @@ from geometry.constants import epsilon
 # in each subclass.
 ###########################################################
 class Interval:
+    __slots__ = ("row_dim", "column_dim", "dim", "lb", "ub")
 
     ## Constructor
     def __init__(self, lb, ub):
         assert lb.shape == ub.shape
-        assert (lb <= ub).all()
+        if checks.enabled: assert (lb <= ub).all()
 
         ## Get dimenstions
         self.row_dim    = lb.shape[0]
@@ -59,20 +61,22 @@ class Interval:
 
     ## Mutators
     def update_lb(self, ind, val):
-        assert 0 <= ind[0] and ind[0] <= self.row_dim
-        assert 0 <= ind[1] and ind[1] <= self.column_dim
+        if checks.enabled:
+            assert 0 <= ind[0] and ind[0] <= self.row_dim
+            assert 0 <= ind[1] and ind[1] <= self.column_dim
 
         self.lb[ind] = val
 
-        assert self.inequality_consistency(ind)
+        if checks.enabled: assert self.inequality_consistency(ind)
     
     def update_ub(self, ind, val):
-        assert 0 <= ind[0] and ind[0] <= self.row_dim
-        assert 0 <= ind[1] and ind[1] <= self.column_dim
+        if checks.enabled:
+            assert 0 <= ind[0] and ind[0] <= self.row_dim
+            assert 0 <= ind[1] and ind[1] <= self.column_dim
 
         self.ub[ind] = val
 
-        assert self.inequality_consistency(ind)
+        if checks.enabled: assert self.inequality_consistency(ind)
     
 
     ## Interval Algebra
@@ -96,26 +100,26 @@ class Interval:
         ## Preconditions
         assert self.row_dim     == interval.row_dim
         assert self.column_dim  == interval.column_dim
-        assert (interval.ub >= interval.lb).all()
+        if checks.enabled: assert (interval.ub >= interval.lb).all()
 
         self.lb = np.maximum(self.lb, interval.lb)
         self.ub = np.minimum(self.ub, interval.ub)
 
         ## Postcondition
-        assert self.inequalities_consistency()
+        if checks.enabled: assert self.inequalities_consistency()
     
     ## self <-- self \sqcup interval
     def concatenate(self, interval):
         ## Preconditions
         assert self.row_dim     == interval.row_dim
         assert self.column_dim  == interval.column_dim
-        assert (interval.ub >= interval.lb).all()
+        if checks.enabled: assert (interval.ub >= interval.lb).all()
 
         self.lb = np.minimum(self.lb, interval.lb)
         self.ub = np.maximum(self.ub, interval.ub)
 
         ## Postcondition
-        assert self.inequalities_consistency()
+        if checks.enabled: assert self.inequalities_consistency()
 
 
     # Minkowski sum
@@ -8,11 +8,71 @@ import sys
 #sys.path.append('..')
 import geometry.interval as interval
 import geometry.circle as circle
+import geometry.checks as checks
 #from geometry.constants import epsilon
 
 ## 3rd party libraries
 import numpy as np
 
+
+##########
+# Layout #
+##########
+# The bounds of a guarantee, and the ones of its two pivots,
+# are the slices of a single contiguous (6, row_dim, column_dim)
+# array:
+LB          = 0     # the guarantee [lb, ub]
+UB          = 1
+LOW_LB      = 2     # low_pivot
+LOW_UB      = 3
+HIGH_LB     = 4     # high_pivot
+HIGH_UB     = 5
+
+num_slices  = 6
+
+
+
+class PivotView:
+    """
+        #### Description:
+        An in-place view of one of the pivots of a guarantee, i.e. of two
+        slices of its bounds. Writes go to the guarantee's bounds.
+    """
+    __slots__ = ("guarantee", "lb_slice", "ub_slice")
+
+    def __init__(self, guarantee, lb_slice: int, ub_slice: int):
+        self.guarantee  = guarantee
+        self.lb_slice   = lb_slice
+        self.ub_slice   = ub_slice
+
+    @property
+    def lb(self) -> np.ndarray:
+        return self.guarantee.writable_bounds()[self.lb_slice]
+
+    @lb.setter
+    def lb(self, value: np.ndarray) -> None:
+        self.guarantee.writable_bounds()[self.lb_slice] = value
+
+    @property
+    def ub(self) -> np.ndarray:
+        return self.guarantee.writable_bounds()[self.ub_slice]
+
+    @ub.setter
+    def ub(self, value: np.ndarray) -> None:
+        self.guarantee.writable_bounds()[self.ub_slice] = value
+
+    def __copy__(self):
+        return interval.Interval(self.lb.copy(), self.ub.copy())
+
+    ## Invariant Concistency
+    def inequality_consistency(self, ind):
+        return self.ub[ind] >= self.lb[ind]
+
+    def inequalities_consistency(self):
+        return (self.ub >= self.lb).all()
+
+
+
 class ParallelepipedalGuarantee(interval.Interval):
     """
         #### Description:
@@ -28,7 +88,18 @@ class ParallelepipedalGuarantee(interval.Interval):
         * `expand_lb(i, j)`: Expand by delta only the (i,j)-th coordinate of lb.
         * `revert_expand_ub(i, j)`: Reduces by delta the (i, j)-th coordinate of ub.
         * `revert_expand_lb(i, j)`: Reduces by delta the (i, j)-th coordinate of lb.
+
+        #### Memory Layout:
+        * `lb`, `ub`, `low_pivot` and `high_pivot` are in-place views of a
+        single contiguous `(6, row_dim, column_dim)` array (see `Layout`).
+        * `copy()` is a *copy-on-write* snapshot: the copy shares the array,
+        which is copied once, on the first access to the bounds by any of
+        the sharing guarantees that is still alive.
     """
+    __slots__ = (
+        "domain", "x_star", "c_star", "delta",
+        "bounds", "num_sharing"
+    )
 
     ###############
     # Constructor #
@@ -41,6 +112,10 @@ class ParallelepipedalGuarantee(interval.Interval):
             delta:  float,
             domain: interval.Interval # an interval
         ) -> None:
+        ## The bounds' array
+        self.bounds         = np.empty((num_slices,) + x_star.shape)
+        self.num_sharing    = [1]   # shared between the copies
+
         ## Initializing super-class with the whole IR^d
         interval.Interval.__init__(self, -np.inf * np.ones(x_star.shape), np.inf * np.ones(x_star.shape))
         assert x_star in domain
@@ -56,28 +131,98 @@ class ParallelepipedalGuarantee(interval.Interval):
 
 
         ## ONLY for dichotomic search
-        self.high_pivot = interval.Interval(self.x_star.copy(), self.domain.ub.copy())
-        self.low_pivot  = interval.Interval(self.domain.lb.copy(), self.x_star.copy())
+        self.bounds[HIGH_LB]    = self.x_star
+        self.bounds[HIGH_UB]    = self.domain.ub
+        self.bounds[LOW_LB]     = self.domain.lb
+        self.bounds[LOW_UB]     = self.x_star
     
 
-    # Copy constructor
+    # Copy constructor, copy-on-write
     def __copy__(self):
-        guarantee = ParallelepipedalGuarantee(
-            self.x_star,
-            self.c_star,
-            self.delta,
-            self.domain
-        )
-
-        guarantee.ub = self.ub.copy()
-        guarantee.lb = self.lb.copy()
+        guarantee = type(self).__new__(type(self))
+        for name in self.state_names():
+            setattr(guarantee, name, getattr(self, name))
 
-        ## Dichotomic search
-        guarantee.high_pivot = copy(self.high_pivot)
-        guarantee.low_pivot = copy(self.low_pivot)
+        self.num_sharing[0] += 1
+        guarantee.bounds        = self.bounds
+        guarantee.num_sharing   = self.num_sharing
 
         return guarantee
 
+    def __del__(self):
+        try:                    self.num_sharing[0] -= 1
+        except AttributeError:  pass
+
+    ## Pickling (and deepcopy), without the sharing
+    @classmethod
+    def state_names(cls) -> typing.List[str]:
+        return [
+            name    for klass in cls.__mro__
+                    for name in getattr(klass, "__slots__", ())
+                    if name not in ("lb", "ub", "bounds", "num_sharing")
+        ]
+
+    def __getstate__(self) -> dict:
+        state = {name: getattr(self, name) for name in self.state_names()}
+        state["bounds"] = self.bounds
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        self.bounds         = self.bounds.copy()
+        self.num_sharing    = [1]
+
+
+    #################
+    # Bounds' Views #
+    #################
+
+    def writable_bounds(self) -> np.ndarray:
+        # copy-on-write
+        if self.num_sharing[0] > 1:
+            self.num_sharing[0] -= 1
+            self.bounds         = self.bounds.copy()
+            self.num_sharing    = [1]
+
+        return self.bounds
+
+    @property
+    def lb(self) -> np.ndarray:
+        return self.writable_bounds()[LB]
+
+    @lb.setter
+    def lb(self, value: np.ndarray) -> None:
+        self.writable_bounds()[LB] = value
+
+    @property
+    def ub(self) -> np.ndarray:
+        return self.writable_bounds()[UB]
+
+    @ub.setter
+    def ub(self, value: np.ndarray) -> None:
+        self.writable_bounds()[UB] = value
+
+    @property
+    def low_pivot(self) -> PivotView:
+        return PivotView(self, LOW_LB, LOW_UB)
+
+    @low_pivot.setter
+    def low_pivot(self, pivot: interval.Interval) -> None:
+        self.writable_bounds()[LOW_LB] = pivot.lb
+        self.writable_bounds()[LOW_UB] = pivot.ub
+
+    @property
+    def high_pivot(self) -> PivotView:
+        return PivotView(self, HIGH_LB, HIGH_UB)
+
+    @high_pivot.setter
+    def high_pivot(self, pivot: interval.Interval) -> None:
+        self.writable_bounds()[HIGH_LB] = pivot.lb
+        self.writable_bounds()[HIGH_UB] = pivot.ub
+
     
     ############
     # Mutators #
@@ -99,7 +244,7 @@ class ParallelepipedalGuarantee(interval.Interval):
             assert (new_lb <= self.x_star).all()
             assert (self.domain.lb <= new_lb).all()
 
-            self.lb = new_lb.copy()
+            self.lb = new_lb
             lb_set  = True
         
 
@@ -109,7 +254,7 @@ class ParallelepipedalGuarantee(interval.Interval):
             assert (self.x_star <= new_ub).all()
             assert (new_ub <= self.domain.ub).all()
 
-            self.ub = new_ub.copy()
+            self.ub = new_ub
             ub_set  = True
         
         ## When changing bounds we NEED to update the pivots!
@@ -138,9 +283,10 @@ class ParallelepipedalGuarantee(interval.Interval):
 
     # Refine explanation, given a counter example
     def constrain(self, witness: np.ndarray) -> bool:
-        assert witness in self
         ## Sanity check
-        old_potential = self.calc_potential()
+        if checks.enabled:
+            assert witness in self
+            old_potential = self.calc_potential()
 
         ind, update_ub = self.select_inequality(witness)
 
@@ -159,20 +305,48 @@ class ParallelepipedalGuarantee(interval.Interval):
             )
         
         ## Sanity check
-        new_potential = self.calc_potential()
-        assert old_potential - new_potential > 0
+        if checks.enabled:
+            new_potential = self.calc_potential()
+            assert old_potential - new_potential > 0
         
         
         ## Constrain successful
         return True
 
+    # Refine explanation, given the cuts of a harvested
+    # counterexample (see verification.harvesting)
+    def constrain_cuts(self, cuts: list) -> bool:
+        ## Sanity check
+        if checks.enabled:
+            old_potential = self.calc_potential()
+
+        num_cuts = 0
+        for ind, update_ub, value in cuts:
+            # cuts crossing x_star are skipped
+            if update_ub:
+                if value - self.delta < self.x_star[ind]: continue
+                self.update_ub(ind, value - self.delta)
+            else:
+                if value + self.delta > self.x_star[ind]: continue
+                self.update_lb(ind, value + self.delta)
+            num_cuts += 1
+
+        ## Sanity check
+        if checks.enabled and num_cuts > 0:
+            new_potential = self.calc_potential()
+            assert old_potential - new_potential >= 0
+
+        ## Constrain successful
+        return num_cuts > 0
+
     ##################################
     # Sequential Generalization Algo #
     ##################################
     def generalize(self, witness: np.ndarray) -> bool:
-        assert not (witness in self)
         ## Sanity check
-        old_potential = self.calc_potential()
+        if checks.enabled:
+            assert not (witness in self)
+            old_potential = self.calc_potential()
 
 
         witness_interval = interval.Interval(
@@ -187,8 +361,9 @@ class ParallelepipedalGuarantee(interval.Interval):
         self.concatenate(witness_interval)
         
         ## Sanity check
-        new_potential = self.calc_potential()
-        assert new_potential - old_potential > 0
+        if checks.enabled:
+            new_potential = self.calc_potential()
+            assert new_potential - old_potential > 0
         
         ## Constrain successful
         return not self.includes(self.domain)
@@ -452,16 +627,20 @@ class ParallelepipedalGuarantee(interval.Interval):
     #   [lb, ub] = [low_pivot.ub, high_pivot.lb]
     ###########################################################
     def make_sound(self):
-        self.ub = self.high_pivot.lb.copy()
-        self.lb = self.low_pivot.ub.copy()
+        bounds      = self.writable_bounds()
+        bounds[UB]  = bounds[HIGH_LB]
+        bounds[LB]  = bounds[LOW_UB]
     
     ## For algorithm composition
     # before passing the explanation from the top-down
     # algorithm to the bottom-up, we need to update the
     # pivots
     def update_pivots(self):
-        self.high_pivot = interval.Interval(self.ub.copy(), self.domain.ub.copy())
-        self.low_pivot  = interval.Interval(self.domain.lb.copy(), self.lb.copy())
+        bounds          = self.writable_bounds()
+        bounds[HIGH_LB] = bounds[UB]
+        bounds[HIGH_UB] = self.domain.ub
+        bounds[LOW_LB]  = self.domain.lb
+        bounds[LOW_UB]  = bounds[LB]
 
     
     ###########
@@ -475,6 +654,8 @@ class ParallelepipedalGuarantee(interval.Interval):
 
 
 class TopParallelGuarantee(ParallelepipedalGuarantee):
+    __slots__ = ()
+
     ## Constructor
     def __init__(
             self,
@@ -493,6 +674,8 @@ class TopParallelGuarantee(ParallelepipedalGuarantee):
 
 
 class BottomParallelGurantee(ParallelepipedalGuarantee):
+    __slots__ = ()
+
     ## Constructor
     def __init__(
             self,
@@ -514,6 +697,8 @@ class BottomParallelGurantee(ParallelepipedalGuarantee):
 # Distance Inflated #
 #####################
 class DistParallelGurantee(ParallelepipedalGuarantee):
+    __slots__ = ("radius",)
+
     ## Constructor
     def __init__(
             self,
@@ -538,6 +723,8 @@ class DistParallelGurantee(ParallelepipedalGuarantee):
 
 
 class TopDistParallelGurantee(DistParallelGurantee):
+    __slots__ = ()
+
     ## Constructor
     def __init__(
             self,
@@ -556,6 +743,8 @@ class TopDistParallelGurantee(DistParallelGurantee):
 
 
 class BottomDistParallelGurantee(DistParallelGurantee):
+    __slots__ = ()
+
     ## Constructor
     def __init__(
             self,
@@ -2,7 +2,11 @@
 import numpy as np
 
 ## custom libraries
+import sys
+sys.path.append('..')
+import montecarlo.utilities as mc
 
+from geometry.constants import epsilon
 
 
 
@@ -45,16 +49,13 @@ class Sampler(dict):
     def sample_uniform(self):
         assert self.distribution == uniform
 
-        for i in range(self.num_samples):
-            # pick a random point ~ normal distribution
-            X = np.random.uniform(self.domain.lb, self.domain.ub)
+        for n in mc.chunks(self.num_samples):
+            # pick random points ~ uniform distribution
+            X = mc.uniform_samples(self.domain.lb, self.domain.ub, n)
             
-            # get the class of the random point
-            c = self.nn_model.predict_argmax(X)[0]
-
-            # sort the random poitn to the dictionary
-            if c not in self.keys():    self[c] = [X]
-            else:                       self[c].append(X)
+            # get the classes of the random points
+            # and sort them to the dictionary
+            self.sort(X, mc.classify_batch(self.nn_model, X))
     
 
     def sample_gaussian(self):
@@ -64,23 +65,29 @@ class Sampler(dict):
         sigma = self.domain.get_diameter() / 100
         print(sigma)
 
-        for i in range(self.num_samples):
-            # pick a random point ~ normal distribution
-            X = np.random.normal(self.x_star, (sigma**2) * np.ones([self.row_dim, self.column_dim]))
+        for n in mc.chunks(self.num_samples):
+            # pick random points ~ normal distribution
+            X = np.random.normal(self.x_star, sigma**2, (n, self.row_dim, self.column_dim))
             X = np.abs(X)
             # we skip points outside of the domain
-            if X not in self.domain: continue
+            X = X[
+                ((X - self.domain.lb >= -epsilon) & (self.domain.ub - X >= -epsilon)).all(axis=(1, 2))
+            ]
+            if len(X) == 0: continue
             
-            # get the class of the random point
-            c = self.nn_model.predict_argmax(X)[0]
-
-            # sort the random poitn to the dictionary
-            if c not in self.keys():    self[c] = [X]
-            else:                       self[c].append(X)
+            # get the classes of the random points
+            # and sort them to the dictionary
+            self.sort(X, mc.classify_batch(self.nn_model, X))
 
             #print(self)
     
 
+    def sort(self, X, classes):
+        for x, c in zip(X, classes):
+            if c not in self.keys():    self[c] = [x]
+            else:                       self[c].append(x)
+    
+
 
     ## debug
     def class_sizes(self):
@@ -6,41 +6,90 @@ import typing
 import sys
 sys.path.append('..')
 
-import neural_network as nn
+# NOTE: neural_network is needed only for the (commented out)
+# type hints below, and importing it pulls in TensorFlow.
+#import neural_network as nn
 import verification.nn_verification as nn_verif
 import geometry.interval as interv
 
+from geometry.constants import epsilon
 
 
-def get_random_vertex(
-        lb  : np.ndarray,
-        ub  : np.ndarray
+###########
+# Batches #
+###########
+# The samples are drawn and classified in chunks of (at most)
+# `chunk_size` samples, i.e. one forward pass per chunk. Hence,
+# the memory stays bounded, for any number of samples.
+chunk_size = 1000
+
+def chunks(num_samples: int, chunk_size: int = chunk_size) -> typing.Iterator[int]:
+    """
+        #### Description:
+        Yields the sizes of the chunks, covering `num_samples` samples.
+    """
+    assert chunk_size > 0
+
+    for start in range(0, num_samples, chunk_size):
+        yield min(chunk_size, num_samples - start)
+
+
+def classify_batch(
+        #nn_model    : typing.Union[nn.MNISTNeuralNetwork, nn_verif.NNVerification],
+        nn_model,
+        X           : np.ndarray
     ) -> np.ndarray:
     """
         #### Description:
-        Returns a *random* vertex of the `[lb, ub]` parallelepiped. Let `vertex` be
-        a vertex. Then, the i-th coordinate is either `vertex_i = lb_i`, or
-        `vertex_i = ub_i`. To make the latter choice each time we toss a coin.
+        Returns the classes of the samples in `X`, an `(N, row_dim, column_dim)`
+        array. If `nn_model` has the `predict_argmax_batch()` method, we classify
+        all the samples with a single forward pass, else one sample at a time.
     """
+    if hasattr(nn_model, "predict_argmax_batch"):
+        return nn_model.predict_argmax_batch(X)[0]
+
+    return np.array([nn_model.predict_argmax(x)[0] for x in X], dtype=int)
+
+
+def uniform_samples(
+        lb          : np.ndarray,
+        ub          : np.ndarray,
+        num_samples : int
+    ) -> np.ndarray:
+    return np.random.uniform(lb, ub, (num_samples,) + lb.shape)
+
 
+def get_random_vertices(
+        lb          : np.ndarray,
+        ub          : np.ndarray,
+        num_samples : int
+    ) -> np.ndarray:
+    """
+        #### Description:
+        Returns `num_samples` random vertices of the `[lb, ub]` parallelepiped,
+        as an `(num_samples, row_dim, column_dim)` array. See `get_random_vertex()`.
+    """
     assert lb.shape == ub.shape
 
-    row_dim     = lb.shape[0]
-    column_dim  = lb.shape[1]
-    dim         = row_dim * column_dim
+    # toss a coin for each coordinate of each vertex
+    r = np.random.randint(0, 2, (num_samples,) + lb.shape)
 
-    flat_lb = lb.flatten()
-    flat_ub = ub.flatten()
+    return np.where(r == 1, lb, ub)
 
-    # create a random binary vector
-    r = np.random.randint(np.zeros(dim), 2 * np.ones(dim))
-    R = np.diag(r)
-    I = np.eye(dim)
 
-    flat_vertex = np.matmul(R, flat_lb) + np.matmul((I - R), flat_ub)
-    vertex      = flat_vertex.reshape([row_dim, column_dim])
 
-    return vertex
+def get_random_vertex(
+        lb  : np.ndarray,
+        ub  : np.ndarray
+    ) -> np.ndarray:
+    """
+        #### Description:
+        Returns a *random* vertex of the `[lb, ub]` parallelepiped. Let `vertex` be
+        a vertex. Then, the i-th coordinate is either `vertex_i = lb_i`, or
+        `vertex_i = ub_i`. To make the latter choice each time we toss a coin.
+    """
+
+    return get_random_vertices(lb, ub, 1)[0]
 
 
 
@@ -56,7 +105,8 @@ def adversarial_attack(
         nn_model,
         c_star      : int,
         num_samples : int = 1000,
-        p           : float = 0.0
+        p           : float = 0.0,
+        chunk_size  : int = chunk_size
     ) -> typing.Union[np.ndarray, None]:
     """
         #### Description:
@@ -66,6 +116,10 @@ def adversarial_attack(
         the parallelepiped `[lb, ub]`. The later choice is made by tossing a coin.
         the parameter `p` denotes the probability that a samples comes from the
         parallelepiped's vertices.
+
+        #### Notes:
+        The samples are classified in chunks, see `classify_batch()`. We return
+        the first counterexample of the first chunk that contains one.
     """
 
     assert lb.shape == ub.shape
@@ -74,14 +128,17 @@ def adversarial_attack(
     #if c_star != nn_model.predict_argmax(lb)[0]: return lb
     #if c_star != nn_model.predict_argmax(ub)[0]: return ub
 
-    for i in range(num_samples):
-        # Toss a coin to get either a random vertex or a uniformly
+    for n in chunks(num_samples, chunk_size):
+        # Toss a coin (per sample) to get either a random vertex or a uniformly
         # distributed interior point
-        if np.random.binomial(1, p) == 1:   X = get_random_vertex(lb, ub)
-        else:                               X = np.random.uniform(lb, ub)
-        y, _ = nn_model.predict_argmax(X)
+        X       = uniform_samples(lb, ub, n)
+        coins   = np.random.binomial(1, p, n) == 1
+        if coins.any(): X[coins] = get_random_vertices(lb, ub, np.sum(coins))
 
-        if c_star != y: return X
+        y = classify_batch(nn_model, X)
+
+        counterexamples = np.nonzero(y != c_star)[0]
+        if counterexamples.size > 0: return X[counterexamples[0]]
     
     return None
 
@@ -93,7 +150,8 @@ def fidelity(
         #nn_model    : typing.Union[nn.MNISTNeuralNetwork, nn_verif.NNVerification],
         nn_model,
         c_star      :int,
-        num_samples :int =1000
+        num_samples :int =1000,
+        chunk_size  :int =chunk_size
     ) -> float:
 
     """
@@ -129,10 +187,10 @@ def fidelity(
     assert lb.shape == ub.shape
 
     hits = 0
-    for i in range(num_samples):
-        X = np.random.uniform(lb, ub)
-        y, _ = nn_model.predict_argmax(X)
-        if c_star == y: hits += 1
+    for n in chunks(num_samples, chunk_size):
+        X = uniform_samples(lb, ub, n)
+        y = classify_batch(nn_model, X)
+        hits += np.sum(y == c_star)
     
     return hits/num_samples
 
@@ -140,7 +198,8 @@ def fidelity(
 def volume_approximation(
         interval    :interv.Interval,
         domain      :interv.Interval,
-        num_samples :int =1_000_000
+        num_samples :int =1_000_000,
+        chunk_size  :int =chunk_size
     ) -> float:
 
     """
@@ -164,9 +223,12 @@ def volume_approximation(
     """
 
     hits = 0
-    for i in range(num_samples):
-        X = np.random.uniform(domain.lb, domain.ub)
-        if X in interval: hits += 1
+    for n in chunks(num_samples, chunk_size):
+        X = uniform_samples(domain.lb, domain.ub, n)
+        # same as `X in interval`, for each sample
+        hits += np.sum(
+            ((X - interval.lb >= -epsilon) & (interval.ub - X >= -epsilon)).all(axis=(1, 2))
+        )
     
     return hits/num_samples
 
@@ -177,7 +239,8 @@ def noise_analysis(
         #nn_model    : typing.Union[nn.MNISTNeuralNetwork, nn_verif.NNVerification],
         nn_model,
         num_classes : int,
-        num_samples : int = 1000
+        num_samples : int = 1000,
+        chunk_size  : int = chunk_size
     ):
     """
         #### Description:
@@ -189,11 +252,11 @@ def noise_analysis(
     histogram = np.zeros(num_classes)
 
     samples = []
-    for i in range(num_samples):
-        X = np.random.uniform(lb, ub)
-        samples.append(X)
-        prediction = nn_model.predict_argmax(X)[0]
-        histogram[prediction] += 1
+    for n in chunks(num_samples, chunk_size):
+        X = uniform_samples(lb, ub, n)
+        samples.extend(X)
+        predictions = classify_batch(nn_model, X)
+        histogram  += np.bincount(predictions, minlength=num_classes)
     
     return histogram, samples
 
@@ -205,7 +268,8 @@ def evaluate(
         X           : np.ndarray,
         Y           : np.ndarray,
         shuffle     : bool  = False,
-        num_samples : int   = 1000
+        num_samples : int   = 1000,
+        chunk_size  : int   = chunk_size
     ):
     """
         #### Description:
@@ -222,10 +286,11 @@ def evaluate(
     if shuffle: np.random.shuffle(sample_indices)
     predicted_labels = []
     hits = 0
-    for ind in sample_indices:
-        prediction, _ = nn_model.predict_argmax(X[ind, :])
-        predicted_labels.append(prediction)
-        if prediction == Y[ind]: hits += 1
+    for start in range(0, num_samples, chunk_size):
+        indices     = sample_indices[start:start + chunk_size]
+        predictions = classify_batch(nn_model, X[indices])
+        predicted_labels.extend(predictions.tolist())
+        hits += np.sum(predictions == Y[indices])
     
     accuracy = hits/num_samples
     
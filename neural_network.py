@@ -301,6 +301,22 @@ class MNISTNeuralNetwork:
         prediction_class    = np.argmax(predictions_vector)
         prediction_value    = predictions_vector[prediction_class]
         return prediction_class, prediction_value
+
+    ## Batches
+    # X is an (N, 28, 28) array, i.e. N points
+    def predict_batch(self, X):
+        assert self.init_completed()
+
+        predictions = self.model(X.reshape([-1, 28, 28]))
+        return predictions.numpy()
+    
+    def predict_argmax_batch(self, X):
+        assert self.init_completed()
+
+        predictions_vectors = self.predict_batch(X)
+        prediction_classes  = np.argmax(predictions_vectors, axis=1)
+        prediction_values   = predictions_vectors[np.arange(len(prediction_classes)), prediction_classes]
+        return prediction_classes, prediction_values
     
     ##########
     # Export #
@@ -0,0 +1,173 @@
+#################################################
+# Testing the WitnessCache and SafeBoxCache of
+# the ../verification/caches.py file
+#################################################
+
+#############
+# Libraries #
+#############
+
+## Python libraries
+# Importing parent directory class
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+## 3rd party libraries
+import numpy as np
+
+## Custom libraries
+import geometry.interval as interval
+import verification.caches as caches
+
+
+############
+# Constant #
+############
+row_dim     = 4
+column_dim  = 3
+num_boxes   = 200
+seed        = 0
+
+
+####################
+# Helper Functions #
+####################
+def random_box(rng: np.random.Generator) -> interval.Interval:
+    corners = rng.random((2, row_dim, column_dim))
+    return interval.Interval(corners.min(axis=0), corners.max(axis=0))
+
+
+def is_subbox(inner: interval.Interval, outer: interval.Interval) -> bool:
+    return (outer.lb <= inner.lb).all() and (inner.ub <= outer.ub).all()
+
+
+
+#########
+# Tests #
+#########
+def test_witness_cache_inside():
+    rng     = np.random.default_rng(seed)
+    cache   = caches.WitnessCache(row_dim, column_dim, True)
+
+    witnesses = rng.random((10, row_dim, column_dim))
+    for witness in witnesses: cache.add(witness)
+
+    for _ in range(num_boxes):
+        bounds  = random_box(rng)
+        witness = cache.find(bounds)
+
+        # a hit is a stored witness inside the bounds,
+        # and a miss means that there is none
+        inside = [w for w in witnesses if w in bounds]
+        if witness is None: assert len(inside) == 0
+        else:               assert witness in bounds and any((witness == w).all() for w in inside)
+
+
+def test_witness_cache_outside():
+    rng     = np.random.default_rng(seed)
+    cache   = caches.WitnessCache(row_dim, column_dim, False)
+
+    witnesses = rng.random((10, row_dim, column_dim))
+    for witness in witnesses: cache.add(witness)
+
+    for _ in range(num_boxes):
+        bounds  = random_box(rng)
+        witness = cache.find(bounds)
+
+        outside = [w for w in witnesses if not (w in bounds)]
+        if witness is None: assert len(outside) == 0
+        else:               assert not (witness in bounds) and any((witness == w).all() for w in outside)
+
+
+def test_witness_cache_margin():
+    # the complete verifier's witnesses are at least margin outside the bounds
+    margin  = 0.1
+    cache   = caches.WitnessCache(row_dim, column_dim, False, margin=margin)
+    lb      = np.full((row_dim, column_dim), 0.4)
+    ub      = np.full((row_dim, column_dim), 0.6)
+
+    near    = ub.copy()
+    near[0, 0] += margin / 2
+    cache.add(near)
+    assert cache.find(interval.Interval(lb, ub)) is None
+
+    far     = ub.copy()
+    far[0, 0] += 2 * margin
+    cache.add(far)
+    assert (cache.find(interval.Interval(lb, ub)) == far).all()
+
+    # the bounds grow towards the witness
+    assert cache.find(interval.Interval(lb, far - margin / 2)) is None
+
+
+def test_safe_box_cache_monotonicity():
+    rng = np.random.default_rng(seed)
+
+    for inside in [True, False]:
+        cache   = caches.SafeBoxCache(row_dim, column_dim, inside)
+        boxes   = [random_box(rng) for _ in range(10)]
+        for box in boxes: cache.add(box)
+
+        for box in boxes:
+            ## a stored box is a hit
+            assert cache.find(box)
+
+            ## a sub-box (resp. super-box) is a hit
+            center  = (box.lb + box.ub) / 2
+            inner   = interval.Interval((box.lb + center) / 2, (box.ub + center) / 2)
+            outer   = interval.Interval(box.lb - 0.1, box.ub + 0.1)
+            assert cache.find(inner if inside else outer)
+
+        ## no false hits: a hit is implied by a stored box
+        for _ in range(num_boxes):
+            bounds = random_box(rng)
+            if inside:  implied = any(is_subbox(bounds, box) for box in boxes)
+            else:       implied = any(is_subbox(box, bounds) for box in boxes)
+
+            assert cache.find(bounds) == implied
+
+
+def test_lru_eviction():
+    rng = np.random.default_rng(seed)
+
+    ## witnesses
+    cache       = caches.WitnessCache(row_dim, column_dim, True, capacity=2)
+    witnesses   = rng.random((3, row_dim, column_dim))
+    cache.add(witnesses[0])
+    cache.add(witnesses[1])
+
+    # refresh the first witness, the second one is evicted
+    assert (cache.find(interval.Interval(witnesses[0], witnesses[0])) == witnesses[0]).all()
+    cache.add(witnesses[2])
+
+    assert len(cache) == 2
+    assert cache.find(interval.Interval(witnesses[1], witnesses[1])) is None
+    assert cache.find(interval.Interval(witnesses[0], witnesses[0])) is not None
+
+    ## boxes
+    cache = caches.SafeBoxCache(row_dim, column_dim, True, capacity=2)
+    boxes = [random_box(rng) for _ in range(3)]
+    cache.add(boxes[0])
+    cache.add(boxes[1])
+
+    assert cache.find(boxes[0])
+    cache.add(boxes[2])
+
+    assert len(cache) == 2
+    assert cache.find(boxes[0])
+    assert cache.find(boxes[2])
+
+
+if __name__ == "__main__":
+    print("#### Testing verification.caches ####\n")
+
+    for test in [
+            test_witness_cache_inside,
+            test_witness_cache_outside,
+            test_witness_cache_margin,
+            test_safe_box_cache_monotonicity,
+            test_lru_eviction
+        ]:
+        test()
+        print("Passed:", test.__name__)
@@ -0,0 +1,156 @@
+#################################################
+# Testing the OraclePool of the
+# ../verification/futures.py file, with a fake
+# verifier, i.e. without Marabou
+#################################################
+
+#############
+# Libraries #
+#############
+
+## Python libraries
+# Importing parent directory class
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import time
+import asyncio
+
+## Custom libraries
+import verification.nn_verification as nn_verif
+import verification.futures as futures
+
+
+############
+# Constant #
+############
+# the "bounds" of the fake verifier are the seconds to sleep,
+# bounds below the threshold are sound
+threshold   = 1.0
+# the fake verifier raises for these bounds
+crash       = -1.0
+
+
+##################
+# Fake Verifiers #
+##################
+class SleepVerifier(nn_verif.NNVerification):
+    def __init__(self):
+        super().__init__(0, None)
+
+    def __call__(self, bounds):
+        if bounds == crash: raise RuntimeError("crash")
+
+        tic = time.time()
+        time.sleep(bounds)
+        self.set_statistics(time.time() - tic)
+
+        return bounds < threshold, None
+
+    def sleep_twice(self, bounds):
+        # a task other than __call__, see OraclePool.submit_task()
+        return self(2 * bounds)
+
+
+
+#########
+# Tests #
+#########
+def test_answers_n_statistics():
+    verifier = SleepVerifier()
+    with futures.OraclePool(verifier, 2) as oracle_pool:
+        answers = oracle_pool.check_batch([0.01, 0.02, 0.03])
+        unsound = oracle_pool.submit(threshold).result()
+        task    = oracle_pool.submit_task("sleep_twice", 0.01).result()
+
+    assert answers == [(True, None)] * 3
+    assert unsound == (False, None)
+    assert task == (True, None)
+    # the answered calls are merged back
+    assert verifier.get_num_calls() == 5
+
+
+def test_cancel_queued():
+    verifier = SleepVerifier()
+    with futures.OraclePool(verifier, 1) as oracle_pool:
+        running = oracle_pool.submit(0.3)
+        queued  = oracle_pool.submit(0.01)
+
+        assert queued.cancel()
+        assert queued.cancelled()
+        assert running.result() == (True, None)
+
+    # the cancelled query is never run
+    assert verifier.get_num_calls() == 1
+    assert oracle_pool.num_cancelled == 1
+    assert oracle_pool.num_killed == 0
+
+
+def test_cancel_running():
+    verifier = SleepVerifier()
+    with futures.OraclePool(verifier, 1) as oracle_pool:
+        slow = oracle_pool.submit(30.0)
+        time.sleep(0.2)
+
+        tic = time.time()
+        assert slow.cancel()
+
+        # the worker is respawned, and answers the next query at once
+        assert oracle_pool.submit(0.01).result(timeout=10) == (True, None)
+        assert time.time() - tic < 10
+
+    assert oracle_pool.num_killed == 1
+    # the killed query is not counted
+    assert verifier.get_num_calls() == 1
+
+
+def test_dead_worker():
+    verifier = SleepVerifier()
+    with futures.OraclePool(verifier, 1) as oracle_pool:
+        crashed = oracle_pool.submit(crash)
+        try:
+            crashed.result(timeout=10)
+            assert False, "the crash should fail the future"
+        except RuntimeError:
+            pass
+
+        # the pool survives its worker
+        assert oracle_pool.submit(0.01).result(timeout=10) == (True, None)
+
+
+def test_wait_first():
+    verifier = SleepVerifier()
+    with futures.OraclePool(verifier, 2) as oracle_pool:
+        slow    = oracle_pool.submit(2.0)
+        fast    = oracle_pool.submit(0.01)
+
+        done = futures.wait_first([slow, fast])
+        assert done == [fast]
+        assert fast.result() == (True, None)
+
+        oracle_pool.cancel_all([slow])
+        assert slow.cancelled()
+
+
+def test_await():
+    verifier = SleepVerifier()
+    with futures.OraclePool(verifier, 1) as oracle_pool:
+        async def main():
+            return await oracle_pool.submit(0.01)
+
+        assert asyncio.run(main()) == (True, None)
+
+
+if __name__ == "__main__":
+    print("#### Testing verification.futures ####\n")
+
+    for test in [
+            test_answers_n_statistics,
+            test_cancel_queued,
+            test_cancel_running,
+            test_dead_worker,
+            test_wait_first,
+            test_await
+        ]:
+        test()
+        print("Passed:", test.__name__)
@@ -0,0 +1,128 @@
+#################################################
+# Testing the maximality of the BottomUpGroupDFS
+# of the ../algorithms/parallelepipedal.py file,
+# with a fake monotone verifier, i.e. without
+# Marabou
+#################################################
+
+#############
+# Libraries #
+#############
+
+## Python libraries
+# Importing parent directory class
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from copy import copy
+
+## 3rd party libraries
+import numpy as np
+
+## Custom libraries
+import geometry.interval as interval
+import guarantees.parallelepipedal as parallel
+import algorithms.parallelepipedal as algos
+import verification.nn_verification as nn_verif
+
+
+############
+# Constant #
+############
+row_dim     = 5
+column_dim  = 5
+delta       = 0.02
+# enough rounds to expand any feature to the domain
+max_it      = int(1 / delta) + 1
+seeds       = [0, 1, 2]
+
+
+#################
+# Fake Verifier #
+#################
+class MonotoneVerifier(nn_verif.NNVerification):
+    """
+        A bounds' box is sound iff its weighted width is below a budget,
+        and each of its features is narrower than the feature's cap.
+        Both conditions are monotone, i.e. sub-boxes of sound boxes are
+        sound.
+    """
+    def __init__(self, weights: np.ndarray, budget: float, caps: np.ndarray):
+        super().__init__(0, None)
+        self.weights    = weights
+        self.budget     = budget
+        self.caps       = caps
+
+    def __call__(self, bounds):
+        self.set_statistics(0)
+        width = bounds.ub - bounds.lb
+
+        return bool(np.sum(self.weights * width) < self.budget and (width < self.caps).all()), None
+
+
+####################
+# Helper Functions #
+####################
+def search(seed: int, algorithm_class = algos.BottomUpGroupDFS):
+    rng         = np.random.default_rng(seed)
+    x_star      = rng.random((row_dim, column_dim))
+    domain      = interval.Interval(np.zeros((row_dim, column_dim)), np.ones((row_dim, column_dim)))
+    verifier    = MonotoneVerifier(
+        weights = rng.random((row_dim, column_dim)),
+        budget  = 2.0,
+        caps    = rng.uniform(0.05, 1.0, (row_dim, column_dim))
+    )
+
+    guarantee   = parallel.BottomParallelGurantee(x_star, 0, delta, domain)
+    algorithm   = algorithm_class(verifier, max_it=max_it, timeout=60)
+    algorithm.search(guarantee)
+
+    return algorithm, verifier, guarantee
+
+
+
+#########
+# Tests #
+#########
+def test_soundness():
+    for seed in seeds:
+        algorithm, verifier, guarantee = search(seed)
+
+        assert algorithm.soundness
+        assert verifier(guarantee.get_interval())[0]
+        assert (guarantee.domain.lb <= guarantee.lb).all() and (guarantee.ub <= guarantee.domain.ub).all()
+        assert (guarantee.lb <= guarantee.x_star).all() and (guarantee.x_star <= guarantee.ub).all()
+
+
+def test_delta_maximality():
+    for seed in seeds:
+        _, verifier, guarantee = search(seed)
+
+        # expanding any single feature by delta either exceeds the
+        # domain, or it is unsound
+        for i in range(row_dim):
+            for j in range(column_dim):
+                for expand in [parallel.ParallelepipedalGuarantee.expand_ub, parallel.ParallelepipedalGuarantee.expand_lb]:
+                    expanded = copy(guarantee)
+                    if expand(expanded, i, j):
+                        assert not verifier(expanded.get_interval())[0]
+
+
+def test_fewer_calls_than_linear():
+    for seed in seeds:
+        _, group_verifier, _    = search(seed)
+        _, linear_verifier, _   = search(seed, algos.BottomUpLinearDFS)
+
+        assert group_verifier.get_num_calls() <= linear_verifier.get_num_calls()
+
+
+if __name__ == "__main__":
+    print("#### Testing algorithms.parallelepipedal.BottomUpGroupDFS ####\n")
+
+    for test in [
+            test_soundness,
+            test_delta_maximality,
+            test_fewer_calls_than_linear
+        ]:
+        test()
+        print("Passed:", test.__name__)
@@ -0,0 +1,152 @@
+#################################################
+# Testing the copy-on-write bounds of the
+# ../guarantees/parallelepipedal.py file
+#################################################
+
+#############
+# Libraries #
+#############
+
+## Python libraries
+# Importing parent directory class
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import pickle
+from copy import copy, deepcopy
+
+## 3rd party libraries
+import numpy as np
+
+## Custom libraries
+import geometry.interval as interval
+import guarantees.parallelepipedal as parallel
+
+
+############
+# Constant #
+############
+row_dim     = 4
+column_dim  = 3
+delta       = 0.01
+seed        = 0
+
+
+####################
+# Helper Functions #
+####################
+def new_guarantee() -> parallel.ParallelepipedalGuarantee:
+    rng     = np.random.default_rng(seed)
+    x_star  = rng.random((row_dim, column_dim))
+    domain  = interval.Interval(np.zeros((row_dim, column_dim)), np.ones((row_dim, column_dim)))
+
+    return parallel.BottomParallelGurantee(x_star, 0, delta, domain)
+
+
+def snapshot(guarantee: parallel.ParallelepipedalGuarantee) -> np.ndarray:
+    # lb, ub, low_pivot, high_pivot
+    return np.array([
+        guarantee.lb,           guarantee.ub,
+        guarantee.low_pivot.lb, guarantee.low_pivot.ub,
+        guarantee.high_pivot.lb,guarantee.high_pivot.ub
+    ])
+
+
+def mutate(guarantee: parallel.ParallelepipedalGuarantee) -> None:
+    # every kind of write: the bounds, the pivots' views and setters
+    assert guarantee.expand_ub(0, 0)
+    assert guarantee.expand_lb(1, 1)
+    guarantee.high_pivot.ub[2, 2]   = guarantee.x_star[2, 2]
+    guarantee.low_pivot.lb          = guarantee.x_star
+    guarantee.make_sound()
+
+
+
+#########
+# Tests #
+#########
+def test_copy_isolation():
+    for mutate_copy in [True, False]:
+        guarantee   = new_guarantee()
+        copied      = copy(guarantee)
+        before      = snapshot(guarantee)
+
+        # the copy is a snapshot of the bounds
+        assert (snapshot(copied) == before).all()
+
+        # writes to either side do not leak to the other
+        mutate(copied if mutate_copy else guarantee)
+        untouched   = guarantee if mutate_copy else copied
+        mutated     = copied if mutate_copy else guarantee
+
+        assert (snapshot(untouched) == before).all()
+        assert (snapshot(mutated) != before).any()
+
+
+def test_copy_chain():
+    # copies of copies share the same bounds, until a write
+    guarantee   = new_guarantee()
+    copies      = [guarantee]
+    for _ in range(3): copies.append(copy(copies[-1]))
+    before      = snapshot(guarantee)
+
+    mutate(copies[1])
+    for k, other in enumerate(copies):
+        if k != 1: assert (snapshot(other) == before).all()
+
+    mutate(copies[-1])
+    assert (snapshot(copies[1]) == snapshot(copies[-1])).all()
+    assert (snapshot(guarantee) == before).all()
+
+
+def test_copy_on_write():
+    guarantee   = new_guarantee()
+    copied      = copy(guarantee)
+
+    # a copy does not copy the array, the first write does
+    assert copied.bounds is guarantee.bounds
+    copied.ub[0, 0] += delta
+    assert copied.bounds is not guarantee.bounds
+
+    # a guarantee that is no longer shared writes in place
+    bounds = guarantee.bounds
+    del copied
+    copied = copy(guarantee)
+    del copied
+    guarantee.ub[0, 0] += delta
+    assert guarantee.bounds is bounds
+
+
+def test_pickle_n_deepcopy():
+    for clone in [lambda g: pickle.loads(pickle.dumps(g)), deepcopy]:
+        guarantee   = new_guarantee()
+        shared      = copy(guarantee)
+        cloned      = clone(guarantee)
+        before      = snapshot(guarantee)
+
+        assert type(cloned) is type(guarantee)
+        assert (snapshot(cloned) == before).all()
+        assert (cloned.x_star == guarantee.x_star).all()
+        assert cloned.c_star == guarantee.c_star and cloned.delta == guarantee.delta
+
+        # the clone does not take part in the sharing
+        assert cloned.num_sharing == [1]
+        mutate(cloned)
+        assert (snapshot(guarantee) == before).all()
+        assert (snapshot(shared) == before).all()
+
+        mutate(guarantee)
+        assert (snapshot(shared) == before).all()
+
+
+if __name__ == "__main__":
+    print("#### Testing guarantees.parallelepipedal ####\n")
+
+    for test in [
+            test_copy_isolation,
+            test_copy_chain,
+            test_copy_on_write,
+            test_pickle_n_deepcopy
+        ]:
+        test()
+        print("Passed:", test.__name__)
@@ -0,0 +1,122 @@
+#################################################
+# Testing the bound propagation of the
+# ../verification/ibp.py file against the
+# forward pass of ../verification/onnx_mlp.py
+#################################################
+
+#############
+# Libraries #
+#############
+
+## Python libraries
+# Importing parent directory class
+import os
+import sys
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(root)
+
+## 3rd party libraries
+import numpy as np
+
+## Custom libraries
+import verification.ibp as ibp
+import verification.onnx_mlp as onnx_mlp
+
+
+############
+# Constant #
+############
+model_paths = [
+    os.path.join(root, "nn_weights", "mnist_nn-32.onnx"),
+    os.path.join(root, "nn_weights", "fashion_mnist_nn-64.onnx")
+]
+x_star_path = os.path.join(root, "data", "inputs", "MNIST", "0-1.csv")
+radii       = [0.0, 0.001, 0.01, 0.1]
+num_boxes   = 10
+num_samples = 100
+seed        = 0
+# slack of the floating point comparisons
+tolerance   = 1e-6
+
+
+####################
+# Helper Functions #
+####################
+def random_boxes(rng: np.random.Generator, x_star: np.ndarray):
+    # boxes of random widths around x_star, clipped to [0, 1]
+    for radius in radii:
+        for _ in range(num_boxes):
+            lb = np.clip(x_star - radius * rng.random(x_star.shape), 0, 1)
+            ub = np.clip(x_star + radius * rng.random(x_star.shape), 0, 1)
+            yield lb, ub
+
+
+def sample(rng: np.random.Generator, lb: np.ndarray, ub: np.ndarray) -> np.ndarray:
+    # the corners of the box are the extreme points, sample them too
+    samples = lb + (ub - lb) * rng.random((num_samples,) + lb.shape)
+    return np.concatenate([samples, [lb, ub]])
+
+
+
+#########
+# Tests #
+#########
+def test_propagate_contains_outputs():
+    rng     = np.random.default_rng(seed)
+    x_star  = np.loadtxt(x_star_path)
+
+    for model_path in model_paths:
+        network = onnx_mlp.NumpyNeuralNetwork(model_path)
+
+        for lb, ub in random_boxes(rng, x_star):
+            y_lb, y_ub  = ibp.propagate(network.layers, lb.flatten(), ub.flatten())
+            outputs     = network.forward(sample(rng, lb, ub))
+
+            assert (y_lb <= y_ub).all()
+            assert (y_lb - tolerance <= outputs).all()
+            assert (outputs <= y_ub + tolerance).all()
+
+
+def test_propagate_point():
+    # a degenerate box is propagated to the output of its point
+    x_star = np.loadtxt(x_star_path)
+
+    for model_path in model_paths:
+        network     = onnx_mlp.NumpyNeuralNetwork(model_path)
+        y_lb, y_ub  = ibp.propagate(network.layers, x_star.flatten(), x_star.flatten())
+        output      = network.forward(x_star)[0]
+
+        assert np.allclose(y_lb, output) and np.allclose(y_ub, output)
+
+
+def test_max_score_differences():
+    rng     = np.random.default_rng(seed)
+    x_star  = np.loadtxt(x_star_path)
+
+    for model_path in model_paths:
+        network     = onnx_mlp.NumpyNeuralNetwork(model_path)
+        c_star, _   = network.predict_argmax(x_star)
+
+        for lb, ub in random_boxes(rng, x_star):
+            differences = ibp.max_score_differences(network.layers, c_star, lb.flatten(), ub.flatten())
+            outputs     = network.forward(sample(rng, lb, ub))
+
+            # upper bounds of y_i - y_{c_star}, and y_{c_star} - y_{c_star} = 0
+            assert (outputs - outputs[:, [c_star]] <= differences + tolerance).all()
+            assert abs(differences[c_star]) <= tolerance
+
+            # at least as tight as subtracting the bounds of the scores
+            y_lb, y_ub = ibp.propagate(network.layers, lb.flatten(), ub.flatten())
+            assert (differences <= y_ub - y_lb[c_star] + tolerance).all()
+
+
+if __name__ == "__main__":
+    print("#### Testing verification.ibp ####\n")
+
+    for test in [
+            test_propagate_contains_outputs,
+            test_propagate_point,
+            test_max_score_differences
+        ]:
+        test()
+        print("Passed:", test.__name__)
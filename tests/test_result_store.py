@@ -0,0 +1,165 @@
+#################################################
+# Testing the round-trip of the ResultStore of
+# the ../verification/result_store.py file
+#################################################
+
+#############
+# Libraries #
+#############
+
+## Python libraries
+# Importing parent directory class
+import os
+import sys
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(root)
+import tempfile
+
+## 3rd party libraries
+import numpy as np
+
+## Custom libraries
+import geometry.interval as interval
+import verification.result_store as result_store
+
+
+############
+# Constant #
+############
+model_path  = os.path.join(root, "nn_weights", "mnist_nn-32.onnx")
+row_dim     = 4
+column_dim  = 3
+c_star      = 1
+epsilon     = 1e-3
+seed        = 0
+# below the rounding of the keys, i.e. the perturbed bounds
+# have the same key, but above the tolerance of the containment
+tiny        = 10 ** -(result_store.decimals + 1)
+
+
+####################
+# Helper Functions #
+####################
+def open_store(path: str, inside: bool = True, verifier_kind: str = "marabou", c_star: int = c_star, margin: float = 0.0):
+    return result_store.ResultStore(path, model_path, verifier_kind, c_star, epsilon, inside, row_dim, column_dim, margin)
+
+
+def random_box(rng: np.random.Generator) -> interval.Interval:
+    # on a coarse grid, so that +/- tiny does not change the rounding
+    corners = np.round(rng.random((2, row_dim, column_dim)), 3)
+    return interval.Interval(corners.min(axis=0), corners.max(axis=0) + 0.001)
+
+
+def shrink(bounds: interval.Interval) -> interval.Interval:
+    return interval.Interval(bounds.lb + tiny, bounds.ub - tiny)
+
+
+def enlarge(bounds: interval.Interval) -> interval.Interval:
+    return interval.Interval(bounds.lb - tiny, bounds.ub + tiny)
+
+
+
+#########
+# Tests #
+#########
+def test_unsat_round_trip():
+    rng = np.random.default_rng(seed)
+
+    for inside in [True, False]:
+        with tempfile.TemporaryDirectory() as directory:
+            store   = open_store(os.path.join(directory, "results.db"), inside)
+            bounds  = random_box(rng)
+            store.add(bounds, True, None)
+
+            assert store.find(bounds) == (True, None)
+            # same key, confirmed by monotonicity
+            if inside:
+                assert store.find(shrink(bounds)) == (True, None)
+                assert store.find(enlarge(bounds)) is None
+            else:
+                assert store.find(enlarge(bounds)) == (True, None)
+                assert store.find(shrink(bounds)) is None
+
+            # other bounds
+            assert store.find(random_box(rng)) is None
+            assert store.num_hits == 2
+            store.close()
+
+
+def test_sat_round_trip():
+    rng = np.random.default_rng(seed)
+
+    for inside in [True, False]:
+        with tempfile.TemporaryDirectory() as directory:
+            store   = open_store(os.path.join(directory, "results.db"), inside)
+            bounds  = random_box(rng)
+            # a witness on the boundary of the bounds
+            witness = bounds.lb.copy() if inside else bounds.lb - 0.5
+            store.add(bounds, False, witness)
+
+            verdict, found = store.find(bounds)
+            assert not verdict and (found == witness).all()
+
+            # same key, the witness decides
+            if inside:  assert store.find(shrink(bounds)) is None
+            else:       assert store.find(enlarge(bounds))[0] is False
+
+            assert store.find(random_box(rng)) is None
+            store.close()
+
+
+def test_sat_margin():
+    rng = np.random.default_rng(seed)
+
+    with tempfile.TemporaryDirectory() as directory:
+        store   = open_store(os.path.join(directory, "results.db"), False, margin=0.1)
+        bounds  = random_box(rng)
+        # outside the bounds, but nearer than the margin
+        witness = bounds.lb - 0.05
+        store.add(bounds, False, witness)
+
+        assert store.find(bounds) is None
+        assert store.num_hits == 0
+        store.close()
+
+
+def test_persistence():
+    rng     = np.random.default_rng(seed)
+    unsafe  = random_box(rng)
+    safe    = random_box(rng)
+    witness = (unsafe.lb + unsafe.ub) / 2
+
+    with tempfile.TemporaryDirectory() as directory:
+        path    = os.path.join(directory, "results.db")
+        store   = open_store(path)
+        store.add(safe, True, None)
+        store.add(unsafe, False, witness)
+        store.close()
+
+        # the results survive a reopen
+        store = open_store(path)
+        assert store.find(safe) == (True, None)
+        verdict, found = store.find(unsafe)
+        assert not verdict and (found == witness).all()
+        assert store.num_hits == 2
+        store.close()
+
+        # the key depends on the verifier
+        for other in [open_store(path, verifier_kind="ibp"), open_store(path, c_star=c_star + 1)]:
+            assert other.find(safe) is None
+            assert other.find(unsafe) is None
+            assert other.num_hits == 0
+            other.close()
+
+
+if __name__ == "__main__":
+    print("#### Testing verification.result_store ####\n")
+
+    for test in [
+            test_unsat_round_trip,
+            test_sat_round_trip,
+            test_sat_margin,
+            test_persistence
+        ]:
+        test()
+        print("Passed:", test.__name__)
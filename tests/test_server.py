@@ -0,0 +1,153 @@
+#################################################
+# Testing the JSON-lines protocol of the Server
+# of the ../cli/server.py file
+#################################################
+
+#############
+# Libraries #
+#############
+
+## Python libraries
+# Importing parent directory class
+import os
+import sys
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(root)
+import io
+import json
+
+## 3rd party libraries
+import numpy as np
+
+## Custom libraries
+import geometry.interval as interval
+import cli.batch as batch
+import cli.server as server
+import cli.error_handling as errors
+
+
+############
+# Constant #
+############
+model_path  = os.path.join(root, "nn_weights", "mnist_nn-32.onnx")
+x_star_path = os.path.join(root, "data", "inputs", "MNIST", "0-1.csv")
+num_workers = 2
+
+
+####################
+# Helper Functions #
+####################
+def serve(lines: list) -> list:
+    stream_out = io.StringIO()
+    server.Server(num_workers).serve(io.StringIO("".join(line + "\n" for line in lines)), stream_out)
+
+    return [json.loads(line) for line in stream_out.getvalue().splitlines()]
+
+
+def fake_certify(argv: list):
+    # the results are the length of the argv, as numpy values
+    x_star = np.loadtxt(argv[argv.index("-x") + 1])
+    return errors.error_all_ok, [np.int64(len(argv)), np.float64(0.5)], interval.Interval(x_star - 0.1, x_star + 0.1)
+
+
+def crashing_certify(argv: list):
+    # a dead worker, e.g. a segfault of Marabou
+    if "-crash" in argv: os._exit(1)
+    return fake_certify(argv)
+
+
+
+#########
+# Tests #
+#########
+def test_malformed_requests():
+    responses = serve([
+        "not json",
+        json.dumps([1, 2, 3]),
+        json.dumps({"id": 1}),
+        json.dumps({"id": 2, "argv": "-x x.csv"}),
+        ""
+    ])
+
+    # one response per non-empty line, without the id
+    assert len(responses) == 4
+    for response in responses:
+        assert response == {"id": None, "exit_code": errors.error_unkown_error, "error": "Malformed request"}
+
+
+def test_failed_request():
+    responses = serve([
+        json.dumps({"id": "a", "argv": ["-x", "no_such_file.csv", "-c", 0, "-nn", model_path]}),
+        json.dumps({"id": "b", "argv": ["-x", x_star_path, "-c", 0, "-nn", "no_such_file.onnx"]})
+    ])
+
+    responses = {response["id"]: response for response in responses}
+    assert responses["a"]["exit_code"] == errors.error_x_star_no_file
+    assert responses["b"]["exit_code"] == errors.error_onnx_path_no_file
+    for response in responses.values():
+        assert response["results"] is None and response["lb"] is None and response["ub"] is None
+
+
+def test_successful_requests():
+    # the workers are forked, hence they run the fake certify
+    certify = batch.certify
+    batch.certify = fake_certify
+    try:
+        responses = serve([
+            json.dumps({"id": request_id, "argv": ["-x", x_star_path] + ["-v"] * request_id})
+            for request_id in range(5)
+        ])
+    finally:
+        batch.certify = certify
+
+    # the responses are not ordered, use the ids
+    assert sorted(response["id"] for response in responses) == list(range(5))
+
+    x_star = np.loadtxt(x_star_path)
+    for response in responses:
+        # the worker's argv starts with the script's name
+        assert response["exit_code"] == errors.error_all_ok
+        assert response["results"] == [3 + response["id"], 0.5]
+        assert np.allclose(response["lb"], x_star - 0.1)
+        assert np.allclose(response["ub"], x_star + 0.1)
+
+
+def test_dead_worker():
+    # a single worker, hence the crashed request and the next one are
+    # in flight on the broken pool, and the others go to a new pool
+    certify = batch.certify
+    batch.certify = crashing_certify
+    try:
+        server_     = server.Server(1)
+        stream_out  = io.StringIO()
+        lines       = [
+            json.dumps({"id": request_id, "argv": ["-x", x_star_path] + (["-crash"] if request_id == 0 else [])})
+            for request_id in range(6)
+        ]
+        server_.serve(io.StringIO("".join(line + "\n" for line in lines)), stream_out)
+    finally:
+        batch.certify = certify
+
+    responses = {response["id"]: response for response in map(json.loads, stream_out.getvalue().splitlines())}
+
+    # every request is answered
+    assert sorted(responses) == list(range(6))
+    assert responses[0]["exit_code"] == errors.error_unkown_error
+    for request_id in range(2, 6):
+        assert responses[request_id]["exit_code"] == errors.error_all_ok
+
+    assert server_.num_respawns == 1
+    assert server_.num_errors == sum(response["exit_code"] != errors.error_all_ok for response in responses.values())
+
+
+if __name__ == "__main__":
+    print("#### Testing cli.server ####\n")
+
+    for test in [
+            test_malformed_requests,
+            test_failed_request,
+            test_successful_requests,
+            test_dead_worker
+        ]:
+        test()
+        print("Passed:", test.__name__)
@@ -0,0 +1,244 @@
+###########################################################
+# verification.attack
+# --------------------------------------------------------
+# Attack-first hybrid verifier. A projected gradient
+# (PGD) attack, with NumPy gradients through the ReLU MLP,
+# looks for an adversarial example inside the given bounds.
+# If it finds one, we return it at once, otherwise we call
+# the sound Marabou verifier, i.e. Marabou is (mostly)
+# left with proving UNSAT.
+###########################################################
+
+#############
+# Libraries #
+#############
+# python libraries
+import time
+import typing
+import hashlib
+
+# 3rd party libraries
+import numpy as np
+
+# custom libraries
+import sys
+sys.path.append('..')
+import verification.nn_verification as nn_verif
+import verification.marabou as marabou_verif
+import verification.onnx_mlp as onnx_mlp
+
+
+#############
+# Constants #
+#############
+num_restarts    = 4     # attacks started in parallel, per oracle call
+num_steps       = 20    # PGD steps, per attack
+step_size       = 0.25  # PGD step, as a fraction of the bounds' width
+
+
+#############
+# Gradients #
+#############
+def margins_n_gradients(
+        layers:     typing.List[onnx_mlp.Layer_t],
+        c_star:     int,
+        X:          np.ndarray
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+        #### Description:
+        For a batch of (flat) points `X`, the margins
+            `max_{i != c_star} y_i - y_{c_star}`
+        and their gradients w.r.t. the points.
+
+        #### Notes:
+        At ReLU kinks, the gradient of the inactive side (0) is used.
+    """
+    ## Forward pass, keeping the activation patterns
+    H       = X
+    masks   = []
+    for W, b, relu in layers:
+        H = H @ W + b
+        if relu:
+            masks.append(H > 0)
+            H = np.maximum(H, 0)
+        else:
+            masks.append(None)
+
+    ## Margins, against the best other class
+    others              = H.copy()
+    others[:, c_star]   = -np.inf
+    targets             = np.argmax(others, axis=1)
+    rows                = np.arange(len(X))
+    margins             = H[rows, targets] - H[:, c_star]
+
+    ## Backward pass
+    G                   = np.zeros(H.shape)
+    G[rows, targets]    = 1
+    G[:, c_star]        = -1
+    for (W, _, _), mask in zip(reversed(layers), reversed(masks)):
+        if mask is not None: G = G * mask
+        G = G @ W.T
+
+    return margins, G
+
+
+
+###################
+# Hybrid Verifier #
+###################
+class HybridSoundVerifier(nn_verif.NNVerification):
+    """
+        #### Description:
+        Wraps a `SoundMarabouVerifier`. For each oracle call, first we run
+        `num_restarts` PGD attacks inside the given bounds, maximizing the
+        margin `max_{i != c_star} y_i - y_{c_star}`. A point with margin at
+        least Marabou's `epsilon` is a counterexample of the sound verifier,
+        hence we return it without calling Marabou. Otherwise, the attack is
+        inconclusive, and we fall through to Marabou.
+
+        #### Notes:
+        * The statistics of this class count *all* the oracle calls.
+        The calls resolved by the attack are counted in `num_attack_hits`,
+        the ones passed to Marabou in `num_solver_calls`.
+        * The attack only finds counterexamples, hence the UNSAT answers
+        are always the ones of Marabou.
+        * The restarts are seeded by the bounds (see `seed()`), i.e. the
+        answers do not depend on the calls' order, nor on the process
+        (e.g. a pool worker) making the call.
+    """
+
+    def __init__(self, verifier: marabou_verif.SoundMarabouVerifier):
+        assert isinstance(verifier, marabou_verif.SoundMarabouVerifier)
+        super().__init__(verifier.c_star, verifier.model_description)
+
+        self.verifier   = verifier
+        self.layers     = verifier.network.layers
+
+        ## Dimensions
+        self.row_dim    = verifier.row_dim
+        self.column_dim = verifier.column_dim
+        self.domain     = verifier.domain
+
+        ## Statistics
+        self.num_attack_hits    = 0
+        self.num_solver_calls   = 0
+        self.attack_time        = 0
+
+    ## Pickling
+    # see `verification.marabou.MarabouVerification.__reduce__()`
+    def __reduce__(self):
+        return (self.__class__, (self.verifier,))
+
+    ## Persistent Result Store
+    def open_result_store(self, path: str) -> None:
+        self.verifier.open_result_store(path)
+
+    ## Mutators
+    def reset_statistics(self):
+        super().reset_statistics()
+
+        self.num_attack_hits    = 0
+        self.num_solver_calls   = 0
+        self.attack_time        = 0
+        self.verifier.reset_statistics()
+
+    def close(self) -> None:
+        self.verifier.close()
+
+    def set_deadline(self, deadline) -> None:
+        # the deadline of the inner verifier's solver calls
+        super().set_deadline(deadline)
+        self.verifier.set_deadline(deadline)
+
+    ## Accessors
+    def get_num_attack_hits(self) -> int:
+        return self.num_attack_hits
+
+    def get_num_solver_calls(self) -> int:
+        return self.num_solver_calls
+
+    def get_extra_statistics(self) -> typing.Dict[str, typing.Union[int, float]]:
+        extra_statistics = self.verifier.get_extra_statistics()
+        extra_statistics["Attack Hits"]     = self.num_attack_hits
+        extra_statistics["Attack Time"]     = round(self.attack_time, 2)
+        extra_statistics["Solver Calls"]    = self.num_solver_calls
+        extra_statistics["Solver Time"]     = round(self.verifier.get_total_time(), 2)
+
+        return extra_statistics
+
+    ## Predictions
+    def predict(self, X):
+        return self.verifier.predict(X)
+
+    def predict_argmax(self, X):
+        return self.verifier.predict_argmax(X)
+
+    def predict_argmax_batch(self, X):
+        return self.verifier.predict_argmax_batch(X)
+
+    ## Attack
+    @staticmethod
+    def seed(bounds) -> int:
+        # a deterministic function of the query, unlike hash()
+        blake2b = hashlib.blake2b(digest_size=8)
+        blake2b.update(np.ascontiguousarray(bounds.lb, dtype=np.float64).tobytes())
+        blake2b.update(np.ascontiguousarray(bounds.ub, dtype=np.float64).tobytes())
+
+        return int.from_bytes(blake2b.digest(), "little")
+
+    def attack(self, bounds) -> typing.Union[np.ndarray, None]:
+        """
+            #### Description:
+            Projected (sign) gradient ascent of the margin, from the center
+            and `num_restarts - 1` random points of `bounds`.
+
+            #### Output:
+            A counterexample inside `bounds`, or `None`.
+        """
+        lb      = bounds.lb.reshape(-1)
+        ub      = bounds.ub.reshape(-1)
+        width   = ub - lb
+
+        rng         = np.random.default_rng(self.seed(bounds))
+        X           = lb + width * rng.random((num_restarts, len(lb)))
+        X[0]        = (lb + ub) / 2
+
+        for _ in range(num_steps):
+            margins, G = margins_n_gradients(self.layers, self.c_star, X)
+
+            found = np.nonzero(margins >= self.verifier.epsilon)[0]
+            if len(found) > 0: return X[found[0]].reshape((self.row_dim, self.column_dim))
+
+            X = np.clip(X + step_size * width * np.sign(G), lb, ub)
+
+        margins, _  = margins_n_gradients(self.layers, self.c_star, X)
+        found       = np.nonzero(margins >= self.verifier.epsilon)[0]
+        if len(found) > 0: return X[found[0]].reshape((self.row_dim, self.column_dim))
+
+        return None
+
+    ## Operations
+    def __call__(self, bounds):
+        tic = time.time()
+
+        witness = self.attack(bounds)
+        self.attack_time += time.time() - tic
+
+        if witness is not None:
+            self.num_attack_hits    += 1
+            self.set_statistics(time.time() - tic)
+            self.last_source        = nn_verif.source_attack
+
+            return False, witness
+
+        self.num_solver_calls += 1
+
+        soundness, witness  = self.verifier(bounds)
+        self.num_timeouts   = self.verifier.get_timeouts()
+        self.set_statistics(time.time() - tic)
+
+        # the inner verifier's answer
+        self.last_source        = self.verifier.last_source
+        self.last_solver_time   = self.verifier.last_solver_time
+
+        return soundness, witness
@@ -0,0 +1,186 @@
+###########################################################
+# verification.caches
+# --------------------------------------------------------
+# In-memory caches of oracle results, consulted before
+# calling the solver.
+###########################################################
+
+#############
+# Libraries #
+#############
+# 3rd party libraries
+import numpy as np
+
+# custom libraries
+import sys
+sys.path.append('..')
+from geometry.constants import epsilon
+
+
+####################
+# Helper Functions #
+####################
+def contained(points: np.ndarray, lb: np.ndarray, ub: np.ndarray) -> np.ndarray:
+    """
+        #### Description:
+        Vectorized `point in [lb, ub]`, for each point of the `(N, row_dim, column_dim)`
+        array `points`. The same as `geometry.interval.Interval.__contains__()`.
+    """
+    return ((points - lb >= -epsilon) & (ub - points >= -epsilon)).all(axis=(1, 2))
+
+
+def are_witnesses(points: np.ndarray, lb: np.ndarray, ub: np.ndarray, inside: bool, margin: float = 0.0) -> np.ndarray:
+    """
+        #### Description:
+        Vectorized check that each point of `points` is a witness for the
+        bounds `[lb, ub]`, i.e. it lies inside them (if `inside`), or
+        outside `[lb - margin, ub + margin]` (else).
+
+        #### Notes:
+        The complete verifier asks the solver for points at least `margin`
+        away from the bounds (see `verification.marabou.complete_margin`),
+        hence a point nearer to the bounds is *not* an answer of the solver.
+    """
+    if inside:  return contained(points, lb, ub)
+    else:       return ~contained(points, lb - margin, ub + margin)
+
+
+
+#################
+# Witness Cache #
+#################
+class WitnessCache:
+    """
+        #### Description:
+        Stores the witnesses (counterexamples) returned by the solver.
+        Before calling the solver, we look for a stored witness that is
+        still a witness for the new bounds.
+            * `inside == True`: a witness is a point *inside* the bounds,
+            e.g. an adversarial example for the sound verifier.
+            * `inside == False`: a witness is a point *outside* the bounds,
+            by at least `margin`, e.g. a point of class `c_star` for the
+            complete verifier.
+
+        #### Notes:
+        * The witnesses are kept in a single array, thus the lookup is one
+        vectorized containment scan.
+        * The memory (and the scan) is bounded by `capacity` witnesses.
+        When full, we evict the least recently used witness, as in
+        `SafeBoxCache`, since the verifiers are kept warm across inputs.
+        * Among several hits, we return the most recently used witness,
+        the likeliest to be inside (resp. outside) the next bounds too.
+    """
+
+    def __init__(self, row_dim: int, column_dim: int, inside: bool = True, capacity: int = 256, margin: float = 0.0):
+        assert capacity > 0
+        assert margin >= 0
+
+        self.inside     = inside
+        self.margin     = margin
+        self.witnesses  = np.zeros((capacity, row_dim, column_dim))
+        self.last_used  = np.zeros(capacity, dtype=np.int64)    # LRU clock
+        self.clock      = 0
+        self.size       = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def tick(self) -> int:
+        self.clock += 1
+        return self.clock
+
+    def add(self, witness: np.ndarray) -> None:
+        ## free slot, else evict the LRU witness
+        if self.size < len(self.witnesses):
+            slot        = self.size
+            self.size  += 1
+        else:
+            slot = np.argmin(self.last_used)
+
+        self.witnesses[slot]    = witness
+        self.last_used[slot]    = self.tick()
+
+    def find(self, bounds):
+        """
+            #### Description:
+            Returns a stored witness for `bounds`, or `None`.
+        """
+        if self.size == 0: return None
+
+        hits = are_witnesses(self.witnesses[:self.size], bounds.lb, bounds.ub, self.inside, self.margin)
+
+        if not hits.any(): return None
+
+        slot                    = np.argmax(np.where(hits, self.last_used[:self.size], -1))
+        self.last_used[slot]    = self.tick()
+        return self.witnesses[slot].copy()
+
+
+
+##################
+# Safe Box Cache #
+##################
+class SafeBoxCache:
+    """
+        #### Description:
+        Stores the boxes `[lb, ub]` proven UNSAT by the solver, and answers
+        the queries implied by monotonicity:
+            * `inside == True` (sound verifier): any *sub-box* of a sound
+            box is sound.
+            * `inside == False` (complete verifier): any *super-box* of a
+            complete box is complete.
+
+        #### Notes:
+        * The memory is bounded by `capacity` boxes. When full, we evict
+        the least recently used box, i.e. the one that was added or hit
+        the longest time ago.
+        * The containment is checked *exactly* (no epsilon slack), since
+        a wrong hit breaks the soundness of the result.
+        * Timeouts must *not* be added, they are not proofs.
+    """
+
+    def __init__(self, row_dim: int, column_dim: int, inside: bool = True, capacity: int = 256):
+        assert capacity > 0
+
+        self.inside     = inside
+        self.lbs        = np.zeros((capacity, row_dim, column_dim))
+        self.ubs        = np.zeros((capacity, row_dim, column_dim))
+        self.last_used  = np.zeros(capacity, dtype=np.int64)    # LRU clock
+        self.clock      = 0
+        self.size       = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def tick(self) -> int:
+        self.clock += 1
+        return self.clock
+
+    def add(self, bounds) -> None:
+        ## free slot, else evict the LRU box
+        if self.size < len(self.lbs):
+            slot        = self.size
+            self.size  += 1
+        else:
+            slot = np.argmin(self.last_used)
+
+        self.lbs[slot]          = bounds.lb
+        self.ubs[slot]          = bounds.ub
+        self.last_used[slot]    = self.tick()
+
+    def find(self, bounds) -> bool:
+        """
+            #### Description:
+            Returns True if `bounds` is proven UNSAT by a stored box.
+        """
+        if self.size == 0: return False
+
+        lbs = self.lbs[:self.size]
+        ubs = self.ubs[:self.size]
+        if self.inside: hits = ((lbs <= bounds.lb) & (bounds.ub <= ubs)).all(axis=(1, 2))
+        else:           hits = ((bounds.lb <= lbs) & (ubs <= bounds.ub)).all(axis=(1, 2))
+
+        if not hits.any(): return False
+
+        self.last_used[np.argmax(hits)] = self.tick()
+        return True
@@ -11,12 +11,22 @@ import verification.nn_verification as nn_verif
 
 
 class ExperimentalVerification(nn_verif.NNVerification):
+    # NOTE: nn_model can be any model with the predict_argmax()
+    # method. Use verification.onnx_mlp.NumpyNeuralNetwork to keep
+    # TensorFlow out of the oracle calls.
     def __init__(self, c_star, nn_model, num_samples=1000):
         super().__init__(c_star, nn_model)
 
         ## Experimental parameters
         self.num_samples = num_samples
     
+    ## Predictions
+    def predict(self, X):
+        return self.model_description.predict(X)
+    
+    def predict_argmax(self, X):
+        return self.model_description.predict_argmax(X)
+    
     def __call__(self, bounds):
         counterexample = mc.adversarial_attack(
                             bounds.lb,
@@ -0,0 +1,336 @@
+###########################################################
+# verification.futures
+# --------------------------------------------------------
+# Oracle futures, for speculative queries. The oracle
+# calls are submitted to a pool of worker processes, each
+# one holding its own copy of the verifier, and they return
+# futures at once. A query that is no longer needed can be
+# cancelled, even while it runs: its worker is terminated,
+# and replaced by a fresh one, so the core goes to the
+# next query.
+#
+# The futures are also awaitable, i.e.
+#   soundness, witness = await oracle_pool.submit(bounds)
+# inside an asyncio event loop.
+###########################################################
+
+#############
+# Libraries #
+#############
+# python libraries
+import typing
+import asyncio
+import threading
+import collections
+import multiprocessing
+import multiprocessing.connection
+import concurrent.futures
+
+# custom libraries
+import sys
+sys.path.append('..')
+import verification.nn_verification as nn_verif
+
+
+##########
+# Worker #
+##########
+def _worker_loop(verifier: nn_verif.NNVerification, deadline: typing.Union[float, None], conn) -> None:
+    """
+        #### Description:
+        Answers the `(task_id, method, args)` queries of `conn` with
+        `(task_id, verifier.method(*args), statistics)`, until `None`.
+        The oracle calls are cut at the `deadline` of `verifier`'s search.
+    """
+    verifier.set_deadline(deadline)
+
+    while True:
+        query = conn.recv()
+        if query is None: break
+
+        task_id, method, args = query
+
+        num_calls       = verifier.num_calls
+        total_time      = verifier.total_time
+        num_timeouts    = verifier.num_timeouts
+
+        answer = getattr(verifier, method)(*args)
+
+        conn.send((task_id, answer, (
+            verifier.num_calls      - num_calls,
+            verifier.total_time     - total_time,
+            verifier.num_timeouts   - num_timeouts
+        )))
+
+
+class _Worker:
+    __slots__ = ("process", "conn", "task_id")
+
+    def __init__(self, verifier: nn_verif.NNVerification):
+        self.conn, worker_conn  = multiprocessing.Pipe()
+        self.process            = multiprocessing.Process(
+                                    target  = _worker_loop,
+                                    args    = (verifier, verifier.deadline, worker_conn),
+                                    daemon  = True
+                                )
+        self.process.start()
+        worker_conn.close()
+
+        self.task_id = None     # the query running, if any
+
+    def terminate(self) -> None:
+        self.process.terminate()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:                    self.conn.send(None)
+        except (OSError, EOFError): pass
+        self.process.join()
+        self.conn.close()
+
+
+
+##########
+# Future #
+##########
+class OracleFuture:
+    """
+        #### Description:
+        The future answer `(verdict, witness)` of an oracle call, see
+        `OraclePool.submit()`.
+    """
+    __slots__ = ("oracle_pool", "task_id", "future")
+
+    def __init__(self, oracle_pool, task_id: int):
+        self.oracle_pool    = oracle_pool
+        self.task_id        = task_id
+        self.future         = concurrent.futures.Future()
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def cancelled(self) -> bool:
+        return self.future.cancelled()
+
+    def result(self, timeout: float = None) -> typing.Tuple:
+        return self.future.result(timeout)
+
+    def cancel(self) -> bool:
+        """
+            #### Description:
+            Cancels the query, whether it is queued or running. Returns
+            `False` if the query is already answered.
+        """
+        return self.oracle_pool.cancel(self)
+
+    ## asyncio
+    def __await__(self):
+        return asyncio.wrap_future(self.future).__await__()
+
+
+
+########
+# Pool #
+########
+class OraclePool:
+    """
+        #### Description:
+        A pool of `num_workers` processes, each one holding a copy of
+        `verifier`, answering `submit()`ted oracle calls in FIFO order.
+
+        #### Notes:
+        * The statistics of the *answered* oracle calls are merged back to
+        `verifier`. The cancelled ones are not counted.
+        * A cancelled running query costs a new worker process, i.e. a copy
+        of the verifier. Hence, speculation pays off for oracle calls much
+        slower than a process start, e.g. Marabou's.
+        * The pool is managed by a single background thread, which also
+        resolves the futures.
+    """
+
+    def __init__(self, verifier: nn_verif.NNVerification, num_workers: int):
+        assert num_workers > 0
+
+        self.verifier       = verifier
+        self.num_workers    = num_workers
+        self.workers        = [_Worker(verifier) for _ in range(num_workers)]
+
+        ## Queries
+        self.lock           = threading.Lock()
+        self.next_task_id   = 0
+        self.queued         = collections.deque()  # queued OracleFutures
+        self.running        = {}    # task_id -> OracleFuture
+        self.cancelling     = set() # task_ids of running queries to cancel
+
+        ## Statistics
+        self.num_cancelled  = 0     # cancelled queries
+        self.num_killed     = 0     # of which, cancelled while running
+
+        ## Manager thread, woken up through a pipe
+        self.wakeup_recv, self.wakeup_send  = multiprocessing.Pipe(duplex=False)
+        self.closed                         = False
+        self.manager                        = threading.Thread(target=self.manage, daemon=True)
+        self.manager.start()
+
+    ## Context Manager
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    ## Operations
+    def submit(self, bounds) -> OracleFuture:
+        return self.submit_task("__call__", bounds)
+
+    def submit_task(self, method: str, *args) -> OracleFuture:
+        """
+            #### Description:
+            As `submit()`, for any method of the verifier, i.e. the future
+            of `verifier.method(*args)`, run by a worker.
+        """
+        with self.lock:
+            assert not self.closed
+
+            oracle_future       = OracleFuture(self, self.next_task_id)
+            self.next_task_id  += 1
+            self.queued.append((oracle_future, method, args))
+
+        self.wakeup()
+        return oracle_future
+
+    def check_batch(self, intervals: typing.List) -> typing.List[typing.Tuple]:
+        oracle_futures = [self.submit(bounds) for bounds in intervals]
+        return [oracle_future.result() for oracle_future in oracle_futures]
+
+    def cancel(self, oracle_future: OracleFuture) -> bool:
+        with self.lock:
+            if oracle_future.done(): return oracle_future.cancelled()
+
+            if oracle_future.task_id in self.running:
+                self.cancelling.add(oracle_future.task_id)
+                self.num_killed += 1
+
+            # a queued query is skipped at dispatch
+            oracle_future.future.cancel()
+            self.num_cancelled += 1
+
+        self.wakeup()
+        return True
+
+    def cancel_all(self, oracle_futures: typing.Iterable[OracleFuture]) -> None:
+        for oracle_future in oracle_futures: oracle_future.cancel()
+
+    def shutdown(self) -> None:
+        with self.lock:
+            if self.closed: return
+            self.closed = True
+
+            for oracle_future, _, _ in self.queued: oracle_future.future.cancel()
+            self.queued.clear()
+
+            # the running queries are not waited for
+            for task_id, oracle_future in self.running.items():
+                oracle_future.future.cancel()
+                self.cancelling.add(task_id)
+
+        self.wakeup()
+        self.manager.join()
+
+    ## Manager
+    def wakeup(self) -> None:
+        self.wakeup_send.send(None)
+
+    def dispatch(self) -> None:
+        # (with self.lock)
+        for worker in self.workers:
+            if worker.task_id is not None: continue
+
+            while len(self.queued) > 0:
+                oracle_future, method, args = self.queued.popleft()
+                if oracle_future.cancelled(): continue
+
+                worker.task_id                      = oracle_future.task_id
+                self.running[oracle_future.task_id] = oracle_future
+                worker.conn.send((oracle_future.task_id, method, args))
+                break
+
+    def kill_cancelled(self) -> None:
+        # (with self.lock)
+        for ind, worker in enumerate(self.workers):
+            if worker.task_id not in self.cancelling: continue
+
+            self.cancelling.discard(worker.task_id)
+            del self.running[worker.task_id]
+
+            worker.terminate()
+            if not self.closed: self.workers[ind] = _Worker(self.verifier)
+
+    def receive(self, ind: int) -> None:
+        # (with self.lock)
+        worker = self.workers[ind]
+        try:
+            task_id, answer, statistics = worker.conn.recv()
+
+        # the worker died, e.g. the verifier raised
+        except EOFError:
+            oracle_future = self.running.pop(worker.task_id)
+            self.cancelling.discard(worker.task_id)
+
+            worker.terminate()
+            self.workers[ind] = _Worker(self.verifier)
+
+            if oracle_future.future.set_running_or_notify_cancel():
+                oracle_future.future.set_exception(RuntimeError("The oracle's worker process died"))
+            return
+
+        worker.task_id  = None
+        oracle_future   = self.running.pop(task_id)
+        self.cancelling.discard(task_id)
+        if oracle_future.cancelled(): return
+
+        self.verifier.merge_statistics(*statistics)
+        oracle_future.future.set_running_or_notify_cancel()
+        oracle_future.future.set_result(answer)
+
+    def manage(self) -> None:
+        while True:
+            with self.lock:
+                self.kill_cancelled()
+
+                if self.closed and len(self.running) == 0:
+                    for worker in self.workers: worker.stop()
+                    return
+
+                self.dispatch()
+                conns = [worker.conn for worker in self.workers if worker.task_id is not None]
+
+            ready = multiprocessing.connection.wait(conns + [self.wakeup_recv])
+
+            with self.lock:
+                for ind, worker in enumerate(self.workers):
+                    if worker.conn in ready and worker.task_id is not None:
+                        self.receive(ind)
+
+                if self.wakeup_recv in ready:
+                    while self.wakeup_recv.poll(): self.wakeup_recv.recv()
+
+
+
+####################
+# Helper Functions #
+####################
+def wait_first(oracle_futures: typing.Iterable[OracleFuture]) -> typing.List[OracleFuture]:
+    """
+        #### Description:
+        Waits for the first of `oracle_futures` to be answered (or
+        cancelled). Returns all the `oracle_futures` done by then.
+    """
+    oracle_futures  = list(oracle_futures)
+    done, _         = concurrent.futures.wait(
+                        [oracle_future.future for oracle_future in oracle_futures],
+                        return_when = concurrent.futures.FIRST_COMPLETED
+                    )
+
+    return [oracle_future for oracle_future in oracle_futures if oracle_future.future in done]
@@ -0,0 +1,163 @@
+###########################################################
+# verification.harvesting
+# --------------------------------------------------------
+# Counterexample-guided witness harvesting, for the
+# top-down search. A witness of the oracle is reduced, with
+# the (cheap) NumPy forward pass of the verifier, to the
+# few coordinates responsible for the misclassification,
+# and each of them is cut, instead of only the coordinate
+# with the largest |x^c - x*|.
+###########################################################
+
+## Typing
+import typing
+
+## 3rd Party Libraries
+import numpy as np
+
+## Custom
+import verification.nn_verification as nn_verif
+
+
+# Cut_t := (ind, update_ub, value), i.e. the coordinate `ind` of
+# the counterexample, on the ub side (if `update_ub`) or on the lb
+# side of x_star, and its value closest to x_star
+Cut_t = typing.Tuple[typing.Tuple[int, int], bool, float]
+
+
+def is_harvestable(isSAT: nn_verif.NNVerification) -> bool:
+    # harvesting needs the verifier's forward pass
+    return hasattr(isSAT, "predict_argmax_batch")
+
+
+class WitnessHarvester:
+    """
+        #### Description:
+        Harvests the witnesses of `isSAT` (see `harvest()`). A point is
+        a counterexample if its predicted class is not `isSAT.c_star`.
+
+        #### Notes:
+        * Every point tested lies between x_star and the witness, hence
+        inside any guarantee containing both.
+        * The forward passes are batched, i.e. a witness costs
+        `O(1 + |responsible coordinates|)` forward passes, which are
+        negligible compared to an oracle call.
+    """
+
+    def __init__(self, isSAT: nn_verif.NNVerification):
+        assert is_harvestable(isSAT)
+
+        self.isSAT  = isSAT
+        self.c_star = isSAT.c_star
+
+        ## Statistics
+        self.num_harvested  = 0     # witnesses harvested
+        self.num_cuts       = 0     # cuts returned
+
+    ## Predicates
+    def are_counterexamples(self, X: np.ndarray) -> np.ndarray:
+        classes, _ = self.isSAT.predict_argmax_batch(X)
+        return classes != self.c_star
+
+    ## Operations
+    def minimize(self, witness: np.ndarray, x_star: np.ndarray) -> np.ndarray:
+        """
+            #### Description:
+            Resets to x_star as many coordinates of `witness` as possible,
+            keeping it a counterexample:
+            1. The coordinates are reset in increasing `|witness - x_star|`
+            order, and the longest prefix keeping a counterexample is
+            found with a single batched forward pass.
+            2. Each of the remaining coordinates is reset, greedily, if
+            the result is still a counterexample.
+
+            #### Output:
+            The reduced counterexample, or `witness` itself if `witness`
+            is not a counterexample.
+        """
+        abs_diff    = np.abs(witness - x_star).flatten()
+        order       = np.argsort(abs_diff)
+        order       = order[abs_diff[order] > 0]
+        if len(order) == 0: return witness
+
+        ## 1. Prefixes, i.e. prefixes[k] resets the first k coordinates
+        prefixes = np.repeat(witness.reshape((1, -1)), len(order) + 1, axis=0)
+        reset    = np.tril(np.ones((len(order) + 1, len(order)), dtype=bool), -1)
+        prefixes[:, order] = np.where(reset, x_star.flatten()[order], prefixes[:, order])
+
+        counterexamples = np.nonzero(self.are_counterexamples(prefixes.reshape((-1,) + witness.shape)))[0]
+        if len(counterexamples) == 0: return witness
+
+        k       = counterexamples[-1]
+        reduced = prefixes[k].copy()
+
+        ## 2. Greedy reset of the remaining coordinates
+        for ind in order[k:]:
+            value           = reduced[ind]
+            reduced[ind]    = x_star.flat[ind]
+            if not self.are_counterexamples(reduced.reshape((1,) + witness.shape))[0]:
+                reduced[ind] = value
+
+        return reduced.reshape(witness.shape)
+
+    def line_search(self, counterexample: np.ndarray, x_star: np.ndarray, delta: float) -> typing.List[Cut_t]:
+        """
+            #### Description:
+            For each coordinate where `counterexample` differs from x_star,
+            moves that coordinate alone towards x_star, on a `delta` grid,
+            and keeps the value closest to x_star that still gives a
+            counterexample. All the coordinates are searched with a single
+            batched forward pass.
+        """
+        diff    = counterexample - x_star
+        indices = list(zip(*np.nonzero(diff)))
+        if len(indices) == 0: return []
+
+        ## grid of each coordinate, from x_star (excluded) to the counterexample
+        points, owners, values = [], [], []
+        for owner, ind in enumerate(indices):
+            num_steps   = max(1, int(np.ceil(abs(diff[ind]) / delta)))
+            grid        = x_star[ind] + diff[ind] * np.arange(1, num_steps + 1) / num_steps
+            for value in grid:
+                point       = counterexample.copy()
+                point[ind]  = value
+                points.append(point)
+                owners.append(owner)
+                values.append(value)
+
+        is_counterexample = self.are_counterexamples(np.array(points))
+
+        ## the first counterexample of each grid, i.e. closest to x_star
+        closest = {}
+        for owner, value, found in zip(owners, values, is_counterexample):
+            if found and owner not in closest: closest[owner] = value
+
+        cuts = []
+        for owner, ind in enumerate(indices):
+            # the counterexample itself is on the grid
+            value = closest.get(owner, counterexample[ind])
+            cuts.append((ind, diff[ind] > 0, value))
+
+        return cuts
+
+    def harvest(self, witness: np.ndarray, x_star: np.ndarray, delta: float) -> typing.List[Cut_t]:
+        """
+            #### Description:
+            The cuts of `witness`, i.e. the line searched coordinates of
+            its reduced counterexample (see `minimize()`, `line_search()`).
+            Excluding any one of the cuts excludes the reduced counterexample.
+
+            #### Notes:
+            Returns no cuts if `witness` is not a counterexample of the
+            forward pass, e.g. a spurious witness of the solver.
+        """
+        if witness is None: return []
+        if not self.are_counterexamples(witness.reshape((1,) + witness.shape))[0]: return []
+
+        counterexample  = self.minimize(witness, x_star)
+        cuts            = self.line_search(counterexample, x_star, delta)
+
+        self.num_harvested  += 1
+        self.num_cuts       += len(cuts)
+
+        return cuts
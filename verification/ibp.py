@@ -0,0 +1,203 @@
+###########################################################
+# verification.ibp
+# --------------------------------------------------------
+# Interval Bound Propagation (IBP). A cheap, pure-NumPy,
+# first stage for the sound Marabou verifier: if the
+# interval arithmetic over the network proves that no
+# adversarial example exists in the given bounds, we skip
+# the (expensive) Marabou call.
+###########################################################
+
+#############
+# Libraries #
+#############
+# python libraries
+import time
+import typing
+
+# 3rd party libraries
+import numpy as np
+
+# custom libraries
+import sys
+sys.path.append('..')
+import verification.nn_verification as nn_verif
+import verification.onnx_mlp as onnx_mlp
+
+from geometry.constants import epsilon
+
+
+#####################
+# Bound Propagation #
+#####################
+def propagate(
+        layers: typing.List[onnx_mlp.Layer_t],
+        lb:     np.ndarray,
+        ub:     np.ndarray
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+        #### Description:
+        Propagates the box `[lb, ub]` (flat vectors) through `layers`.
+        Returns a box containing all the outputs of the layers.
+    """
+    for W, b, relu in layers:
+        center = (ub + lb) / 2
+        radius = (ub - lb) / 2
+
+        center = center @ W + b
+        radius = radius @ np.abs(W)
+
+        lb = center - radius
+        ub = center + radius
+        if relu:
+            lb = np.maximum(lb, 0)
+            ub = np.maximum(ub, 0)
+
+    return lb, ub
+
+
+def max_score_differences(
+        layers: typing.List[onnx_mlp.Layer_t],
+        c_star: int,
+        lb:     np.ndarray,
+        ub:     np.ndarray
+    ) -> np.ndarray:
+    """
+        #### Description:
+        Upper bounds of `y_i - y_{c_star}`, for each class `i`, over the
+        box `[lb, ub]`.
+
+        #### Notes:
+        For the last layer we bound the differences directly, i.e. using
+        the weights `W[:, i] - W[:, c_star]`. This is tighter than
+        subtracting the bounds of `y_i` and `y_{c_star}`.
+    """
+    h_lb, h_ub = propagate(layers[:-1], lb, ub)
+
+    W, b, relu = layers[-1]
+    assert not relu, "The output layer should not have a ReLU"
+
+    W_diff = W - W[:, [c_star]]
+    b_diff = b - b[c_star]
+
+    center = (h_ub + h_lb) / 2
+    radius = (h_ub - h_lb) / 2
+
+    return center @ W_diff + radius @ np.abs(W_diff) + b_diff
+
+
+#################
+# IBP Prefilter #
+#################
+class IBPSoundVerifier(nn_verif.NNVerification):
+    """
+        #### Description:
+        Wraps a `SoundMarabouVerifier`. For each oracle call, first we
+        bound the differences `y_i - y_{c_star}` over the given bounds.
+        If all of them are below Marabou's `epsilon` (i.e. the slack
+        used by the disjunction of the sound verifier), then the query
+        is UNSAT, and we return without calling Marabou. Otherwise, the
+        bounds are inconclusive, and we fall through to Marabou.
+
+        #### Notes:
+        * The statistics of this class count *all* the oracle calls.
+        The calls resolved by IBP are counted in `num_prefilter_hits`.
+        * IBP only proves UNSAT, hence the witnesses are always the
+        ones of Marabou.
+    """
+
+    def __init__(self, verifier: "marabou_verif.SoundMarabouVerifier"):
+        # NOTE: the bound propagation needs only NumPy, Marabou is
+        # imported with the verifier it wraps
+        import verification.marabou as marabou_verif
+        assert isinstance(verifier, marabou_verif.SoundMarabouVerifier)
+        super().__init__(verifier.c_star, verifier.model_description)
+
+        self.verifier   = verifier
+        self.layers     = verifier.network.layers
+
+        ## Dimensions
+        self.row_dim    = verifier.row_dim
+        self.column_dim = verifier.column_dim
+        self.domain     = verifier.domain
+
+        ## Statistics
+        self.num_prefilter_hits = 0
+
+    ## Pickling
+    # see `verification.marabou.MarabouVerification.__reduce__()`
+    def __reduce__(self):
+        return (self.__class__, (self.verifier,))
+
+    ## Persistent Result Store
+    def open_result_store(self, path: str) -> None:
+        self.verifier.open_result_store(path)
+
+    ## Mutators
+    def reset_statistics(self):
+        super().reset_statistics()
+
+        self.num_prefilter_hits = 0
+        self.verifier.reset_statistics()
+
+    def close(self) -> None:
+        self.verifier.close()
+
+    def set_deadline(self, deadline) -> None:
+        # the deadline of the inner verifier's solver calls
+        super().set_deadline(deadline)
+        self.verifier.set_deadline(deadline)
+
+    ## Accessors
+    def get_num_prefilter_hits(self) -> int:
+        return self.num_prefilter_hits
+
+    def get_extra_statistics(self) -> typing.Dict[str, typing.Union[int, float]]:
+        extra_statistics = self.verifier.get_extra_statistics()
+        extra_statistics["IBP Short-Circuits"] = self.num_prefilter_hits
+
+        return extra_statistics
+
+    ## Predictions
+    def predict(self, X):
+        return self.verifier.predict(X)
+
+    def predict_argmax(self, X):
+        return self.verifier.predict_argmax(X)
+
+    def predict_argmax_batch(self, X):
+        return self.verifier.predict_argmax_batch(X)
+
+    ## Predicates
+    def is_proven_safe(self, bounds) -> bool:
+        differences = max_score_differences(
+                        self.layers,
+                        self.c_star,
+                        bounds.lb.reshape(-1),
+                        bounds.ub.reshape(-1)
+                    )
+        differences[self.c_star] = -np.inf
+
+        # we keep a small margin for numerical errors
+        return np.max(differences) < self.verifier.epsilon - epsilon
+
+    ## Operations
+    def __call__(self, bounds):
+        tic = time.time()
+
+        if self.is_proven_safe(bounds):
+            self.num_prefilter_hits += 1
+            self.set_statistics(time.time() - tic)
+            self.last_source        = nn_verif.source_ibp
+
+            return True, None
+
+        soundness, witness  = self.verifier(bounds)
+        self.num_timeouts   = self.verifier.get_timeouts()
+        self.set_statistics(time.time() - tic)
+
+        # the inner verifier's answer
+        self.last_source        = self.verifier.last_source
+        self.last_solver_time   = self.verifier.last_solver_time
+
+        return soundness, witness
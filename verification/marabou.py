@@ -2,7 +2,10 @@
 # Libraries #
 #############
 # python libraries
+import os
+import math
 import time
+import multiprocessing
 
 # 3rd party libraries
 import numpy as np
@@ -15,6 +18,10 @@ from maraboupy import MarabouUtils
 import sys
 sys.path.append('..')
 import verification.nn_verification as nn_verif
+import verification.onnx_mlp as onnx_mlp
+import verification.caches as caches
+import verification.result_store as result_store
+import verification.futures as futures
 
 from geometry.constants import epsilon
 
@@ -43,9 +50,60 @@ wrong_class_sat = True
 ## exit codes
 wrong_class_exit_code = 10
 
+## Complete Encoding
+# the complete verifier asks for a point of class c_star at least
+# complete_margin outside the bounds, in each coordinate's face
+complete_margin = 1e-1
+
+## Caches
+# max. number of witnesses kept in memory
+witness_cache_capacity  = 256
+# max. number of proven UNSAT boxes kept in memory
+safe_cache_capacity     = 256
+
+## Solver Options
+# the arguments of Marabou.createOptions()
+# NOTE: "timeoutInSeconds" is the *longest* call, each call gets
+# the timeout of NNVerification.get_call_timeout() (see timed())
+default_options = {
+    "numWorkers":       8,
+    "timeoutInSeconds": 360,
+    "verbosity":        0,
+    # BE CAREFUL Gurobi does NOT support
+    # disjunction of constraints.
+    # DO NOT set to True!
+    "solveWithMILP":    False
+}
+
+## Solver Portfolio
+# the configurations raced by PortfolioSoundMarabouVerifier,
+# as changes to the default options
+# NOTE: MILP needs disjunction-free queries, hence it is
+# not part of the (disjunctive) sound query's portfolio.
+# NOTE: the configurations race on the same machine, hence each
+# one is capped to its share of the cores, i.e. "numWorkers" is
+# solver_threads(#configurations), unless set below.
+portfolio = {
+    "default":          {},
+    "single-worker":    {"numWorkers": 1},
+    "dnc":              {"snc": True},
+    "polarity":         {"splittingStrategy": "polarity"},
+    "largest-interval": {"splittingStrategy": "largest-interval"}
+}
+
 ####################
 # Helper Functions #
 ####################
+def solver_threads(num_concurrent: int) -> int:
+    """
+        #### Description:
+        The threads of each of `num_concurrent` Marabou calls solved at
+        once on this machine, i.e. the cores are split between them, up to
+        the default "numWorkers".
+    """
+    return max(1, min(default_options["numWorkers"], (os.cpu_count() or 1) // num_concurrent))
+
+
 def marabou2numpy(counterexample_dict, select_first_n, row_dim, column_dim):
     return np.array(list(counterexample_dict.values()))[0:select_first_n].reshape((row_dim, column_dim))
 
@@ -69,17 +127,19 @@ class MarabouVerification(nn_verif.NNVerification):
     def __init__(self, c_star, model_path_onnx, domain, epsilon=1):
         ## Initialize super class
         super().__init__(c_star, Marabou.read_onnx(model_path_onnx))
+        self.model_path_onnx = model_path_onnx
+
+        ## NumPy inference engine, used for the predictions
+        self.network = onnx_mlp.NumpyNeuralNetwork(model_path_onnx)
 
         ## create options
-        self.options = Marabou.createOptions(   
-                                                numWorkers      = 8,
-                                                timeoutInSeconds= 360,
-                                                verbosity       = 0,
-                                                # BE CAREFUL Gurobi does NOT support
-                                                # disjunction of constraints.
-                                                # DO NOT set to True!
-                                                solveWithMILP=False
-                                            )
+        self.options = Marabou.createOptions(**default_options)
+
+        ## Timeout of the current call (secs), see timed()
+        self.call_timeout = default_options["timeoutInSeconds"]
+        # time.time() at the end of the current call, i.e. the
+        # parts of a split query share its timeout (see time_left())
+        self.call_end     = math.inf
 
         ## get the *symbolic* I/O variables from marabou
         self.inputVars   = self.model_description.inputVars[0][0]
@@ -108,37 +168,361 @@ class MarabouVerification(nn_verif.NNVerification):
         self.epsilon = epsilon  # minimum slack between the 1st and
                                 # the 2nd class score
 
+        ## Witness Cache
+        # witnesses returned by Marabou, re-used for later bounds
+        # (see is_witness_inside, in the subclasses)
+        self.witness_cache          = caches.WitnessCache(
+                                        self.row_dim,
+                                        self.column_dim,
+                                        self.is_witness_inside,
+                                        witness_cache_capacity,
+                                        self.witness_margin
+                                    )
+        self.num_witness_hits       = 0
+
+        ## Safe Box Cache
+        # boxes proven UNSAT by Marabou, re-used by monotonicity
+        self.safe_cache             = caches.SafeBoxCache(
+                                        self.row_dim,
+                                        self.column_dim,
+                                        self.is_witness_inside,
+                                        safe_cache_capacity
+                                    )
+        self.num_safe_hits          = 0
+
+        ## Persistent Result Store
+        # disabled by default, see open_result_store()
+        self.result_store           = None
+
+        ## Split Queries
+        # used only by the verifiers splitting a query in parts,
+        # see solve_split()
+        self.num_split_workers      = 1
+        self.split_pool             = None
+        self.num_split_parts        = 0     # parts solved by Marabou
+
+        ## Deadline
+        # queries answered "unknown" without calling Marabou, since the
+        # search's deadline had passed (see __call__), i.e. *not* timeouts
+        self.num_skipped            = 0
+        self.part_threads           = None  # threads of a part solved by a
+                                            # worker, see solve_part_within()
+
+
+    ## Pickling
+    # Marabou's network description cannot be pickled. Instead,
+    # we pickle the constructor's arguments and re-read the .onnx
+    # file, e.g. when the verifier is sent to a worker process.
+    # The statistics of the copy start from zero.
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (self.c_star, self.model_path_onnx, self.domain, self.epsilon)
+        )
+
+
+    ## Persistent Result Store
+    def open_result_store(self, path: str) -> None:
+        # already open, e.g. a re-used verifier
+        if self.result_store is not None and self.result_store.path == path: return
+
+        self.result_store = result_store.ResultStore(
+                                path,
+                                self.model_path_onnx,
+                                self.__class__.__name__,
+                                self.c_star,
+                                self.epsilon,
+                                self.is_witness_inside,
+                                self.row_dim,
+                                self.column_dim,
+                                self.witness_margin
+                            )
+
+
+    ## Mutators
+    # NOTE: the caches are kept, they remain valid
+    # for any input of the same verifier.
+    def reset_statistics(self):
+        super().reset_statistics()
+
+        self.num_witness_hits   = 0
+        self.num_safe_hits      = 0
+        self.num_skipped        = 0
+        if self.result_store is not None: self.result_store.num_hits = 0
+
+
+    ## Accessors
+    def get_num_witness_hits(self) -> int:
+        return self.num_witness_hits
+
+    def get_witness_hit_rate(self) -> float:
+        num_queries = self.num_calls + self.num_witness_hits
+        if num_queries == 0: return 0.0
+        return self.num_witness_hits / num_queries
+
+    def get_num_safe_hits(self) -> int:
+        return self.num_safe_hits
+
+    def get_num_skipped(self) -> int:
+        return self.num_skipped
+
+    def get_num_store_hits(self) -> int:
+        if self.result_store is None: return 0
+        return self.result_store.num_hits
+
+    def get_saved_time(self) -> float:
+        # estimation: each cache hit saves an avg. solver call
+        if self.num_calls == 0: return 0.0
+        num_hits = self.num_witness_hits + self.num_safe_hits + self.get_num_store_hits()
+        return num_hits * self.get_avg_time()
+
+    def get_extra_statistics(self):
+        extra_statistics = {
+            "Witness Hits":     self.num_witness_hits,
+            "Witness Hit Rate": round(self.get_witness_hit_rate(), 4),
+            "Safe Box Hits":    self.num_safe_hits,
+            "Saved Time":       round(self.get_saved_time(), 2),
+            "Skipped Calls":    self.num_skipped
+        }
+        if self.result_store is not None:
+            extra_statistics["Store Hits"] = self.get_num_store_hits()
+        
+        return extra_statistics
+
 
     ## Predicates
+    # True if the witnesses of the verifier lie *inside*
+    # the bounds, False if they lie *outside*
+    is_witness_inside = True
+    # the min. distance of an outside witness from the bounds,
+    # i.e. the one of the solver's query
+    witness_margin = 0.0
+
+    def is_counterexample(self, witness) -> bool:
+        raise NotImplementedError()
+
     def check_witness(self, witness, bounds):
         raise NotImplementedError()
 
     ## Predictions
-    # * The second argument in the evaluate() method is a flag for
-    # using Marabou for the evaluation.
-    # * Using Marabou to make prediction is *completely* unstable!
-    # so its usage is discouraged.
-    # * The last argument of the evaluate() method is a path to
-    # redirect the output of the evaluation method.
-    # * We pass an empty string, since we set verbose=False at the
-    # options. Thus, keeping the evaluation silent.
+    # * Using Marabou to make prediction, i.e. the evaluate()
+    # method, is *completely* unstable! so its usage is discouraged.
+    # * Instead, we use the NumPy inference engine, reading the
+    # same .onnx file (see verification.onnx_mlp).
     def predict(self, X):
-        return self.model_description.evaluate([X], False, self.options, "")
+        return self.network.predict(X)
     
     def predict_argmax(self, X):
-        predictions_vector  = self.predict(X)[0][0]
-        prediction_class    = np.argmax(predictions_vector)
-        prediction_value    = predictions_vector[prediction_class]
+        return self.network.predict_argmax(X)
 
-        return prediction_class, prediction_value
+    def predict_argmax_batch(self, X):
+        return self.network.predict_argmax_batch(X)
 
 
 
     ## Operations
+    # The solver options, with the timeout of the current call
+    # (and, in a worker of the split pool, its share of the cores)
+    def timed(self, options):
+        options._timeoutInSeconds = max(1, math.ceil(self.call_timeout))
+        if self.part_threads is not None: options._numWorkers = min(options._numWorkers, self.part_threads)
+        return options
+
+    # Solves the current query. Returns Marabou's
+    # [exit code, values, statistics] triplet.
+    def solve(self):
+        return self.model_description.solve(options=self.timed(self.options), verbose=False)
+
+    ## Split Queries
+    # A query may be split in independent conjunctive *parts*
+    # (no disjunctions), solved by `solve_part()`. The query is
+    # SAT iff any of its parts is SAT.
+    def solve_part(self, bounds, part):
+        raise NotImplementedError()
+
+    def time_left(self) -> float:
+        # of the current call, i.e. the timeout of its next part
+        return self.call_end - time.time()
+
+    def solve_part_within(self, bounds, part, call_end):
+        # solve_part(), run by a worker of the split pool, within the
+        # time left of the (main process') current call, and with its
+        # share of the cores, i.e. the parts solved at once do not
+        # oversubscribe the machine. A part queued past the end of the
+        # call is not solved, i.e. it is unknown.
+        self.call_end       = call_end
+        self.call_timeout   = self.time_left()
+        if self.call_timeout <= 0: return marabou_retvals[timeout], {}, None
+
+        self.part_threads = solver_threads(self.num_split_workers)
+        return self.solve_part(bounds, part)
+
+    def part_unsat(self, part) -> None:
+        # called (in this process) for each UNSAT part,
+        # e.g. to remember it for the next queries
+        pass
+
+    def get_split_pool(self):
+        # only the main process splits in parallel. The workers of an
+        # outer pool (e.g. -w, the server's or -cfg's) already share the
+        # cores, there the parts are solved sequentially.
+        if self.split_pool is None and self.num_split_workers > 1 and multiprocessing.parent_process() is None:
+            self.split_pool = futures.OraclePool(self, self.num_split_workers)
+
+        return self.split_pool
+
+    def close(self) -> None:
+        # the split pool is started again by the next split query
+        if self.split_pool is not None:
+            self.split_pool.shutdown()
+            self.split_pool = None
+
+    def solve_split(self, bounds, parts):
+        """
+            #### Description:
+            Solves the `parts` of the query, in parallel on the split pool
+            (if any), and returns as soon as a part is SAT, cancelling the
+            rest. Returns Marabou's triplet: the SAT part's, else a timeout
+            if some part timed out, else UNSAT.
+
+            #### Notes:
+            * The statistics of the triplet are dropped, they cannot be sent
+            back from the workers.
+            * The parts share the timeout of the call, i.e. each part gets
+            the time left (see `time_left()`). Past the end of the call, the
+            rest of the parts are not solved, and the query times out.
+        """
+        split_pool  = self.get_split_pool()
+        timed_out   = False
+
+        ## Sequential
+        if split_pool is None or len(parts) < 2:
+            for part in parts:
+                self.call_timeout = self.time_left()
+                if self.call_timeout <= 0: return marabou_retvals[timeout], {}, None
+
+                self.num_split_parts += 1
+                marabou_val = self.solve_part(bounds, part)
+                if marabou_val[0] == marabou_retvals[sat]: return marabou_val
+                if marabou_val[0] == marabou_retvals[unsat]: self.part_unsat(part)
+                timed_out = timed_out or marabou_val[0] == marabou_retvals[timeout]
+        
+        ## Parallel
+        else:
+            in_flight = {
+                            split_pool.submit_task("solve_part_within", bounds, part, self.call_end): part
+                            for part in parts
+                        }
+            while len(in_flight) > 0:
+                for oracle_future in futures.wait_first(in_flight.keys()):
+                    part = in_flight.pop(oracle_future)
+                    self.num_split_parts += 1
+
+                    marabou_val = oracle_future.result()
+                    if marabou_val[0] == marabou_retvals[sat]:
+                        split_pool.cancel_all(in_flight.keys())
+                        return marabou_val
+                    if marabou_val[0] == marabou_retvals[unsat]: self.part_unsat(part)
+                    timed_out = timed_out or marabou_val[0] == marabou_retvals[timeout]
+
+                ## past the end of the call
+                if len(in_flight) > 0 and self.time_left() <= 0:
+                    split_pool.cancel_all(in_flight.keys())
+                    return marabou_retvals[timeout], {}, None
+
+        if timed_out:   return marabou_retvals[timeout], {}, None
+        else:           return marabou_retvals[unsat], {}, None
+
+    def solve_race(self, bounds, parts):
+        """
+            #### Description:
+            Solves the *same* query once per part (e.g. per solver
+            configuration), in parallel on the split pool, and returns the
+            first definitive answer (SAT or UNSAT), cancelling the rest.
+
+            #### Output:
+            Marabou's triplet (see `solve_split()`) and the winning part, or
+            `None` if every part timed out (or the call ran out of time).
+        """
+        split_pool = self.get_split_pool()
+
+        ## Sequential, i.e. the parts in order
+        if split_pool is None:
+            for part in parts:
+                self.call_timeout = self.time_left()
+                if self.call_timeout <= 0: break
+
+                marabou_val = self.solve_part(bounds, part)
+                if marabou_val[0] != marabou_retvals[timeout]: return marabou_val, part
+
+            return (marabou_retvals[timeout], {}, None), None
+
+        ## Parallel
+        in_flight = {
+                            split_pool.submit_task("solve_part_within", bounds, part, self.call_end): part
+                            for part in parts
+                        }
+        while len(in_flight) > 0:
+            for oracle_future in futures.wait_first(in_flight.keys()):
+                part        = in_flight.pop(oracle_future)
+                marabou_val = oracle_future.result()
+                if marabou_val[0] != marabou_retvals[timeout]:
+                    split_pool.cancel_all(in_flight.keys())
+                    return marabou_val, part
+
+            ## past the end of the call
+            if len(in_flight) > 0 and self.time_left() <= 0:
+                split_pool.cancel_all(in_flight.keys())
+                break
+
+        return (marabou_retvals[timeout], {}, None), None
+
+    # Encodes the bounds to the query
+    def set_input_constraints(self, bounds):
+        raise NotImplementedError()
+
     ## Checking Explanation's Soundness
     def __call__(self, bounds):
+        ## known witness
+        witness = self.witness_cache.find(bounds)
+        if witness is not None:
+            self.num_witness_hits   += 1
+            self.last_source        = nn_verif.source_witness_cache
+            return False, witness
+        
+        ## known UNSAT box
+        if self.safe_cache.find(bounds):
+            self.num_safe_hits  += 1
+            self.last_source    = nn_verif.source_safe_cache
+            return True, None
+
+        ## already solved (e.g. by a previous run)
+        if self.result_store is not None:
+            stored = self.result_store.find(bounds)
+            if stored is not None:
+                soundness, witness  = stored
+                self.last_source    = nn_verif.source_store
+                if soundness:   self.safe_cache.add(bounds)
+                else:           self.witness_cache.add(witness)
+                return soundness, witness
+
+        ## out of time, i.e. the search's deadline has passed
+        # (counted apart from the solver's timeouts)
+        self.call_timeout = self.get_call_timeout(default_options["timeoutInSeconds"])
+        if self.call_timeout <= 0:
+            self.num_skipped    += 1
+            self.last_source    = nn_verif.source_deadline
+            return False, None
+
+        self.call_end = time.time() + self.call_timeout
+
+        self.last_source = nn_verif.source_solver
+
+        ## call Marabou
+        self.set_input_constraints(bounds)
+
         marabou_tic = time.time()
-        marabou_val = self.model_description.solve(options=self.options, verbose=False)
+        marabou_val = self.solve()
         marabou_toc = time.time()
         self.set_statistics(marabou_toc - marabou_tic)
         assert marabou_val[0] in marabou_retvals, \
@@ -146,11 +530,15 @@ class MarabouVerification(nn_verif.NNVerification):
         
 
         ## Return Values
-        # We handle timeout as unsat. This breaks soundness of our algorithm
-        if  (marabou_val[0] == marabou_retvals[unsat]) or\
-            (marabou_val[0] == marabou_retvals[timeout]):
+        # We handle timeout as *unknown*, i.e. not proven, without
+        # a witness. The searches reject the bounds and move on.
+        if marabou_val[0] == marabou_retvals[timeout]:
+            self.num_timeouts += 1
+            return False, None
 
-            if marabou_val[0] == marabou_retvals[timeout]: self.num_timeouts += 1
+        if marabou_val[0] == marabou_retvals[unsat]:
+            self.safe_cache.add(bounds)
+            if self.result_store is not None: self.result_store.add(bounds, True, None)
 
             return True, None
         
@@ -158,6 +546,11 @@ class MarabouVerification(nn_verif.NNVerification):
             witness = marabou2numpy(marabou_val[1], self.dim, self.row_dim, self.column_dim)
             self.check_witness(witness, bounds)
 
+            # cache only *genuine* witnesses (see wrong_class_sat)
+            if self.is_counterexample(witness):
+                self.witness_cache.add(witness)
+                if self.result_store is not None: self.result_store.add(bounds, False, witness)
+
             return False, witness
 
 
@@ -170,6 +563,21 @@ class SoundMarabouVerifier(MarabouVerification):
     def __init__(self, c_star, model_path_onnx, domain, epsilon=1):
         super().__init__(c_star, model_path_onnx, domain, epsilon)
 
+        self.add_output_constraints()
+
+        ## Incremental Query
+        # Between two consecutive oracle calls, usually only a few
+        # input bounds change (e.g. a single coordinate in the DFS
+        # algorithms). Thus, we keep the Marabou input query alive,
+        # together with the input bounds it currently encodes, and
+        # push only the bounds that changed.
+        self.input_query    = None              # created on the first call
+        self.query_lb       = domain.lb.copy()  # input bounds encoded
+        self.query_ub       = domain.ub.copy()  # in the input query
+        # NOTE: the input query is not pickled (see `__reduce__()`),
+        # a copy rebuilds it on its first call.
+
+    def add_output_constraints(self):
         ## Set Ouput Constraints For Negative Counter Examples
         # i.e. Adversarial Examples
         # at least one of the output variables exeeding the correct class
@@ -190,27 +598,46 @@ class SoundMarabouVerifier(MarabouVerification):
         # \/_{i != c_star} [y_i - y_{c_star} >= e]
         self.model_description.addDisjunctionConstraint(out_constraints)
 
+    ###########################
+    # Incremental Input Query #
+    ###########################
+    def update_bounds(self, bounds):
+        ## build the input query, only once
+        # (the network's bounds are set to the domain)
+        if self.input_query is None:
+            self.input_query = self.model_description.getInputQuery()
+        
+        ## push only the changed lower bounds
+        for i, j in zip(*np.nonzero(bounds.lb != self.query_lb)):
+            self.input_query.setLowerBound(int(self.inputVars[i][j]), float(bounds.lb[i][j]))
+        
+        ## push only the changed upper bounds
+        for i, j in zip(*np.nonzero(bounds.ub != self.query_ub)):
+            self.input_query.setUpperBound(int(self.inputVars[i][j]), float(bounds.ub[i][j]))
+
+        self.query_lb = bounds.lb.copy()
+        self.query_ub = bounds.ub.copy()
+    
+    def solve(self):
+        # NOTE: Marabou preprocesses a *copy* of the input query,
+        # hence the input query can be reused.
+        return MarabouCore.solve(self.input_query, self.timed(self.options), "")
+
     ###############
     # Call Method #
     ###############
-    def __call__(self, bounds):
-        ## set input constraints
-        for i in range(self.inputVars.shape[0]):
-            for j in range(self.inputVars.shape[1]):
-                self.model_description.setUpperBound(
-                                                self.inputVars[i][j],
-                                                bounds.ub[i][j]
-                                            )
-                self.model_description.setLowerBound(
-                                                self.inputVars[i][j],
-                                                bounds.lb[i][j]
-                                            )
-
-        return super().__call__(bounds)
+    def set_input_constraints(self, bounds):
+        self.update_bounds(bounds)
 
     ###########################
     # Check Marabou's Witness #
     ###########################
+    # an adversarial example, inside the bounds
+    is_witness_inside = True
+
+    def is_counterexample(self, witness) -> bool:
+        return self.predict_argmax(witness)[0] != self.c_star
+
     def check_witness(self, witness, bounds):
         prediction, _ =  self.predict_argmax(witness)
 
@@ -239,6 +666,222 @@ class SoundMarabouVerifier(MarabouVerification):
 
 
 
+################################
+# Split Sound Marabou Verifier #
+################################
+class SplitSoundMarabouVerifier(SoundMarabouVerifier):
+    """
+        #### Description:
+        As `SoundMarabouVerifier`, but instead of the disjunction
+            `\/_{i != c_star} [y_i - y_{c_star} >= e]`
+        each query is split in one conjunctive query per *rival* class `i`,
+        solved in parallel on `num_split_workers` processes (see
+        `solve_split()`). The first SAT rival answers the query.
+
+        #### Notes:
+        * The rivals that IBP bounds below `e` are pruned, and the rest
+        are solved in decreasing order of their IBP bound, i.e. the most
+        likely SAT rivals first.
+        * The rivals' input queries are built on their first query (see
+        `get_rival_query()`), and updated incrementally, as the input query
+        of `SoundMarabouVerifier`. Hence, a worker process builds only the
+        queries of the rivals it solves.
+        * The rivals solved at once share the cores (see `solver_threads()`),
+        and inside the workers of an outer pool they are solved sequentially.
+    """
+    def __init__(self, c_star, model_path_onnx, domain, epsilon=1, num_split_workers=None):
+        super().__init__(c_star, model_path_onnx, domain, epsilon)
+
+        self.rivals = [y for y in range(len(self.outputVars)) if y != self.c_star]
+
+        ## Parallel Mode
+        if num_split_workers is None: num_split_workers = min(len(self.rivals), os.cpu_count() or 1)
+        assert num_split_workers > 0
+        self.num_split_workers = num_split_workers
+
+        ## A conjunctive input query per rival class
+        # rival -> [input query, lb, ub encoded], see get_rival_query()
+        self.rival_queries = {}
+
+        ## Statistics
+        self.num_pruned_rivals = 0
+
+    def add_output_constraints(self):
+        # no disjunction, the network's query is the base of
+        # the rivals' queries (see get_rival_query())
+        pass
+
+    def get_rival_query(self, rival):
+        """
+            #### Description:
+            The input query of `rival`, i.e. the network's query (with the
+            domain's bounds) and the equation
+                `y_rival - y_{c_star} >= e`
+            built on the first query of `rival`, without re-reading the
+            network, and cached with the input bounds it encodes.
+        """
+        if rival not in self.rival_queries:
+            input_query = self.model_description.getInputQuery()
+
+            rival_equation = MarabouCore.Equation(MarabouCore.Equation.GE)
+            rival_equation.addAddend(1.0, int(self.outputVars[rival]))
+            rival_equation.addAddend(-1.0, int(self.outputVars[self.c_star]))
+            rival_equation.setScalar(1.0 * self.epsilon)
+            input_query.addEquation(rival_equation)
+
+            self.rival_queries[rival] = [input_query, self.domain.lb.copy(), self.domain.ub.copy()]
+
+        return self.rival_queries[rival]
+
+    ## Pruning
+    def get_rivals(self, bounds):
+        # NOTE: verification.ibp imports this module
+        import verification.ibp as ibp
+
+        differences = ibp.max_score_differences(
+                        self.network.layers,
+                        self.c_star,
+                        bounds.lb.reshape(-1),
+                        bounds.ub.reshape(-1)
+                    )
+
+        # we keep a small margin for numerical errors
+        rivals = [rival for rival in self.rivals if differences[rival] >= self.epsilon - epsilon]
+        self.num_pruned_rivals += len(self.rivals) - len(rivals)
+
+        return sorted(rivals, key=lambda rival: -differences[rival])
+
+    ## Accessors
+    def get_extra_statistics(self):
+        extra_statistics = super().get_extra_statistics()
+        extra_statistics["Pruned Rivals"]   = self.num_pruned_rivals
+        extra_statistics["Rival Queries"]   = self.num_split_parts
+
+        return extra_statistics
+
+    def reset_statistics(self):
+        super().reset_statistics()
+
+        self.num_pruned_rivals  = 0
+        self.num_split_parts    = 0
+
+    ###############
+    # Call Method #
+    ###############
+    def set_input_constraints(self, bounds):
+        # the rivals' queries are updated by solve_part()
+        self.split_bounds = bounds
+
+    def solve(self):
+        return self.solve_split(self.split_bounds, self.get_rivals(self.split_bounds))
+
+    def solve_part(self, bounds, rival):
+        input_query, query_lb, query_ub = self.get_rival_query(rival)
+
+        ## push only the changed bounds
+        for i, j in zip(*np.nonzero(bounds.lb != query_lb)):
+            input_query.setLowerBound(int(self.inputVars[i][j]), float(bounds.lb[i][j]))
+        for i, j in zip(*np.nonzero(bounds.ub != query_ub)):
+            input_query.setUpperBound(int(self.inputVars[i][j]), float(bounds.ub[i][j]))
+
+        self.rival_queries[rival][1] = bounds.lb.copy()
+        self.rival_queries[rival][2] = bounds.ub.copy()
+
+        exit_code, values, _ = MarabouCore.solve(input_query, self.timed(self.options), "")
+        return exit_code, values, None
+
+
+
+####################################
+# Portfolio Sound Marabou Verifier #
+####################################
+class PortfolioSoundMarabouVerifier(SoundMarabouVerifier):
+    """
+        #### Description:
+        As `SoundMarabouVerifier`, but each query is raced under several
+        solver configurations (see `portfolio`), one process each (see
+        `solve_race()`). The first definitive answer wins, and the other
+        configurations are killed.
+
+        #### Notes:
+        * The wins of each configuration are reported in the extra
+        statistics, and traced as the source `solver:<configuration>` (see
+        `verification.tracing`), e.g. to pick a default per network.
+        * Each configuration runs on its share of the cores (see
+        `portfolio`), so that the wins compare the configurations under
+        the same threads, and not their contention. The threads are
+        reported as `Threads/Config`.
+        * Only the parallel races count wins. Without a split pool (e.g.
+        inside the workers of an outer pool) the configurations are
+        tried in order, and the first one would always "win".
+        * Killed configurations cost a new worker process each, hence
+        racing pays off for hard queries.
+    """
+    def __init__(self, c_star, model_path_onnx, domain, epsilon=1, configurations=None):
+        super().__init__(c_star, model_path_onnx, domain, epsilon)
+
+        if configurations is None: configurations = list(portfolio.keys())
+        assert len(configurations) > 0
+
+        ## Solver configurations
+        # each one capped to its share of the cores
+        self.configurations         = configurations
+        self.config_threads         = solver_threads(len(configurations))
+        self.portfolio_options      = {
+                                        name: Marabou.createOptions(**{
+                                            **default_options,
+                                            "numWorkers": self.config_threads,
+                                            **portfolio[name]
+                                        })
+                                        for name in configurations
+                                    }
+        self.num_split_workers      = len(configurations)
+
+        ## Statistics
+        self.portfolio_wins         = {name: 0 for name in configurations}
+
+    ## Accessors
+    def get_portfolio_wins(self) -> dict:
+        return self.portfolio_wins
+
+    def get_extra_statistics(self):
+        extra_statistics = super().get_extra_statistics()
+        extra_statistics["Threads/Config"] = self.config_threads
+        for name, wins in self.portfolio_wins.items():
+            extra_statistics["Wins " + name] = wins
+
+        return extra_statistics
+
+    def reset_statistics(self):
+        super().reset_statistics()
+
+        self.portfolio_wins = {name: 0 for name in self.configurations}
+
+    ###############
+    # Call Method #
+    ###############
+    def set_input_constraints(self, bounds):
+        # the input query is updated by solve_part()
+        self.split_bounds = bounds
+
+    def solve(self):
+        marabou_val, winner = self.solve_race(self.split_bounds, self.configurations)
+
+        # a sequential "race" has no winner (see the notes above)
+        if winner is not None and self.split_pool is not None:
+            self.portfolio_wins[winner] += 1
+            self.last_source = nn_verif.source_solver + ":" + winner
+
+        return marabou_val
+
+    def solve_part(self, bounds, name):
+        self.update_bounds(bounds)
+
+        exit_code, values, _ = MarabouCore.solve(self.input_query, self.timed(self.portfolio_options[name]), "")
+        return exit_code, values, None
+
+
+
 #############################
 # Complete Marabou Verifier #
 #############################
@@ -260,7 +903,7 @@ class CompleteMarabouVerifier(MarabouVerification):
     ###############
     # Call Method #
     ###############
-    def __call__(self, bounds):
+    def set_input_constraints(self, bounds):
         # clear previous disjunctions
         self.model_description.disjunctionList = []
         out_constraints = []
@@ -272,23 +915,28 @@ class CompleteMarabouVerifier(MarabouVerification):
                 # lower bound constraints
                 lb_new_out_constraint = MarabouUtils.Equation(MarabouCore.Equation.LE)
                 lb_new_out_constraint.addAddend(1.0, self.inputVars[i][j])
-                lb_new_out_constraint.setScalar(1.0 * bounds.lb[i][j] - 1e-1)
+                lb_new_out_constraint.setScalar(1.0 * bounds.lb[i][j] - complete_margin)
                 out_constraints.append([lb_new_out_constraint])
 
                 # upper bound constraints
                 ub_new_out_constraint = MarabouUtils.Equation(MarabouCore.Equation.GE)
                 ub_new_out_constraint.addAddend(1.0, self.inputVars[i][j])
-                ub_new_out_constraint.setScalar(1.0 * bounds.ub[i][j] + 1e-1)
+                ub_new_out_constraint.setScalar(1.0 * bounds.ub[i][j] + complete_margin)
                 out_constraints.append([ub_new_out_constraint])
         
         
         self.model_description.addDisjunctionConstraint(out_constraints)
 
-        return super().__call__(bounds)
-
     ###########################
     # Check Marabou's Witness #
     ###########################
+    # a point of class c_star, outside the bounds
+    is_witness_inside = False
+    witness_margin = complete_margin
+
+    def is_counterexample(self, witness) -> bool:
+        return self.predict_argmax(witness)[0] == self.c_star
+
     def check_witness(self, witness, bounds):
         prediction, _ =  self.predict_argmax(witness)
 
@@ -313,4 +961,121 @@ class CompleteMarabouVerifier(MarabouVerification):
                 )
                 return True, None
             else:
-                exit(wrong_class_exit_code)
\ No newline at end of file
+                exit(wrong_class_exit_code)
+
+
+###################################
+# Split Complete Marabou Verifier #
+###################################
+class SplitCompleteMarabouVerifier(CompleteMarabouVerifier):
+    """
+        #### Description:
+        As `CompleteMarabouVerifier`, but instead of the disjunction over
+        the `2 * dim` faces of the bounds, i.e. "a point outside the
+        bounds", each query is split in one *face* query per half-space
+            `x_ij <= lb_ij - complete_margin`,  `x_ij >= ub_ij + complete_margin`
+        A face query only changes the bound of one input variable of the
+        same input query, hence nothing is rebuilt between the calls. The
+        faces are solved in parallel (see `solve_split()`), and the first
+        SAT face answers the query.
+
+        #### Notes:
+        * The faces outside the domain are skipped.
+        * UNSAT faces are remembered: `x_ij <= v` UNSAT implies that
+        `x_ij <= v'` is UNSAT for any `v' <= v` (and symmetrically for the
+        upper faces). Hence, when the bottom-up searches expand the bounds
+        the faces are known UNSAT, and only the faces that moved inwards,
+        e.g. a reverted expansion, are solved again.
+        * The faces are solved in increasing distance from the bounds'
+        center, i.e. the nearest half-spaces first, which are the most
+        likely to contain points of class c_star.
+    """
+    def __init__(self, c_star, model_path_onnx, domain, epsilon=1.0, num_split_workers=None):
+        super().__init__(c_star, model_path_onnx, domain, epsilon)
+
+        ## Parallel Mode
+        if num_split_workers is None: num_split_workers = os.cpu_count() or 1
+        assert num_split_workers > 0
+        self.num_split_workers = num_split_workers
+
+        ## The input query of the faces
+        # i.e. the network, the domain and the output constraints
+        self.face_query = self.model_description.getInputQuery()
+
+        ## UNSAT faces
+        # the largest v with `x_ij <= v` UNSAT,
+        # the smallest v with `x_ij >= v` UNSAT
+        self.unsat_lower_faces = -np.inf * np.ones((self.row_dim, self.column_dim))
+        self.unsat_upper_faces =  np.inf * np.ones((self.row_dim, self.column_dim))
+
+        ## Statistics
+        self.num_skipped_faces = 0
+
+    ## Faces
+    # Face_t := (i, j, is_lower, v), i.e. the half-space
+    #   x_ij <= v   (if is_lower)
+    #   x_ij >= v   (else)
+    def get_faces(self, bounds):
+        lower_values = bounds.lb - complete_margin
+        upper_values = bounds.ub + complete_margin
+
+        ## half-spaces inside the domain, not known to be UNSAT
+        is_lower_open = (lower_values >= self.domain.lb) & (lower_values > self.unsat_lower_faces)
+        is_upper_open = (upper_values <= self.domain.ub) & (upper_values < self.unsat_upper_faces)
+
+        faces = \
+            [(i, j, True,  lower_values[i][j]) for i, j in zip(*np.nonzero(is_lower_open))] + \
+            [(i, j, False, upper_values[i][j]) for i, j in zip(*np.nonzero(is_upper_open))]
+
+        ## skipped faces, i.e. known UNSAT
+        self.num_skipped_faces += \
+            int(np.sum((lower_values >= self.domain.lb) & ~is_lower_open)) + \
+            int(np.sum((upper_values <= self.domain.ub) & ~is_upper_open))
+
+        center = (bounds.lb + bounds.ub) / 2
+        return sorted(faces, key=lambda face: abs(face[3] - center[face[0]][face[1]]))
+
+    def part_unsat(self, face) -> None:
+        i, j, is_lower, value = face
+
+        if is_lower:    self.unsat_lower_faces[i][j] = max(self.unsat_lower_faces[i][j], value)
+        else:           self.unsat_upper_faces[i][j] = min(self.unsat_upper_faces[i][j], value)
+
+    ## Accessors
+    def get_extra_statistics(self):
+        extra_statistics = super().get_extra_statistics()
+        extra_statistics["Skipped Faces"]   = self.num_skipped_faces
+        extra_statistics["Face Queries"]    = self.num_split_parts
+
+        return extra_statistics
+
+    def reset_statistics(self):
+        super().reset_statistics()
+
+        self.num_skipped_faces  = 0
+        self.num_split_parts    = 0
+
+    ###############
+    # Call Method #
+    ###############
+    def set_input_constraints(self, bounds):
+        # the faces are set by solve_part()
+        self.split_bounds = bounds
+
+    def solve(self):
+        return self.solve_split(self.split_bounds, self.get_faces(self.split_bounds))
+
+    def solve_part(self, bounds, face):
+        i, j, is_lower, value = face
+        variable = int(self.inputVars[i][j])
+
+        if is_lower:    self.face_query.setUpperBound(variable, float(value))
+        else:           self.face_query.setLowerBound(variable, float(value))
+
+        exit_code, values, _ = MarabouCore.solve(self.face_query, self.timed(self.options), "")
+
+        # back to the domain
+        if is_lower:    self.face_query.setUpperBound(variable, float(self.domain.ub[i][j]))
+        else:           self.face_query.setLowerBound(variable, float(self.domain.lb[i][j]))
+
+        return exit_code, values, None
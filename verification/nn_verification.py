@@ -1,3 +1,26 @@
+## Libraries for Typing
+import typing
+
+## Python Libraries
+import time
+import statistics
+import collections
+
+## The sources of an oracle's answer, for tracing
+source_solver           = "solver"
+source_witness_cache    = "witness-cache"
+source_safe_cache       = "safe-cache"
+source_store            = "store"
+source_ibp              = "ibp"
+source_attack           = "attack"
+source_deadline         = "deadline"  # not solved, past the search's deadline
+
+## Adaptive Call Timeouts (see NNVerification.get_call_timeout())
+min_call_samples        = 20    # solver calls observed before adapting
+call_timeout_factor     = 10    # times the 95th percentile of the call times
+min_call_timeout        = 5     # (secs)
+
+
 ###################
 # NN Varification #
 ###################
@@ -12,9 +35,22 @@ class NNVerification:
         self.total_time     = 0
         self.num_calls      = 0
         self.num_timeouts   = 0
+
+        # The last call, for tracing (see verification.tracing)
+        # the verifiers answering without the solver, e.g. from
+        # a cache, set `last_source` accordingly
+        self.last_source        = source_solver
+        self.last_solver_time   = 0
+
+        # Deadline, i.e. the end of the search's time budget
+        # (see get_call_timeout()), None for no deadline
+        self.deadline           = None
+        self.call_times         = collections.deque(maxlen=100)
     
     ## Accessors
     def get_avg_time(self) -> float:
+        # e.g. all the queries were answered by the caches or the store
+        if self.num_calls == 0: return 0.0
         return self.total_time / self.num_calls
     
     def get_total_time(self) -> float:
@@ -26,13 +62,102 @@ class NNVerification:
     def get_timeouts(self) -> int:
         return self.num_timeouts
 
+    def get_extra_statistics(self) -> typing.Dict[str, typing.Union[int, float]]:
+        """
+            #### Description:
+            Statistics specific to a verifier, as `{label: value}`,
+            reported together with the common statistics above.
+        """
+        return {}
+
     ## Mutators
+    def reset_statistics(self):
+        """
+            #### Description:
+            Zeroes the statistics, e.g. when the same verifier
+            is re-used for a new input.
+        """
+        self.total_time     = 0
+        self.num_calls      = 0
+        self.num_timeouts   = 0
+
     def set_statistics(self, call_time:float):
         assert call_time >= 0
 
         self.num_calls  += 1
         self.total_time += call_time
 
+        self.last_solver_time = call_time
+        self.call_times.append(call_time)
+
+    def merge_statistics(self, num_calls: int, total_time: float, num_timeouts: int):
+        """
+            #### Description:
+            Adds the statistics of oracle calls performed *elsewhere*, e.g.
+            by copies of this verifier living in worker processes.
+        """
+        assert num_calls    >= 0
+        assert total_time   >= 0
+        assert num_timeouts >= 0
+
+        self.num_calls      += num_calls
+        self.total_time     += total_time
+        self.num_timeouts   += num_timeouts
+
+    ## Resources
+    def close(self) -> None:
+        """
+            #### Description:
+            Releases the resources kept between the oracle calls, e.g. worker
+            processes, at the end of a run. The verifier remains usable.
+        """
+        pass
+
+    ## Deadline
+    def set_deadline(self, deadline: typing.Union[float, None]) -> None:
+        # deadline: time.time() at the end of the search's budget
+        self.deadline = deadline
+
+    def get_call_timeout(self, max_timeout: float) -> float:
+        """
+            #### Description:
+            The timeout (secs) of the next solver call, i.e. the least of:
+            * `max_timeout`,
+            * the time left until the deadline (if any), and
+            * `call_timeout_factor` times the 95th percentile of the recent
+            call times (at least `min_call_timeout`), once `min_call_samples`
+            calls are observed. A call far slower than the rest is likely
+            stuck, and it is better reported as unknown.
+
+            #### Notes:
+            A non-positive timeout means that the deadline has passed.
+        """
+        call_timeout = max_timeout
+
+        if len(self.call_times) >= min_call_samples:
+            percentile_95 = statistics.quantiles(self.call_times, n=20)[-1]
+            call_timeout  = min(call_timeout, max(min_call_timeout, call_timeout_factor * percentile_95))
+
+        if self.deadline is not None:
+            call_timeout = min(call_timeout, self.deadline - time.time())
+
+        return call_timeout
+
     ## Operations
     def __call__(self, bounds):
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def check_batch(self, intervals: typing.List) -> typing.List[typing.Tuple]:
+        """
+            #### Description:
+            Checks a list of *independent* candidate intervals. Returns a list
+            of `(verdict, witness)` pairs, one for each interval, in the same
+            order, i.e. the `i`-th pair is what `self(intervals[i])` returns.
+
+            #### Notes:
+            The default implementation calls the oracle one interval at a
+            time. Verifiers that can resolve several candidates together
+            should override this method.
+        """
+
+        return [self(bounds) for bounds in intervals]
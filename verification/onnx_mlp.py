@@ -0,0 +1,155 @@
+###########################################################
+# verification.onnx_mlp
+# --------------------------------------------------------
+# Loading the weights of a fully connected ReLU network
+# (MLP) from its .onnx description, as NumPy arrays.
+###########################################################
+
+#############
+# Libraries #
+#############
+# python libraries
+import typing
+
+# 3rd party libraries
+import numpy as np
+import onnx
+from onnx import numpy_helper
+
+
+#############
+# Constants #
+#############
+## supported ONNX operators
+# (besides MatMul, Gemm, Add and Relu)
+# operators that do not change the values of a flat input vector
+passthrough_ops = ["Reshape", "Flatten", "Identity"]
+
+# Layer_t := (W, b, relu), where the layer computes
+#   x @ W + b           (if not relu)
+#   max(x @ W + b, 0)   (if relu)
+Layer_t = typing.Tuple[np.ndarray, np.ndarray, bool]
+
+
+####################
+# Helper Functions #
+####################
+def gemm_weights(node, initializers):
+    W = initializers[node.input[1]]
+    attributes = {attribute.name: onnx.helper.get_attribute_value(attribute) for attribute in node.attribute}
+
+    assert attributes.get("transA", 0) == 0, "Gemm with transposed input is not supported"
+    if attributes.get("transB", 0) == 1: W = W.T
+
+    W = attributes.get("alpha", 1.0) * W
+    b = np.zeros(W.shape[1])
+    if len(node.input) > 2: b = attributes.get("beta", 1.0) * initializers[node.input[2]]
+
+    return W, b
+
+
+##########
+# Loader #
+##########
+def load_layers(model_path_onnx: str) -> typing.List[Layer_t]:
+    """
+        #### Description:
+        Reads the .onnx description of an MLP, i.e. a chain of
+        `MatMul`/`Gemm`, `Add` and `Relu` operators, and returns its
+        layers as a list of `(W, b, relu)` triplets.
+
+        #### Notes:
+        * The input is flattened in row-major order, as the `Reshape`
+        operator of the networks in `nn_weights/`.
+        * Operators other than the supported ones raise an assertion.
+    """
+    model           = onnx.load(model_path_onnx)
+    initializers    = {
+                        tensor.name: numpy_helper.to_array(tensor).astype(np.float64)
+                        for tensor in model.graph.initializer
+                    }
+
+    layers = []
+    for node in model.graph.node:
+        if node.op_type in passthrough_ops: continue
+
+        elif node.op_type == "MatMul":
+            W = initializers[node.input[1]]
+            layers.append([W, np.zeros(W.shape[1]), False])
+
+        elif node.op_type == "Gemm":
+            W, b = gemm_weights(node, initializers)
+            layers.append([W, b, False])
+
+        elif node.op_type == "Add":
+            assert len(layers) > 0 and not layers[-1][2], "Add operator without a preceding layer"
+            bias = node.input[1] if node.input[1] in initializers else node.input[0]
+            layers[-1][1] = layers[-1][1] + initializers[bias]
+
+        elif node.op_type == "Relu":
+            assert len(layers) > 0 and not layers[-1][2], "Relu operator without a preceding layer"
+            layers[-1][2] = True
+
+        else:
+            raise AssertionError("Unsupported ONNX operator: " + node.op_type)
+
+    return [(W, b, relu) for W, b, relu in layers]
+
+
+
+####################
+# Inference Engine #
+####################
+class NumpyNeuralNetwork:
+    """
+        #### Description:
+        A lightweight, in-process, inference engine for the MLPs in
+        `nn_weights/`. The weights are loaded once from the .onnx
+        description, and the forward pass is plain NumPy. Hence, the
+        predictions are deterministic and cheap, and they do not need
+        neither TensorFlow nor Marabou.
+
+        #### Notes:
+        The methods mirror the ones of `neural_network.MNISTNeuralNetwork`,
+        i.e. `predict()`, `predict_argmax()` for single points, and
+        `predict_batch()`, `predict_argmax_batch()` for `(N, row_dim, column_dim)`
+        arrays of points.
+    """
+
+    def __init__(self, model_path_onnx: str):
+        self.model_path_onnx    = model_path_onnx
+        self.layers             = load_layers(model_path_onnx)
+
+        ## Dimensions
+        self.input_dim  = self.layers[0][0].shape[0]
+        self.num_classes= self.layers[-1][0].shape[1]
+
+    ## Forward Pass
+    def forward(self, X: np.ndarray) -> np.ndarray:
+        # flatten each point, in row-major order
+        X = X.reshape([-1, self.input_dim])
+        for W, b, relu in self.layers:
+            X = X @ W + b
+            if relu: X = np.maximum(X, 0)
+        
+        return X
+
+    ## Predictions
+    def predict(self, X):
+        return self.forward(X)
+    
+    def predict_argmax(self, X):
+        predictions_vector  = self.predict(X)[0]
+        prediction_class    = np.argmax(predictions_vector)
+        prediction_value    = predictions_vector[prediction_class]
+        return prediction_class, prediction_value
+
+    ## Batches
+    def predict_batch(self, X):
+        return self.forward(X)
+    
+    def predict_argmax_batch(self, X):
+        predictions_vectors = self.predict_batch(X)
+        prediction_classes  = np.argmax(predictions_vectors, axis=1)
+        prediction_values   = predictions_vectors[np.arange(len(prediction_classes)), prediction_classes]
+        return prediction_classes, prediction_values
@@ -0,0 +1,114 @@
+###########################################################
+# verification.pool
+# --------------------------------------------------------
+# A process pool of verification oracles. Each worker
+# process holds its own copy of the verifier, so that
+# independent oracle calls can run on different cores.
+###########################################################
+
+#############
+# Libraries #
+#############
+# python libraries
+import typing
+import concurrent.futures
+
+# custom libraries
+import sys
+sys.path.append('..')
+import verification.nn_verification as nn_verif
+
+
+##########
+# Worker #
+##########
+# the verifier of the *current* worker process
+_worker_verifier = None
+
+def _init_worker(verifier: nn_verif.NNVerification, deadline: typing.Union[float, None]):
+    global _worker_verifier
+    _worker_verifier = verifier
+
+    # not part of a pickled verifier
+    _worker_verifier.set_deadline(deadline)
+
+
+def _run_task(task: typing.Callable, args: typing.Tuple):
+    """
+        #### Description:
+        Runs `task(verifier, *args)` with the verifier of the worker.
+        Returns the result of the task, together with the statistics
+        of the oracle calls made by the task.
+    """
+    verifier = _worker_verifier
+
+    num_calls       = verifier.num_calls
+    total_time      = verifier.total_time
+    num_timeouts    = verifier.num_timeouts
+
+    result = task(verifier, *args)
+
+    return result, (
+        verifier.num_calls      - num_calls,
+        verifier.total_time     - total_time,
+        verifier.num_timeouts   - num_timeouts
+    )
+
+
+def _check(verifier: nn_verif.NNVerification, bounds):
+    return verifier(bounds)
+
+
+
+########
+# Pool #
+########
+class VerifierPool:
+    """
+        #### Description:
+        A pool of `num_workers` processes, each one holding a copy of
+        `verifier`. Tasks are module-level functions of the form
+        `task(verifier, *args)`.
+
+        #### Notes:
+        * The statistics of the oracle calls performed by the workers
+        are merged back to `verifier`.
+        * The verifier needs to be picklable, see e.g.
+        `verification.marabou.MarabouVerification.__reduce__()`.
+    """
+
+    def __init__(self, verifier: nn_verif.NNVerification, num_workers: int):
+        assert num_workers > 0
+
+        self.verifier       = verifier
+        self.num_workers    = num_workers
+        self.executor       = concurrent.futures.ProcessPoolExecutor(
+                                max_workers = num_workers,
+                                initializer = _init_worker,
+                                initargs    = (verifier, verifier.deadline)
+                            )
+
+    ## Context Manager
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    ## Operations
+    def map(self, task: typing.Callable, args_list: typing.List[typing.Tuple]) -> typing.List:
+        futures = [self.executor.submit(_run_task, task, args) for args in args_list]
+
+        results = []
+        for future in futures:
+            result, statistics = future.result()
+            self.verifier.merge_statistics(*statistics)
+            results.append(result)
+
+        return results
+
+    def check_batch(self, intervals: typing.List) -> typing.List[typing.Tuple]:
+        return self.map(_check, [(bounds,) for bounds in intervals])
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,174 @@
+###########################################################
+# verification.result_store
+# --------------------------------------------------------
+# A persistent, on-disk, store of the oracle results, so
+# that re-runs (and restarted experiments) skip the queries
+# that are already solved.
+###########################################################
+
+#############
+# Libraries #
+#############
+# python libraries
+import hashlib
+import sqlite3
+import typing
+
+# 3rd party libraries
+import numpy as np
+
+# custom libraries
+import sys
+sys.path.append('..')
+import verification.caches as caches
+
+
+#############
+# Constants #
+#############
+# decimals kept when quantizing the bounds for the key
+decimals = 6
+
+# seconds to wait for a lock, e.g. when several experiments
+# share the same store
+lock_timeout = 60
+
+
+####################
+# Helper Functions #
+####################
+def file_hash(path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(block)
+
+    return sha256.hexdigest()
+
+
+def to_blob(array: np.ndarray) -> bytes:
+    return np.ascontiguousarray(array, dtype=np.float64).tobytes()
+
+
+
+################
+# Result Store #
+################
+class ResultStore:
+    """
+        #### Description:
+        An SQLite table of oracle results, for a *single* verifier, i.e.
+        the same network, verifier kind, `c_star` and `epsilon`. The key
+        of a query is the hash of all the above, together with the bounds
+        rounded to `decimals` decimals.
+
+        #### Notes:
+        * Since two different bounds may have the same rounded values, a
+        hit is confirmed against the *exact* stored result:
+            * UNSAT: the stored box proves the query by monotonicity
+            (see `verification.caches.SafeBoxCache`).
+            * SAT: the stored witness is still a witness for the query
+            (see `verification.caches.WitnessCache`).
+        * Timeouts must *not* be added, they are not proofs.
+    """
+
+    def __init__(
+            self,
+            path:               str,
+            model_path_onnx:    str,
+            verifier_kind:      str,
+            c_star:             int,
+            epsilon:            float,
+            inside:             bool,
+            row_dim:            int,
+            column_dim:         int,
+            margin:             float = 0.0
+        ):
+        self.path       = path
+        self.inside     = inside
+        self.margin     = margin    # see caches.are_witnesses()
+        self.shape      = (row_dim, column_dim)
+
+        ## key prefix
+        self.prefix     = "/".join([
+                            file_hash(model_path_onnx),
+                            verifier_kind,
+                            str(c_star),
+                            repr(float(epsilon))
+                        ])
+
+        ## statistics
+        self.num_hits   = 0
+
+        ## the table
+        # autocommit, i.e. every result is written immediately
+        self.connection = sqlite3.connect(path, timeout=lock_timeout, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "   key     TEXT PRIMARY KEY,"
+            "   verdict INTEGER NOT NULL,"
+            "   lb      BLOB NOT NULL,"
+            "   ub      BLOB NOT NULL,"
+            "   witness BLOB"
+            ")"
+        )
+
+    def key(self, bounds) -> str:
+        sha256 = hashlib.sha256(self.prefix.encode())
+        sha256.update(to_blob(np.round(bounds.lb, decimals)))
+        sha256.update(to_blob(np.round(bounds.ub, decimals)))
+
+        return sha256.hexdigest()
+
+    def from_blob(self, blob: bytes) -> np.ndarray:
+        return np.frombuffer(blob, dtype=np.float64).reshape(self.shape).copy()
+
+    ## Operations
+    def find(self, bounds) -> typing.Union[typing.Tuple[bool, typing.Union[np.ndarray, None]], None]:
+        """
+            #### Description:
+            Returns the stored `(verdict, witness)` for `bounds`, or `None`.
+        """
+        row = self.connection.execute(
+                "SELECT verdict, lb, ub, witness FROM results WHERE key = ?",
+                (self.key(bounds),)
+            ).fetchone()
+        if row is None: return None
+
+        verdict, lb, ub, witness = row
+
+        ## UNSAT, confirm by monotonicity
+        if verdict:
+            lb = self.from_blob(lb)
+            ub = self.from_blob(ub)
+            if self.inside: hit = (lb <= bounds.lb).all() and (bounds.ub <= ub).all()
+            else:           hit = (bounds.lb <= lb).all() and (ub <= bounds.ub).all()
+
+            if not hit: return None
+
+            self.num_hits += 1
+            return True, None
+
+        ## SAT, confirm the witness
+        witness = self.from_blob(witness)
+        hit     = caches.are_witnesses(witness[np.newaxis], bounds.lb, bounds.ub, self.inside, self.margin)[0]
+        if not hit: return None
+
+        self.num_hits += 1
+        return False, witness
+
+    def add(self, bounds, verdict: bool, witness: typing.Union[np.ndarray, None]) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+            (
+                self.key(bounds),
+                int(verdict),
+                to_blob(bounds.lb),
+                to_blob(bounds.ub),
+                None if witness is None else to_blob(witness)
+            )
+        )
+
+    def close(self) -> None:
+        self.connection.close()
@@ -1,6 +1,9 @@
 #############
 # Libraries #
 #############
+# 3rd party libraries
+import numpy as np
+
 # custom libraries
 import sys
 sys.path.append('..')
@@ -8,6 +11,8 @@ import montecarlo.utilities as mc
 
 import verification.nn_verification as nn_verif
 
+from geometry.constants import epsilon
+
 
 
 class SamplingBasedVerification(nn_verif.NNVerification):
@@ -22,4 +27,27 @@ class SamplingBasedVerification(nn_verif.NNVerification):
             for point in point_set:
                 if point in bounds: return False, point
             
-        return True, None
\ No newline at end of file
+        return True, None
+
+    def check_batch(self, intervals):
+        ## Stack every point *not* belonging to c_star, once for all intervals
+        point_sets = [
+            self.model_description[c]   for c in self.model_description.keys()
+                                        if c != self.c_star
+        ]
+        if point_sets == [] or sum(len(point_set) for point_set in point_sets) == 0:
+            return [(True, None) for bounds in intervals]
+        
+        points = np.stack([point for point_set in point_sets for point in point_set])
+
+        ## Vectorized containment, the same as geometry.interval.Interval.__contains__
+        results = []
+        for bounds in intervals:
+            inside = (
+                (points - bounds.lb >= -epsilon) & (bounds.ub - points >= -epsilon)
+            ).all(axis=(1, 2))
+
+            if inside.any():    results.append((False, points[np.argmax(inside)]))
+            else:               results.append((True, None))
+        
+        return results
@@ -0,0 +1,97 @@
+###########################################################
+# verification.tracing
+# --------------------------------------------------------
+# Per-call tracing of the oracle. Every oracle call of a
+# search algorithm is recorded as a JSON-lines event, i.e.
+# one JSON object per line, with the fields:
+#
+#   t           start of the call, in seconds since the
+#               tracer was opened
+#   algo        the algorithm (its message prefix)
+#   phase       the phase of the algorithm, e.g. "ub", "lb"
+#   coord       the coordinate [i, j] under refinement, or
+#               null
+#   width       the max. edge length of the queried bounds
+#   verdict     the oracle's answer
+#   source      who answered, e.g. "solver", "safe-cache",
+#               "witness-cache", "store", "ibp"
+#   solver      seconds spent in the solver
+#   overhead    seconds spent in Python, around the solver
+#   pid         the process id
+#
+# See bin/trace-summary.py for the analysis of a trace.
+###########################################################
+
+#############
+# Libraries #
+#############
+# python libraries
+import json
+import os
+import time
+import typing
+
+# 3rd party libraries
+import numpy as np
+
+
+##########
+# Tracer #
+##########
+class Tracer:
+    """
+        #### Description:
+        Appends the oracle-call events to the JSON-lines file `path`.
+
+        #### Notes:
+        * Tracing is off unless a tracer is given to the algorithm, see
+        `algorithms.algorithms.SearchAlgorithm.set_tracer()`.
+        * The oracle calls performed by worker processes (parallel modes)
+        are not traced.
+    """
+
+    def __init__(self, path: str):
+        self.path       = path
+        self.file       = open(path, "a")
+        self.tic        = time.time()
+        self.num_events = 0
+
+    ## Context Manager
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    ## Operations
+    def event(
+            self,
+            algo:           str,
+            phase:          str,
+            coordinate:     typing.Union[typing.Tuple[int, int], None],
+            bounds,
+            verdict:        bool,
+            source:         str,
+            solver_time:    float,
+            tic:            float,
+            toc:            float
+        ) -> None:
+
+        record = {
+            "t":        round(tic - self.tic, 6),
+            "algo":     algo.strip(),
+            "phase":    phase,
+            "coord":    None if coordinate is None else [int(ind) for ind in coordinate],
+            "width":    float(np.max(bounds.ub - bounds.lb)),
+            "verdict":  bool(verdict),
+            "source":   source,
+            "solver":   round(solver_time, 6),
+            "overhead": round(max(0.0, toc - tic - solver_time), 6),
+            "pid":      os.getpid()
+        }
+
+        self.file.write(json.dumps(record) + "\n")
+        self.num_events += 1
+
+    def close(self) -> None:
+        if not self.file.closed: self.file.close()